@@ -0,0 +1,96 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-16 19:40:12 +0800
+LastEditTime : 2026-10-16 19:40:12 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/benchmarks/bench_import.py
+Description  : import egasp 耗时基准, 超出预算时以非零状态码退出
+ -----------------------------------------------------------------------
+'''
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+
+# import egasp 之后不应被加载的模块 (命令行、更新检查、多语言、批量计算)
+FORBIDDEN = ('rich', 'rich_argparse', 'numpy', 'toml', 'packaging', 'platformdirs', 'urllib.request', 'gettext',
+             'egasp.__main__', 'egasp.check_version', 'egasp.logger_config', 'egasp.language', 'egasp.egasp_batch')
+
+
+def _env() -> dict:
+    """子进程环境: 优先使用仓库中的源码"""
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)  # 允许写入字节码缓存, 与实际安装后的情况一致
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get('PYTHONPATH')]))
+    return env
+
+
+def wall_time(code: str, repeat: int) -> float:
+    """新进程执行 code 的墙钟时间中位数 (毫秒)"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True, env=_env())
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def loaded_forbidden() -> list:
+    """import egasp 后实际加载的重量级模块"""
+    code = f"import sys, egasp; print(','.join(m for m in {FORBIDDEN!r} if m in sys.modules))"
+    out = subprocess.run([sys.executable, '-c', code], check=True, env=_env(), capture_output=True, text=True).stdout.strip()
+    return [m for m in out.split(',') if m]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="import egasp 耗时基准")
+    parser.add_argument('--budget', type=float, default=50.0, help="import egasp 相对空解释器的额外耗时上限 (毫秒), 默认 50")
+    parser.add_argument('--repeat', type=int, default=15, help="重复次数, 取中位数, 默认 15")
+    args = parser.parse_args(argv)
+
+    # 先执行一次, 生成字节码缓存, 避免首次编译计入耗时
+    subprocess.run([sys.executable, '-c', 'import egasp'], check=True, env=_env())
+
+    baseline = wall_time('pass', args.repeat)
+    imported = wall_time('import egasp', args.repeat)
+    first_query = wall_time("import egasp; egasp.get_egasp(25, 'volume', 50)", args.repeat)
+    overhead = imported - baseline
+
+    print(f"空解释器启动          : {baseline:8.1f} ms")
+    print(f"import egasp          : {imported:8.1f} ms (额外 {overhead:.1f} ms, 预算 {args.budget:.1f} ms)")
+    print(f"import + 首次 get_egasp: {first_query:8.1f} ms")
+
+    failed = False
+    forbidden = loaded_forbidden()
+    if forbidden:
+        print(f"import egasp 加载了不应加载的模块: {', '.join(forbidden)}")
+        failed = True
+    if overhead > args.budget:
+        print(f"import egasp 超出预算 {overhead - args.budget:.1f} ms")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
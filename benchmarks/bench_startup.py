@@ -0,0 +1,95 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-16 22:08:37 +0800
+LastEditTime : 2026-10-16 22:08:37 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/benchmarks/bench_startup.py
+Description  : 机器调用入口 (egasp-fast / egasp --excel) 的单次调用耗时基准
+ -----------------------------------------------------------------------
+'''
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+from bench_import import _env
+
+QUERY = ['--type=volume', '--value=50', '--temp=25', '--prop=rho']
+
+# 机器调用入口不应加载的模块
+FORBIDDEN = ('rich', 'rich_argparse', 'numpy', 'toml', 'packaging', 'platformdirs', 'urllib.request', 'gettext', 'argparse',
+             'egasp.cli', 'egasp.check_version', 'egasp.logger_config', 'egasp.language')
+
+
+def wall_time(args: list, repeat: int) -> float:
+    """新进程执行命令的墙钟时间中位数 (毫秒)"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], check=True, env=_env(), stdout=subprocess.DEVNULL)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def loaded_forbidden(entry: str, entry_args: list) -> list:
+    """以 python -m entry 方式执行入口后实际加载的重量级模块"""
+    code = f"import sys; sys.argv = {[entry, *entry_args]!r}; import runpy; runpy.run_module({entry!r}, run_name='__main__', alter_sys=True)"
+    code = f"import sys, atexit; atexit.register(lambda: print(','.join(m for m in {FORBIDDEN!r} if m in sys.modules), file=sys.stderr)); {code}"
+    err = subprocess.run([sys.executable, '-c', code], env=_env(), capture_output=True, text=True).stderr.strip().splitlines()
+    return [m for m in (err[-1] if err else '').split(',') if m]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="机器调用入口的单次调用耗时基准")
+    parser.add_argument('--repeat', type=int, default=15, help="重复次数, 取中位数, 默认 15")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output = f'--output={os.path.join(tmp, "egasp_output.tmp")}'
+
+        # 先执行一次, 生成字节码缓存, 避免首次编译计入耗时
+        subprocess.run([sys.executable, '-m', 'egasp', '--excel', *QUERY, output], check=True, env=_env(), stdout=subprocess.DEVNULL)
+        subprocess.run([sys.executable, '-c', 'import egasp.cli'], check=True, env=_env())
+
+        baseline = wall_time(['-c', 'pass'], args.repeat)
+        fast = wall_time(['-m', 'egasp.fast', *QUERY], args.repeat)
+        excel = wall_time(['-m', 'egasp', '--excel', *QUERY, output], args.repeat)
+        # 改进前 --excel 在模块导入时即加载 rich、日志配置与更新检查, 以先导入 egasp.cli 模拟
+        legacy = wall_time(['-c', f"import egasp.cli; from egasp.excel import entry_main; entry_main({[*QUERY, output]!r})"], args.repeat)
+
+        forbidden = {entry: loaded_forbidden(entry, entry_args) for entry, entry_args in (('egasp.fast', QUERY), ('egasp', ['--excel', *QUERY, output]))}
+
+    print(f"空解释器启动                 : {baseline:8.1f} ms")
+    print(f"egasp-fast                   : {fast:8.1f} ms (额外 {fast - baseline:.1f} ms)")
+    print(f"egasp --excel                : {excel:8.1f} ms (额外 {excel - baseline:.1f} ms)")
+    print(f"--excel + 完整命令行依赖 (旧): {legacy:8.1f} ms (额外 {legacy - baseline:.1f} ms)")
+
+    failed = False
+    for entry, modules in forbidden.items():
+        if modules:
+            print(f"python -m {entry} 加载了不应加载的模块: {', '.join(modules)}")
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,117 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-16 23:31:05 +0800
+LastEditTime : 2026-10-16 23:31:05 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/benchmarks/load_test.py
+Description  : egasp serve 压力测试, 输出吞吐量与延迟 p50/p99
+ -----------------------------------------------------------------------
+'''
+import re
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import subprocess
+
+from bench_import import _env
+
+
+async def client(host: str, port: int, deadline: float, latencies: list, errors: list, seed: int) -> None:
+    """单个持久连接, 连续发送 POST /egasp 直到截止时间"""
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            body = json.dumps({'temp': rng.uniform(-30, 120), 'type': 'volume', 'value': rng.uniform(20, 80), 'props': ['rho', 'cp', 'k', 'mu']}).encode()
+            start = time.perf_counter()
+            writer.write(f"POST /egasp HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+            await writer.drain()
+
+            head = await reader.readuntil(b'\r\n\r\n')
+            length = int(re.search(rb'Content-Length: (\d+)', head).group(1))
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+            if not head.startswith((b'HTTP/1.1 200', b'HTTP/1.1 422')):
+                errors.append(head.split(b'\r\n', 1)[0].decode())
+    finally:
+        writer.close()
+
+
+async def run(host: str, port: int, concurrency: int, duration: float) -> dict:
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, start + duration, latencies, errors, i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+
+    def percentile(q):
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000
+
+    return {'requests': len(latencies), 'errors': len(errors), 'rps': len(latencies) / elapsed, 'p50_ms': percentile(0.50), 'p99_ms': percentile(0.99)}
+
+
+async def fetch_metrics(host: str, port: int) -> dict:
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"GET /metrics HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode())
+    data = await reader.read()
+    writer.close()
+    return json.loads(data.split(b'\r\n\r\n', 1)[1])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="egasp serve 压力测试")
+    parser.add_argument('--host', type=str, default='127.0.0.1', help="服务地址, 默认 127.0.0.1")
+    parser.add_argument('--port', type=int, default=None, help="已运行服务的端口; 不指定时在随机端口启动一个服务")
+    parser.add_argument('--concurrency', type=int, default=64, help="并发连接数, 默认 64")
+    parser.add_argument('--duration', type=float, default=5.0, help="持续时间 (秒), 默认 5")
+    parser.add_argument('--window', type=float, default=None, help="启动服务时的请求合并窗口 (秒), 默认使用服务默认值")
+    args = parser.parse_args(argv)
+
+    proc, port = None, args.port
+    if port is None:
+        cmd = [sys.executable, '-m', 'egasp', 'serve', '--host', args.host, '--port', '0']
+        if args.window is not None:
+            cmd += ['--window', str(args.window)]
+        proc = subprocess.Popen(cmd, env=_env(), stdout=subprocess.PIPE, text=True)
+        port = int(proc.stdout.readline().rsplit(':', 1)[1])
+
+    try:
+        result = asyncio.run(run(args.host, port, args.concurrency, args.duration))
+        metrics = asyncio.run(fetch_metrics(args.host, port))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+    coalescing = metrics['coalescing']
+    print(f"并发连接    : {args.concurrency}")
+    print(f"请求数      : {result['requests']} (错误 {result['errors']})")
+    print(f"吞吐量      : {result['rps']:,.0f} req/s")
+    print(f"延迟 p50    : {result['p50_ms']:.2f} ms")
+    print(f"延迟 p99    : {result['p99_ms']:.2f} ms")
+    print(f"平均合并批次: {coalescing['mean_batch']:.1f} (最大 {coalescing['max_batch']})")
+
+    return 1 if result['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
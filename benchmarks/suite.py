@@ -0,0 +1,202 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-16 23:58:12 +0800
+LastEditTime : 2026-10-16 23:58:12 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/benchmarks/suite.py
+Description  : 基准测试套件: 标量延迟、批量吞吐、峰值内存、导入与 Excel 调用耗时, 结果保存为 JSON 并可与基线比较
+ -----------------------------------------------------------------------
+'''
+import os
+import sys
+import json
+import argparse
+import platform
+import subprocess
+import tempfile
+from datetime import datetime
+
+from bench_import import SRC_DIR, _env, wall_time
+from bench_startup import QUERY, wall_time as command_time
+
+# 批量吞吐测试的数据点数, --quick 时只测到 1e5
+BATCH_SIZES = (10**3, 10**4, 10**5, 10**6, 10**7)
+QUICK_BATCH_SIZES = (10**3, 10**4, 10**5)
+
+# 标量接口在微秒量级, 子进程中用 timeit 取多轮最小值; 取值点均位于数据完整的区域 (0~120°C, 20~55%)
+SCALAR_CODE = '''
+import json, timeit
+from egasp.egasp_core import EG_ASP_Core
+eg = EG_ASP_Core()
+temps = [0 + 120 * i / 97 for i in range(97)]
+concs = [20 + 35 * i / 89 for i in range(89)]
+cases = {
+    'get_props': lambda: [eg.get_props(t, c, 'rho') for t, c in zip(temps, concs)],
+    'get_fb_props': lambda: [eg.get_fb_props(c, 'volume') for c in concs],
+    'get_egasp': lambda: [eg.get_egasp(t, 'volume', c) for t, c in zip(temps, concs)],
+}
+calls = {'get_props': 89, 'get_fb_props': 89, 'get_egasp': 89}
+print(json.dumps({name: min(timeit.repeat(fn, number=NUMBER, repeat=5)) / NUMBER / calls[name] * 1e6 for name, fn in cases.items()}))
+'''
+
+# 批量吞吐在独立子进程中运行, 以便统计该规模的峰值内存
+BATCH_CODE = '''
+import json, sys, time
+import numpy as np
+from egasp.egasp_core import EG_ASP_Core
+n = int(sys.argv[1])
+eg = EG_ASP_Core()
+rng = np.random.default_rng(0)
+temp, value = rng.uniform(-35, 125, n), rng.uniform(10, 90, n)
+eg.get_egasp_many(temp[:1000], 'volume', value[:1000], with_status=True)
+repeat = max(1, min(20, 10**6 // n))
+start = time.perf_counter()
+for _ in range(repeat):
+    eg.get_egasp_many(temp, 'volume', value, with_status=True)
+elapsed = (time.perf_counter() - start) / repeat
+try:
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+except ImportError:  # Windows 没有 resource 模块
+    peak = None
+print(json.dumps({'points_per_sec': n / elapsed, 'peak_mb': peak}))
+'''
+
+
+def _python(code: str, *args: str) -> dict:
+    out = subprocess.run([sys.executable, '-c', code, *args], check=True, env=_env(), capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def metric(value, unit: str, better: str = 'lower') -> dict:
+    return {'value': value, 'unit': unit, 'better': better}
+
+
+def run_suite(quick: bool = False, repeat: int = 15) -> dict:
+    """运行全部基准, 返回 {'meta': ..., 'results': {名称: {'value', 'unit', 'better'}}}"""
+    results = {}
+
+    print("标量接口延迟 ...", file=sys.stderr)
+    scalar = _python(SCALAR_CODE.replace('NUMBER', '20' if quick else '100'))
+    for name, us in scalar.items():
+        results[f'scalar.{name}'] = metric(us, 'us')
+
+    for n in (QUICK_BATCH_SIZES if quick else BATCH_SIZES):
+        size = f'1e{len(str(n)) - 1}'
+        print(f"批量吞吐 n={size} ...", file=sys.stderr)
+        batch = _python(BATCH_CODE, str(n))
+        results[f'batch.{size}.throughput'] = metric(batch['points_per_sec'], 'points/s', 'higher')
+        if batch['peak_mb'] is not None:
+            results[f'batch.{size}.peak_memory'] = metric(batch['peak_mb'], 'MB')
+
+    print("导入与 Excel 调用耗时 ...", file=sys.stderr)
+    # 先执行一次, 生成字节码缓存
+    subprocess.run([sys.executable, '-c', 'import egasp'], check=True, env=_env())
+    baseline = wall_time('pass', repeat)
+    results['startup.interpreter'] = metric(baseline, 'ms')
+    results['startup.import_egasp'] = metric(wall_time('import egasp', repeat) - baseline, 'ms')
+    with tempfile.TemporaryDirectory() as tmp:
+        args = ['-m', 'egasp', '--excel', *QUERY, f'--output={os.path.join(tmp, "egasp_output.tmp")}']
+        subprocess.run([sys.executable, *args], check=True, env=_env(), stdout=subprocess.DEVNULL)
+        results['startup.excel_call'] = metric(command_time(args, repeat), 'ms')
+
+    sys.path.insert(0, str(SRC_DIR))
+    from egasp.version import __version__
+
+    meta = {
+        'egasp': __version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'quick': quick,
+    }
+    return {'meta': meta, 'results': results}
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list:
+    """
+    逐项比较两次结果, 返回 [(名称, 基线值, 当前值, 变化比例, 是否退化)]。
+
+    变化比例以"变好为正"计: better=lower 的指标为 基线 / 当前 - 1, better=higher 的指标为 当前 / 基线 - 1。
+    变差超过 threshold 视为退化。只比较两次结果中都存在的指标。
+    """
+    rows = []
+    for name, cur in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None or not base['value'] or not cur['value']:
+            continue
+        if cur['better'] == 'higher':
+            change = cur['value'] / base['value'] - 1
+        else:
+            change = base['value'] / cur['value'] - 1
+        rows.append((name, base['value'], cur['value'], cur['unit'], change, change < -threshold))
+    return rows
+
+
+def print_results(data: dict) -> None:
+    for name, m in data['results'].items():
+        print(f"{name:32s} {m['value']:14,.2f} {m['unit']}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="egasp 基准测试套件")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run = sub.add_parser('run', help="运行基准并保存 JSON 结果")
+    run.add_argument('-o', '--output', type=str, default=None, help="结果文件路径, 默认只打印")
+    run.add_argument('--quick', action='store_true', help="快速模式: 批量只测到 1e5, 标量循环次数减少")
+    run.add_argument('--repeat', type=int, default=15, help="启动耗时的重复次数, 取中位数, 默认 15")
+
+    cmp = sub.add_parser('compare', help="与基线比较, 存在退化时以非零状态码退出")
+    cmp.add_argument('baseline', type=str, help="基线结果文件")
+    cmp.add_argument('current', type=str, help="当前结果文件")
+    cmp.add_argument('--threshold', type=float, default=0.15, help="允许的变差比例, 默认 0.15 (15%%)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        data = run_suite(args.quick, args.repeat)
+        print_results(data)
+        if args.output:
+            os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            print(f"结果已保存: {args.output}")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    with open(args.current, encoding='utf-8') as f:
+        current = json.load(f)
+
+    rows = compare(baseline, current, args.threshold)
+    for name, base, cur, unit, change, regressed in rows:
+        flag = '退化' if regressed else ''
+        print(f"{name:32s} {base:14,.2f} -> {cur:14,.2f} {unit:9s} {change:+7.1%} {flag}")
+
+    regressions = [row[0] for row in rows if row[5]]
+    if regressions:
+        print(f"{len(regressions)} 项指标变差超过 {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print(f"共比较 {len(rows)} 项指标, 无退化")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
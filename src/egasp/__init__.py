@@ -1,19 +1,27 @@
 '''
 一款用于获取乙二醇水溶液物性参数的工具
-可用函数 get_egasp()
+可用函数 get_egasp(), get_egasp_many(), get_egasp_props(), get_egasp_props_many()
 '''
 
-import sys
 from .egasp_core import EG_ASP_Core
+from .errors import Status, EgaspError, InvalidParameterError, InvalidInputError, OutOfRangeError, TempOutOfRangeError, ConcOutOfRangeError, DataGapError, FBDataGapError, NoSolutionError
 
 # 实例化核心类
 eg = EG_ASP_Core()
 
 # 将 get_egasp 方法暴露为模块级别的函数
 get_egasp = eg.get_egasp  # 修改点：直接暴露 get_egasp 函数
+get_egasp_many = eg.get_egasp_many  # 批量 (向量化) 查询
+get_egasp_props = eg.get_egasp_props  # 按名称选择输出, 含派生参数
+get_egasp_props_many = eg.get_egasp_props_many
 
-if sys.version_info[0] == 3:
-    from .__main__ import main  # 显式导出 main() 供 CLI 入口使用
-else:
-    # Don't import anything.
-    pass
\ No newline at end of file
+
+
+def main():
+    """命令行入口 (console script egasp = "egasp:main")。
+
+    命令行依赖 rich、更新检查与多语言模块, 仅在调用时导入, import egasp 只加载核心计算与数据。
+    """
+    from .__main__ import main as cli
+
+    return cli()
\ No newline at end of file
@@ -0,0 +1,70 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-17 10:48:03 +0800
+LastEditTime : 2026-10-17 10:48:03 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/src/egasp/_io.py
+Description  : 机器调用模式 (--excel-worker / --stdio) 共用的标准输入输出处理
+ -----------------------------------------------------------------------
+'''
+import sys
+import queue
+import logging
+import threading
+from contextlib import contextmanager
+from typing import TextIO
+
+
+def _read_lines(stream: TextIO, lines: queue.Queue) -> None:
+    """后台读取请求行, 输入结束或读取出错时放入 None, 请求循环不会一直等待"""
+    try:
+        for line in stream:
+            lines.put(line)
+    except (OSError, ValueError):  # UnicodeDecodeError 为 ValueError 的子类
+        logging.getLogger(__name__).error("读取标准输入失败, 停止接收请求", exc_info=True)
+    finally:
+        lines.put(None)
+
+
+def start_reader(stream: TextIO) -> queue.Queue:
+    """
+    在后台守护线程中逐行读取 stream, 返回按到达顺序存放请求行的队列, 输入结束时放入 None。
+
+    读取不阻塞请求循环, 以便在 Windows 管道上同样能够按空闲时间超时或凑批。
+    无法解码的字节替换为 U+FFFD, 所在行按格式错误的请求应答, 不中断整个流。
+    """
+    if hasattr(stream, 'reconfigure'):
+        stream.reconfigure(errors='replace')
+    lines = queue.Queue()
+    threading.Thread(target=_read_lines, args=(stream, lines), daemon=True).start()
+    return lines
+
+
+@contextmanager
+def reply_stdout():
+    """
+    标准输出仅用于应答: 期间 sys.stdout 改写到标准错误, egasp 的逐点警告日志不再输出
+    (以免堵塞无人读取的管道), 返回原标准输出供写入应答, 退出时恢复。
+    """
+    out = sys.stdout
+    sys.stdout = sys.stderr
+    logging.getLogger('egasp').setLevel(logging.ERROR)
+    try:
+        yield out
+    finally:
+        sys.stdout = out
@@ -0,0 +1,104 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-16 13:02:18 +0800
+LastEditTime : 2026-10-16 13:02:18 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/src/egasp/cache.py
+Description  : 查询结果的进程内 LRU 缓存
+ -----------------------------------------------------------------------
+'''
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class QueryCache:
+    """
+    带键量化的线程安全 LRU 缓存。
+
+    温度、浓度在作为键之前按指定的小数位数取整, 计算也在取整后的值上进行,
+    因此相同键始终对应相同结果, 与调用顺序无关。超过 maxsize 时淘汰最久未使用的条目。
+    """
+
+    def __init__(self, maxsize: int = 4096, temp_decimals: Optional[int] = 1, value_decimals: Optional[int] = 1):
+        """
+        参数:
+        maxsize (int): 最大缓存条目数。
+        temp_decimals (int | None): 温度键保留的小数位数, None 表示不量化。
+        value_decimals (int | None): 浓度键保留的小数位数, None 表示不量化。
+        """
+        if maxsize <= 0:
+            raise ValueError(f"缓存容量必须为正整数 maxsize={maxsize}")
+
+        self.maxsize = maxsize
+        self.temp_decimals = temp_decimals
+        self.value_decimals = value_decimals
+
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def quantize_temp(self, temp: float) -> float:
+        """按温度量化精度取整"""
+        return temp if self.temp_decimals is None else round(temp, self.temp_decimals)
+
+    def quantize_value(self, value: float) -> float:
+        """按浓度量化精度取整"""
+        return value if self.value_decimals is None else round(value, self.value_decimals)
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """查询缓存, 返回 (是否命中, 缓存值)"""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return False, None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """写入缓存, 超出容量时淘汰最久未使用的条目"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """清空缓存条目 (保留统计数据)"""
+        with self._lock:
+            self._data.clear()
+
+    def info(self) -> dict:
+        """缓存统计信息"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'hit_rate': self.hits / total if total else 0.0,
+            }
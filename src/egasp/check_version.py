@@ -1,12 +1,13 @@
+import os
 import json
 import time
 import toml
 import logging
+import threading
 import urllib.request
 from rich import print
 from pathlib import Path
 from packaging import version
-from datetime import timedelta
 from platformdirs import user_cache_dir
 
 from egasp.language import set_language
@@ -18,21 +19,22 @@ API_URL = f"https://api.github.com/repos/YanMing-lxb/{script_name}/releases/late
 
 class UpdateChecker():
 
-    def __init__(self, time_out, cache_time):
+    def __init__(self, time_out, cache_time, api_url=API_URL, cache_dir=None):
         """
         初始化 CheckVersion 类的实例。
 
         参数:
         time_out (int): 超时时间，单位为秒。
         cache_time (int): 缓存时间，单位为小时。
+        api_url (str): 查询最新版本的接口地址, 默认为 GitHub releases/latest, 可替换为本地测试服务器。
+        cache_dir (str): 缓存目录, 默认为 user_cache_dir。
 
         行为逻辑:
         1. 创建日志对象。
         2. 初始化版本列表。
         3. 将缓存时间转换为秒并存储。
         4. 存储超时时间。
-        5. 获取 egasp 安装路径并拼接 data 子路径，创建 data 目录（如果已存在则不报错）。
-        6. 创建缓存文件路径。
+        5. 获取用户缓存目录（不存在时创建），创建缓存文件与锁文件路径。
         """
         self.logger = logging.getLogger(__name__)  # 创建日志对象
 
@@ -40,83 +42,121 @@ class UpdateChecker():
 
         self.cache_time = cache_time * 3600  # 将缓存时间转换为秒并存储
         self.time_out = time_out  # 存储超时时间
+        self.api_url = api_url
 
-        cache_path = Path(user_cache_dir(script_name, ensure_exists=True))
+        cache_path = Path(cache_dir or user_cache_dir(script_name, ensure_exists=True))
+        cache_path.mkdir(parents=True, exist_ok=True)
         self.cache_file = cache_path / f"{script_name}_version_cache.toml"
+        self.lock_file = cache_path / f"{script_name}_version_cache.lock"
+
+        self._thread = None  # 后台更新线程, 由 start() 创建
+        self.requested = False  # 本进程是否实际发出了网络请求
 
     # --------------------------------------------------------------------------------
     # 定义 缓存文件读取函数
     # --------------------------------------------------------------------------------
-    def _load_cached_version(self):
+    def _read_cache(self):
         """
-        从缓存文件中加载最新版本号.
-
-        行为逻辑说明:
-        - 尝试读取缓存文件路径.
-        - 检查缓存文件是否存在且未过期(根据缓存时间判断).
-        - 如果缓存文件有效,读取文件内容并返回最新版本号.
-        - 如果发生任何异常,记录错误信息并返回 None.
+        读取缓存文件.
 
         返回说明:
-        - 返回缓存文件中的最新版本号,如果加载失败或缓存文件无效,则返回 None.
+        - 返回 (缓存内容, 是否仍在有效期内). 缓存文件不存在或读取失败时返回 ({}, False).
+        - 缓存内容包含 latest_version (最新版本号, 上次请求失败且无旧值时缺失) 与 etag (用于条件请求).
         """
         try:
             cache_path = Path(self.cache_file)  # 获取缓存文件路径
             if not cache_path.exists():
-                return None  # 如果缓存文件不存在,返回 None
+                return {}, False  # 如果缓存文件不存在,返回空缓存
 
-            # 使用timedelta来转换秒数
             cache_time_remaining = round(self.cache_time - (time.time() - cache_path.stat().st_mtime), 4)  # 计算缓存剩余时间
-            delta = timedelta(seconds=cache_time_remaining)
-            # 计算小时、分钟和秒
-            total_seconds = delta.total_seconds()  # 将timedelta转换为总秒数
-            hours, remainder = divmod(int(total_seconds), 3600)  # 计算小时数
-            minutes, seconds = divmod(remainder, 60)  # 计算分钟数和秒数
-
-            if cache_path.exists() and (cache_time_remaining > 0):  # 检查缓存文件是否存在且未过期
-                with cache_path.open('r') as f:  # 打开缓存文件
-                    data = toml.load(f)  # 加载缓存文件内容
-                    self.logger.info(_(f"读取版本缓存文件中的版本号，缓存有效期: ") + f'{int(hours):02} h {int(minutes):02} min {int(seconds):02} s')  # 记录日志信息
-                    self.logger.info(_("版本缓存文件路径: ") + str(self.cache_file))  # 记录日志信息
-                    return data.get("latest_version")  # 返回最新版本号
+            with cache_path.open('r') as f:  # 打开缓存文件
+                data = toml.load(f)  # 加载缓存文件内容
+            self.logger.info(_("版本缓存文件路径: ") + str(self.cache_file) + _("，剩余有效期: ") + f"{max(cache_time_remaining, 0):.0f} s")  # 记录日志信息
+            return data, cache_time_remaining > 0
         except Exception as e:
             self.logger.error(_("加载缓存版本时出错: ") + str(e))  # 记录错误信息
-        return None  # 如果加载失败或缓存文件无效,返回 None
+        return {}, False
 
     # --------------------------------------------------------------------------------
     # 定义 缓存文件写入函数
     # --------------------------------------------------------------------------------
-    def _update_version_cache(self, latest_version):
+    def _update_version_cache(self, latest_version, etag=None):
         """
         更新版本缓存文件.
 
         参数:
-        latest_version (str): 最新的版本号.
+        latest_version (str): 最新的版本号, 从未获取成功时为 None (不写入该项).
+        etag (str): 响应的 ETag, 下次以 If-None-Match 发送条件请求.
 
         行为逻辑:
-        尝试打开缓存文件并以写模式写入最新的版本号.如果操作失败,记录错误日志.
+        先写入临时文件再重命名, 其他进程只会读到完整的缓存文件.如果操作失败,记录错误日志.
         """
+        data = {key: value for key, value in (("latest_version", latest_version), ("etag", etag)) if value}
+        tmp_file = Path(f"{self.cache_file}.{os.getpid()}.tmp")
         try:
-            # 尝试以写模式打开缓存文件
-            with open(self.cache_file, 'w') as f:
-                # 使用toml库将最新的版本号写入文件
-                toml.dump({"latest_version": latest_version}, f)
+            # 使用toml库将最新的版本号写入文件
+            with open(tmp_file, 'w') as f:
+                toml.dump(data, f)
+            os.replace(tmp_file, self.cache_file)
         except Exception as e:
             # 如果更新缓存时出错,记录错误日志
             self.logger.error(_("更新版本缓存时出错: ") + str(e))
+            tmp_file.unlink(missing_ok=True)
+
+    # --------------------------------------------------------------------------------
+    # 定义 缓存文件锁
+    # --------------------------------------------------------------------------------
+    def _acquire_lock(self):
+        """
+        以独占方式创建锁文件, 成功返回 True; 其他进程正在更新时返回 False, 不等待.
+
+        锁文件超过 time_out + 30 秒未释放时视为持有进程已异常退出, 删除后重试一次.
+        """
+        for _attempt in range(2):
+            try:
+                fd = os.open(self.lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+                return True
+            except FileExistsError:
+                try:
+                    if time.time() - os.stat(self.lock_file).st_mtime < self.time_out + 30:
+                        return False
+                    os.remove(self.lock_file)
+                except FileNotFoundError:
+                    pass  # 持有者刚刚释放, 重试
+            except OSError as e:
+                self.logger.error(_("创建版本缓存锁时出错: ") + str(e))
+                return False
+        return False
+
+    def _release_lock(self):
+        try:
+            os.remove(self.lock_file)
+        except OSError:
+            pass
 
     # --------------------------------------------------------------------------------
     # 定义 网络获取版本信息函数
     # --------------------------------------------------------------------------------
-    def _get_latest_version(self, script_name, api_url):  # TODO 将该函数放到线程中执行,获取线程信息,保存,并且在下次运行时检查这个显示是否已经执行结束,如果结束则不再执行,否则执行
+    def _get_latest_version(self, script_name, api_url, etag=None):
+        """
+        通过接口获取最新版本.
 
+        返回说明:
+        - 返回 (版本号, ETag, 是否未变化). 传入 etag 时发送 If-None-Match 条件请求, 服务器返回 304 时
+          版本号为 None 且未变化为 True. 请求失败时返回 (None, None, False).
+        """
         start_time = time.time()
-        
+        self.requested = True
+
         try:
             headers = {
                 'User-Agent': f'{script_name} Update Checker',  # GitHub要求明确User-Agent
                 'Accept': 'application/vnd.github.v3+json'
             }
+            if etag:
+                headers['If-None-Match'] = etag
             req = urllib.request.Request(api_url, headers=headers)
             
             with urllib.request.urlopen(req, timeout=self.time_out) as response:
@@ -131,9 +171,13 @@ class UpdateChecker():
                 parsed_version = version.parse(latest_version)
                 
                 self.logger.info(_("通过 GitHub API 获取最新版本成功"))
-                return parsed_version
+                return parsed_version, response.headers.get('ETag'), False
                 
         except urllib.error.HTTPError as e:
+            if e.code == 304:
+                # 条件请求命中, 版本未变化 (不计入 GitHub API 速率限制)
+                self.logger.info(_("最新版本未变化"))
+                return None, e.headers.get('ETag') or etag, True
             # 处理API速率限制
             if e.code == 403 and 'X-RateLimit-Remaining' in e.headers:
                 reset_time = time.strftime("%Y-%m-%d %H:%M:%S", 
@@ -150,32 +194,72 @@ class UpdateChecker():
         finally:
             self.logger.info(_("请求耗时：%.2f秒") % (time.time()-start_time))
         
-        return None   
+        return None, None, False
+
+    # --------------------------------------------------------------------------------
+    # 定义 后台更新函数
+    # --------------------------------------------------------------------------------
+    def _refresh(self):
+        """
+        缓存过期时获取最新版本并更新缓存.
+
+        行为逻辑说明:
+        1. 缓存仍在有效期内时直接返回.
+        2. 获取锁文件, 其他进程正在更新时直接返回, 保证同一缓存周期内多个进程最多只发出一次请求.
+        3. 获得锁后再次检查缓存 (其他进程可能刚刚更新完毕).
+        4. 以缓存中的 ETag 发送条件请求, 未变化时沿用缓存中的版本号; 请求失败时保留缓存中的版本号与 ETag,
+           只刷新缓存时间, 有效期内不再重试.
+        """
+        if self._read_cache()[1]:
+            return
+        if not self._acquire_lock():
+            return
+        try:
+            data, fresh = self._read_cache()
+            if fresh:
+                return
+            latest_version, etag, not_modified = self._get_latest_version(script_name, self.api_url, data.get("etag"))
+            if latest_version is not None:
+                self._update_version_cache(str(latest_version), etag)
+            elif not_modified:
+                self._update_version_cache(data.get("latest_version"), etag)
+            else:
+                # 请求失败: 保留上次的版本号与 ETag, 只刷新缓存时间
+                self._update_version_cache(data.get("latest_version"), data.get("etag"))
+        finally:
+            self._release_lock()
+
+    def start(self):
+        """在后台线程中检查并更新版本缓存, 不阻塞调用方; 返回自身以便链式调用"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._refresh, name=f"{script_name}-update-check", daemon=True)
+            self._thread.start()
+        return self
 
     # --------------------------------------------------------------------------------
     # 定义 更新检查主函数
     # --------------------------------------------------------------------------------
-    def check_for_updates(self):
+    def check_for_updates(self, wait=None):
         """
         检查是否有新版本可用,并提示用户更新.
 
+        参数:
+        wait (float): 等待后台更新线程的最长时间 (秒), 默认为 time_out; 为 0 时只使用已有缓存.
+
         行为逻辑说明:
-        1. 从缓存中加载最新版本信息.
-        2. 如果缓存中没有最新版本信息,则从远程获取最新版本信息并更新缓存.
+        1. 尚未调用 start() 时先启动后台更新线程.
+        2. 最多等待 wait 秒, 然后从缓存中读取最新版本信息 (后台线程未完成时使用旧缓存, 本次不提示也不影响下次).
         3. 获取当前安装的版本信息.
         4. 比较当前版本和最新版本,如果当前版本较旧,则提示用户更新.
         5. 如果当前版本是最新的,则提示当前版本信息.
         """
-        latest_version = self._load_cached_version()  # 从缓存中加载最新版本信息
+        self.start()
+        self._thread.join(self.time_out if wait is None else wait)
 
-        if latest_version:
-            latest_version = version.parse(latest_version)  # 将字符串转换为版本对象
-        else:
-            latest_version = self._get_latest_version(script_name, API_URL)
-            if latest_version:
-                self._update_version_cache(str(latest_version))
-            else:
-                return
+        latest_version = self._read_cache()[0].get("latest_version")  # 从缓存中加载最新版本信息
+        if not latest_version:
+            return
+        latest_version = version.parse(latest_version)  # 将字符串转换为版本对象
 
         # 获取当前安装的版本信息
         current_version = version.parse(__version__)
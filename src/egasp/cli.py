@@ -0,0 +1,267 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2025-04-22 10:43:55 +0800
+LastEditTime : 2026-10-16 21:48:10 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/src/egasp/cli.py
+Description  : 面向用户的命令行模式: 单次查询、交互式查询与 CSV 批量计算
+ -----------------------------------------------------------------------
+'''
+import sys
+import argparse
+from contextlib import ExitStack, contextmanager, nullcontext
+from rich import box
+from rich import print
+from rich.table import Table
+from rich.prompt import Prompt
+from rich.console import Console
+from rich_argparse import RichHelpFormatter
+
+from egasp.egasp_core import EG_ASP_Core
+from egasp.logger_config import setup_logger
+from egasp.check_version import UpdateChecker
+# 版本信息
+from egasp.version import script_name, __version__
+
+logger = setup_logger(False)
+eg = EG_ASP_Core()  # 初始化核心计算类实例
+
+def print_table(result: dict):
+    console = Console(width=59)
+    # 创建表格
+    table = Table(show_header=True, header_style="bold dark_orange", box=box.ASCII_DOUBLE_HEAD, title="乙二醇水溶液查询结果")
+
+    # 添加列
+    table.add_column("属性", justify="left", style="cyan", no_wrap=True)
+    table.add_column("单位", justify="left", style="magenta", no_wrap=True)
+    table.add_column("数值", justify="left", style="green", no_wrap=True)
+    table.add_column("属性", justify="left", style="cyan", no_wrap=True)
+    table.add_column("单位", justify="left", style="magenta", no_wrap=True)
+    table.add_column("数值", justify="left", style="green", no_wrap=True)
+
+    # 添加行
+    table.add_row("质量浓度", "%", f"{result['mass']:.2f}", "密度", "kg/m³", f"{result['rho']:.2f}")
+    table.add_row("体积浓度", "%", f"{result['volume']:.2f}", "比热容", "J/kg·K", f"{result['cp']:.2f}")
+    table.add_row("冰点", "°C", f"{result['freezing']:.2f}", "导热率", "W/m·K", f"{result['k']:.4f}")
+    table.add_row("沸点", "°C", f"{result['boiling']:.2f}", "粘度", "Pa·s", f"{result['mu']:.5f}")
+
+    # 打印表格
+    console.print(table)
+
+
+def print_stats(stats: dict):
+    """输出各阶段调用次数与耗时、出错分类及缓存统计, 写入标准错误以免混入结果"""
+    console = Console(stderr=True)
+    table = Table(show_header=True, header_style="bold dark_orange", box=box.ASCII_DOUBLE_HEAD, title="运行统计")
+
+    table.add_column("阶段", justify="left", style="cyan", no_wrap=True)
+    table.add_column("调用次数", justify="right", no_wrap=True)
+    table.add_column("数据点", justify="right", no_wrap=True)
+    table.add_column("累计 (ms)", justify="right", style="green", no_wrap=True)
+    table.add_column("平均 (µs)", justify="right", style="green", no_wrap=True)
+
+    for name, stage in stats['stages'].items():
+        table.add_row(name, f"{stage['calls']}", f"{stage['points']}", f"{stage['total'] * 1e3:.3f}", f"{stage['mean'] * 1e6:.1f}")
+
+    console.print(table)
+    console.print("出错: " + (", ".join(f"{name} {n}" for name, n in sorted(stats['errors'].items())) or "无"))
+    if stats['cache']:
+        cache = stats['cache']
+        console.print(f"缓存: 命中 {cache['hits']}, 未命中 {cache['misses']}, 淘汰 {cache['evictions']}, 命中率 {cache['hit_rate']:.1%}")
+
+
+def add_instrument_args(parser: argparse.ArgumentParser):
+    parser.add_argument("--stats", action="store_true", help="结束时输出各阶段调用次数与耗时统计")
+    parser.add_argument("--profile", type=str, default=None, metavar="FILE", help="使用 cProfile 记录运行过程并保存到 FILE, 可用 python -m pstats FILE 查看")
+
+
+@contextmanager
+def instrumented(args: argparse.Namespace):
+    """按 --stats / --profile 开启统计与性能剖析, 结束时 (含查询出错退出) 输出统计并保存剖析文件"""
+    if args.stats:
+        eg.enable_stats()
+    profiler = None
+    if args.profile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+            Console(stderr=True).print(f"[green]性能剖析已保存: {args.profile}[/green]")
+        if args.stats:
+            print_stats(eg.stats_info())
+
+
+def stage(name: str):
+    """命令行阶段 (渲染、更新检查) 计时, 未开启统计时为空上下文"""
+    return nullcontext() if eg.stats is None else eg.stats.stage(name)
+
+
+def cli_main():
+    parser = argparse.ArgumentParser(
+        prog='egasp',
+        description="[i]乙二醇水溶液属性查询程序  ---- 焱铭[/]",
+        formatter_class=RichHelpFormatter,
+    )
+    parser.add_argument("-qt", "--query_type", type=str, default="volume", help="浓度类型 (volume/mass or v/m), 默认值为 volume (体积浓度)")
+    parser.add_argument("-qv", "--query_value", type=float, default=50, help="查询浓度 %% (范围: 10 ~ 90), 默认值为 50")  # 修改此处
+    parser.add_argument("query_temp", type=float, help="查询温度 °C (范围: -35 ~ 125)")  # 如果温度单位有%也需要转义
+    add_instrument_args(parser)
+
+    args = parser.parse_args()
+
+    with instrumented(args):
+        # 后台检查更新, 与查询同时进行, 不延迟结果输出
+        with stage('update_check'):
+            uc = UpdateChecker(1, 6).start()  # 访问超时, 单位: 秒;缓存时长, 单位: 小时
+
+        with stage('render'):
+            console = Console(width=59)
+            console.print(f"\n[bold green]{script_name}[/bold green]", justify="center")
+            print('-----+--------------------------------------------+-----')
+            # 打印校验后的查询参数
+            print(f"查询类型: {args.query_type}")
+            print(f"查询浓度: {args.query_value} %")
+            print(f"查询温度: {args.query_temp} °C")
+        mass, volume, freezing, boiling, rho, cp, k, mu = eg.get_egasp(args.query_temp, args.query_type, args.query_value)
+
+        result = {"mass": mass, "volume": volume, "freezing": freezing, "boiling": boiling, "rho": rho, "cp": cp, "k": k, "mu": mu}
+
+        with stage('render'):
+            print('-----+--------------------------------------------+-----\n')
+            print_table(result)  # 调用print_table函数
+
+        # 提示更新, 后台检查最多再等待 1 秒
+        with stage('update_check'):
+            uc.check_for_updates()
+
+
+def input_main():
+    try:
+        # 初始化控制台输出
+        console = Console(width=59)
+        console.print(f"\n[bold green]{script_name}[/bold green]", justify="center")
+        print('-----+--------------------------------------------+-----')
+
+        # 后台检查更新, 用户输入期间即可完成
+        uc = UpdateChecker(1, 6).start()
+
+        # 交互式输入参数
+        while True:
+            try:
+                console.print("[bold cyan]参数输入[/]")
+                query_type = Prompt.ask("[bold]1. 浓度类型 [dim](volume/mass)[/]", default="volume")
+                console.print(f"[green]✓ 已选择类型: {query_type}[/]")
+
+                query_value = float(Prompt.ask("[bold]2. 输入浓度 [dim](10-90%)[/]", default="50"))
+                console.print(f"[green]✓ 浓度已确认: {query_value}%[/]")
+
+                query_temp = float(Prompt.ask("[bold]3. 输入温度 [dim](-35-125°C)[/]"))
+                console.print(f"[green]✓ 温度已确认: {query_temp}°C[/]\n")
+            except ValueError as e:
+                console.print(f"[red]输入格式错误: {str(e)}，请重新输入[/red]")
+
+            # 获取计算结果（复用原有核心逻辑）
+            mass, volume, freezing, boiling, rho, cp, k, mu = eg.get_egasp(query_temp, query_type, query_value)
+
+            # 打印结果表格
+            print('-----+--------------------------------------------+-----\n')
+            result = {"mass": mass, "volume": volume, "freezing": freezing, "boiling": boiling, "rho": rho, "cp": cp, "k": k, "mu": mu}
+            print_table(result)
+
+            # 提示更新（复用原有更新逻辑）
+            uc.check_for_updates()
+
+            console.input("[green]按任意键退出...[/]")
+
+            break
+
+    except Exception as e:
+        logger.exception("程序发生异常:")
+        console.input("[red]程序运行出错，按任意键退出...[/red]")
+
+
+def batch_main():
+    """
+    流式批量计算 CSV 文件, 逐块读取、计算并写出, 内存占用与文件大小无关
+    使用方式：
+        egasp batch in.csv -o out.csv --temp-col T --value-col conc --type-col type
+    """
+    from egasp.csv_stream import DEFAULT_CHUNK_SIZE, stream_csv
+    from egasp.derived import OUTPUT_KEYS, normalize_props
+
+    parser = argparse.ArgumentParser(
+        prog='egasp batch',
+        description="[i]批量计算 CSV 文件中每行的乙二醇水溶液属性, 结果追加在原始列之后[/]",
+        formatter_class=RichHelpFormatter,
+    )
+    parser.add_argument("input", type=str, help="输入 CSV 文件, - 表示标准输入")
+    parser.add_argument("-o", "--output", type=str, default="-", help="输出 CSV 文件, 默认为 - (标准输出)")
+    parser.add_argument("--temp-col", type=str, default="temp", help="温度列名, 默认值为 temp")
+    parser.add_argument("--value-col", type=str, default="value", help="浓度列名, 默认值为 value")
+    parser.add_argument("--type-col", type=str, default=None, help="浓度类型列名 (volume/mass or v/m), 不指定时全部行使用 --type")
+    parser.add_argument("-qt", "--type", type=str, default="volume", help="浓度类型 (volume/mass or v/m), 默认值为 volume")
+    parser.add_argument("--props", type=str, default="mass,volume,freezing,boiling,rho,cp,k,mu", help="输出参数, 逗号分隔, 可包含派生参数 nu/alpha/pr/rho_cp")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help=f"每块行数, 默认值为 {DEFAULT_CHUNK_SIZE}")
+    parser.add_argument("--delimiter", type=str, default=",", help="分隔符, 默认值为 ,")
+    parser.add_argument("--no-header", action="store_true", help="输入无表头, 此时各列参数为从 0 开始的列号")
+    add_instrument_args(parser)
+    args = parser.parse_args()
+
+    props, unknown = normalize_props([p.strip() for p in args.props.split(',') if p.strip()])
+    if unknown:
+        parser.error(f"无效输出参数 {', '.join(unknown)}，可选值: {'/'.join(OUTPUT_KEYS)}")
+    query_type = eg.validate.type_value(args.type)
+
+    # 结果写入标准输出时, 统计信息输出到标准错误
+    console = Console(stderr=True)
+    # 打开失败、读写出错时输出一行说明后退出, 已打开的文件由 ExitStack 关闭
+    with ExitStack() as files:
+        try:
+            src = sys.stdin if args.input == '-' else files.enter_context(open(args.input, newline='', encoding='utf-8-sig'))
+            dst = sys.stdout if args.output == '-' else files.enter_context(open(args.output, 'w', newline='', encoding='utf-8'))
+        except OSError as e:
+            console.print(f"[red]无法打开文件 {e.filename}: {e.strerror}[/red]")
+            sys.exit(1)
+
+        try:
+            with instrumented(args):
+                stats = stream_csv(eg, src, dst, props, args.temp_col, args.value_col, args.type_col, query_type, args.chunk_size, args.delimiter, not args.no_header)
+        except (ValueError, OSError) as e:
+            console.print(f"[red]{e}[/red]")
+            sys.exit(1)
+
+    summary = ", ".join(f"{name} {n}" for name, n in sorted(stats.status_counts.items()) if name != 'OK')
+    errors = f"出错 {stats.errors} 行 ({summary})" if stats.errors else "无出错行"
+    console.print(f"[green]共 {stats.rows} 行, {errors}, 耗时 {stats.elapsed:.2f} s, {stats.rows_per_sec:,.0f} 行/s[/green]")
+
+
+def main():
+    if len(sys.argv) > 1:
+        if sys.argv[1] == 'batch':
+            sys.argv.pop(1)
+            batch_main()
+        else:
+            cli_main()
+    else:
+        input_main()
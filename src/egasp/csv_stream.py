@@ -0,0 +1,176 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-16 20:41:27 +0800
+LastEditTime : 2026-10-16 20:41:27 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/src/egasp/csv_stream.py
+Description  : CSV 文件的分块流式批量计算, 内存占用与文件大小无关
+ -----------------------------------------------------------------------
+'''
+import csv
+import math
+import time
+from itertools import islice
+from typing import Optional, TextIO, Union
+
+import numpy as np
+
+from egasp.errors import Status
+
+# 类型列取值 (大小写不敏感) 与查询类型的对应关系, 空值使用默认类型
+TYPE_ALIASES = {'volume': 'volume', 'v': 'volume', 'mass': 'mass', 'm': 'mass'}
+
+# 每块读取的默认行数
+DEFAULT_CHUNK_SIZE = 16384
+
+
+def _to_float(text: str) -> float:
+    try:
+        return float(text)
+    except ValueError:
+        return math.nan
+
+
+def _column(rows: list, i: int) -> np.ndarray:
+    """取出第 i 列并转换为 float64 数组, 缺失或无法解析的字段为 NaN"""
+    try:
+        return np.array([row[i] for row in rows], dtype=np.float64)
+    except (IndexError, ValueError):
+        return np.array([_to_float(row[i]) if i < len(row) else math.nan for row in rows], dtype=np.float64)
+
+
+def _resolve(header: Optional[list], col: Union[str, int, None], name: str) -> Optional[int]:
+    """将列名或从 0 开始的列号转换为列号"""
+    if col is None:
+        return None
+    if header is None or isinstance(col, int):
+        try:
+            return int(col)
+        except ValueError:
+            raise ValueError(f"无表头时{name}列必须为列号: {col}") from None
+    try:
+        return header.index(col)
+    except ValueError:
+        raise ValueError(f"输入文件中不存在{name}列 {col}, 现有列: {', '.join(header)}") from None
+
+
+class StreamStats:
+    """流式批量计算的统计信息"""
+
+    def __init__(self):
+        self.rows = 0
+        self.chunks = 0
+        self.status_counts = {}
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    @property
+    def errors(self) -> int:
+        """出错的数据行数"""
+        return sum(n for code, n in self.status_counts.items() if code != Status.OK.name)
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            'rows': self.rows,
+            'errors': self.errors,
+            'chunks': self.chunks,
+            'elapsed': self.elapsed,
+            'rows_per_sec': self.rows_per_sec,
+            'status': dict(self.status_counts),
+        }
+
+
+def stream_csv(eg, src: TextIO, dst: TextIO, props: tuple, temp_col: Union[str, int] = 'temp', value_col: Union[str, int] = 'value', type_col: Union[str, int, None] = None, default_type: str = 'volume', chunk_size: int = DEFAULT_CHUNK_SIZE, delimiter: str = ',', header: bool = True) -> StreamStats:
+    """
+    逐块读取 CSV, 以 eg.get_egasp_props_many 批量计算后逐块写出, 内存占用只与 chunk_size 有关。
+
+    输出为输入的原始各列, 其后依次为 props 中的各输出列及状态列 status (见 egasp.errors.Status),
+    出错行的输出列为空。type_col 为 None 时全部行使用 default_type, 否则按行读取 volume/mass (或 v/m),
+    无效类型记为 INVALID_INPUT。header=False 时输入无表头, 各列参数为从 0 开始的列号, 输出也不写表头。
+    字段数少于表头 (无表头时为首行) 的行以空字段补齐; 多于表头的行截去多余字段并记为 INVALID_INPUT,
+    以保证输出列与表头对齐。
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"分块大小必须为正整数 chunk_size={chunk_size}")
+
+    reader = csv.reader(src, delimiter=delimiter)
+    writer = csv.writer(dst, delimiter=delimiter, lineterminator='\n')
+
+    names = next(reader, None) if header else None
+    if header and names is None:
+        raise ValueError("输入文件为空")
+    ti, vi, yi = _resolve(names, temp_col, '温度'), _resolve(names, value_col, '浓度'), _resolve(names, type_col, '类型')
+    if names is not None:
+        writer.writerow(names + list(props) + ['status'])
+
+    status_names = {code.value: code.name for code in Status}
+    stats = StreamStats()
+    width = None if names is None else len(names)
+    while True:
+        rows = list(islice(reader, chunk_size))
+        if not rows:
+            break
+
+        # 按表头宽度对齐各行, 否则输出列会错位到原始列之下
+        if width is None:
+            width = len(rows[0])
+        overlong = None
+        if any(len(row) != width for row in rows):
+            overlong = np.array([len(row) > width for row in rows])
+            rows = [row[:width] if len(row) >= width else row + [''] * (width - len(row)) for row in rows]
+
+        temp, value = _column(rows, ti), _column(rows, vi)
+        values = np.full((len(rows), len(props)), np.nan)
+        status = np.full(len(rows), Status.INVALID_INPUT, dtype=np.int8)
+
+        # 按查询类型分组计算, 无类型列时整块为同一类型; 无效类型的行按默认类型计算,
+        # 与多于表头的行一样以 NaN 温度参与计算, 由 eg 记为 INVALID_INPUT, 使 eg 的统计与本函数的计数一致
+        if yi is None:
+            types = None
+        else:
+            types = np.array([TYPE_ALIASES.get(row[yi].strip().lower(), '') if yi < len(row) and row[yi].strip() else default_type for row in rows])
+            invalid = types == ''
+            if invalid.any():
+                temp[invalid] = np.nan
+                types[invalid] = default_type
+        if overlong is not None:
+            temp[overlong] = np.nan
+
+        groups = {default_type: slice(None)} if types is None else {query_type: types == query_type for query_type in ('volume', 'mass')}
+        for query_type, index in groups.items():
+            result, group_status = eg.get_egasp_props_many(temp[index], query_type, value[index], props, with_status=True)
+            values[index] = np.column_stack([result[p] for p in props])
+            status[index] = group_status
+
+        # 出错行的输出留空
+        cells = values.astype(object)
+        cells[status != Status.OK] = None
+        writer.writerows(row + out + [status_names[code]] for row, out, code in zip(rows, cells.tolist(), status.tolist()))
+
+        codes, counts = np.unique(status, return_counts=True)
+        for code, n in zip(codes.tolist(), counts.tolist()):
+            stats.status_counts[status_names[code]] = stats.status_counts.get(status_names[code], 0) + n
+        stats.rows += len(rows)
+        stats.chunks += 1
+
+    stats.elapsed = time.perf_counter() - stats.started
+    return stats
@@ -0,0 +1,166 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-16 17:48:02 +0800
+LastEditTime : 2026-10-16 17:48:02 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/src/egasp/cursor.py
+Description  : 固定浓度的有状态查询游标, 温度缓慢变化时复用上一次的插值单元
+ -----------------------------------------------------------------------
+'''
+import math
+from typing import Optional, Tuple
+
+from egasp.errors import TempOutOfRangeError, ConcOutOfRangeError, DataGapError, InvalidInputError
+
+
+class EgaspCursor:
+    """
+    绑定固定浓度的查询游标, 用于瞬态仿真中逐时间步查询。
+
+    浓度相关的冰点、沸点与浓度方向的插值在构造时完成, 每个温度单元内四个物性
+    均化为关于单元内权重 w 的多项式 (双线性为一次, 双三次为三次)。
+    查询温度仍在当前单元内时只需计算多项式, 离开单元时才重新定位并更新系数。
+    结果与 EG_ASP_Core.get_egasp 一致, 错误处理方式同所属的 EG_ASP_Core。
+    """
+
+    def __init__(self, core, query_value: float, query_type: str = 'volume'):
+        """
+        参数:
+        core (EG_ASP_Core): 提供插值方案与错误处理方式的核心实例。
+        query_value (float): 固定的浓度值 (%)。
+        query_type (str): 浓度类型, "volume" 或 "mass"。
+        """
+        self.core = core
+        self.grid = core.grid
+        self.interp = core.interp
+
+        query_type = core.validate.type_value(query_type)
+        query_value = core.validate.input_value(query_value, min_val=10, max_val=90)
+        if query_value != query_value:
+            core._error_exit(f"查询浓度 {query_value} 不是有效数字", InvalidInputError)
+
+        self.query_type, self.query_value = query_type, query_value
+        self.fb = core.get_fb_props(query_value, query_type)
+
+        grid = self.grid
+        self.c_cell = grid.locate_conc(self.fb[1])
+        if self.c_cell is None:
+            core._error_exit(f"浓度 {self.fb[1]} 超出有效范围 [{grid.conc_nodes[0]}, {grid.conc_nodes[-1]}]", ConcOutOfRangeError)
+
+        self.log_props = () if self.interp is None else self.interp.log_props
+
+        # 当前温度单元: 下节点、单元内有效的权重上限 (最后一个节点处为 0, 每次重新定位)、各物性的多项式系数
+        self._lower = None
+        self._w_end = 0.0
+        self._coeffs = None
+
+        # 统计重新定位次数, 便于评估游标命中情况
+        self.moves = 0
+
+    def _row(self, i: int) -> Tuple[Optional[float], ...]:
+        """温度节点 i 所在行上沿浓度方向插值的 (rho, cp, k, mu), 对数方案为对数值"""
+        values = (self.interp or self.grid).values
+        stride = self.grid.stride
+        c_lower, c_upper, wc = self.c_cell
+        lower, upper = i * stride + c_lower, i * stride + c_upper
+        result = []
+        for plane in values:
+            # 任一节点缺失 (NaN) 时结果为 NaN
+            v1, v2 = plane[lower], plane[upper]
+            value = v1 + (v2 - v1) * wc
+            result.append(None if value != value else value)
+        return tuple(result)
+
+    def _cubic_coeffs(self, p: int, lower: int) -> Optional[Tuple[float, ...]]:
+        """双三次方案在温度单元 lower 内关于 u 的系数 (r0, r1, r2, r3), 单元不完整时返回 None"""
+        table = self.interp.cubic[p]
+        c_lower, _c_upper, wc = self.c_cell
+        cj = min(c_lower, table.n_conc - 2)
+        a = table.cells[lower * (table.n_conc - 1) + cj]
+        if a is None:
+            return None
+
+        v = c_lower + wc - cj
+        return tuple(a[r] + v * (a[r + 1] + v * (a[r + 2] + v * a[r + 3])) for r in (0, 4, 8, 12))
+
+    def _move(self, temp: float) -> float:
+        """重新定位温度单元并更新多项式系数, 返回单元内权重"""
+        grid = self.grid
+        t_cell = grid.locate_temp(temp)
+        if t_cell is None:
+            if temp != temp:
+                self.core._error_exit(f"查询温度 {temp} 不是有效数字", InvalidInputError)
+            self.core._error_exit(f"温度 {temp} 超出有效范围 [{grid.temp_nodes[0]}, {grid.temp_nodes[-1]}]", TempOutOfRangeError)
+
+        lower, upper, w = t_cell
+        row_lower = self._row(lower)
+        row_upper = self._row(upper) if upper != lower else row_lower
+
+        coeffs = []
+        for p, (v1, v2) in enumerate(zip(row_lower, row_upper)):
+            if v1 is None or v2 is None:
+                coeffs.append(None)
+                continue
+            poly = (v1, v2 - v1)
+            if self.interp is not None and p in self.interp.cubic:
+                if upper != lower:
+                    poly = self._cubic_coeffs(p, lower) or poly
+                else:
+                    # 恰好位于温度节点: 取所在单元 u = 0 处 (最后一个节点取前一个单元 u = 1 处) 的值
+                    ci = min(lower, self.grid.n_temp - 2)
+                    r = self._cubic_coeffs(p, ci)
+                    if r is not None:
+                        poly = (r[0], 0.0) if ci == lower else (r[0] + r[1] + r[2] + r[3], 0.0)
+            coeffs.append(poly)
+
+        self._lower = lower
+        # 最后一个节点的退化单元只在该节点上有效, 每次重新定位
+        self._w_end = 1.0 if upper != lower else 0.0
+        self._coeffs = tuple(coeffs)
+        self.moves += 1
+
+        return w
+
+    def get_props_all(self, temp: float) -> Tuple[float, float, float, float]:
+        """在固定浓度下查询 (rho, cp, k, mu), 单位与数据表一致 (mu 为 mPa·s)"""
+        lower = self._lower
+        if lower is not None:
+            w = (temp - self.grid.temp_start) / self.grid.temp_step - lower
+            if not (0.0 <= w < self._w_end):
+                w = self._move(temp)
+        else:
+            w = self._move(temp)
+
+        result = []
+        for p, poly in enumerate(self._coeffs):
+            if poly is None:
+                self.core._error_exit(f"温度 {temp}°C 浓度 {self.fb[1]}% 附近存在数据缺失 (数据库本身缺失)", DataGapError)
+            if len(poly) == 2:
+                value = poly[0] + poly[1] * w
+            else:
+                value = poly[0] + w * (poly[1] + w * (poly[2] + w * poly[3]))
+            if p in self.log_props:
+                value = math.exp(value)
+            result.append(value)
+
+        return tuple(result)
+
+    def get_egasp(self, query_temp: float) -> tuple:
+        """在固定浓度下查询, 返回与 get_egasp 相同的 8 元组 (mu 为 Pa·s)"""
+        rho, cp, k, mu = self.get_props_all(query_temp)
+        return self.fb + (rho, cp, k, mu / 1000)
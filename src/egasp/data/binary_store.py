@@ -0,0 +1,181 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-16 19:02:27 +0800
+LastEditTime : 2026-10-16 19:02:27 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/src/egasp/data/binary_store.py
+Description  : 物性表的二进制存储格式, 加载时内存映射, 不依赖 numpy
+ -----------------------------------------------------------------------
+'''
+import os
+import sys
+import mmap
+import struct
+from collections.abc import Mapping
+from typing import Dict, List, Optional
+
+# 文件布局 (小端):
+#   前缀: MAGIC (4 字节) | 版本 (uint32) | 表数量 (uint32) | 说明信息长度 (uint32)
+#   目录: 每张表一项, 表名 (16 字节, UTF-8 以 0 补齐) | 行数 (uint32) | 列数 (uint32) | 数据偏移 (uint64)
+#   说明信息: JSON (单位、坐标轴、数据来源等), 仅在调用 meta() 时解析
+#   数据区: 按 8 字节对齐, 各表 float64 原始数据按行存储, 缺失数据为 NaN
+# 加载时只解析定长的前缀与目录, 不导入 json, 也不把数据展开为 Python 对象。
+MAGIC = b'EGPB'
+VERSION = 1
+_PREFIX = struct.Struct('<4sIII')
+_ENTRY = struct.Struct('<16sIIQ')
+
+# 随包发布的数据文件
+DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'egasp_data.bin')
+
+
+class TableStore:
+    """
+    内存映射的只读物性表集合。
+
+    表数据不在加载时展开为 Python 对象, table() 返回直接指向映射内存的二维 memoryview,
+    array() 返回共享同一内存的 numpy 数组 (仅在调用时导入 numpy)。
+    """
+
+    def __init__(self, path=DATA_FILE):
+        self.path = os.fspath(path)
+        with open(self.path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, n_tables, meta_len = _PREFIX.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"不是有效的物性数据文件: {self.path}")
+        if version != VERSION:
+            raise ValueError(f"不支持的物性数据文件版本 {version}: {self.path}")
+
+        # 表名 -> (行数, 列数, 数据起始位置)
+        self.entries = {}
+        pos = _PREFIX.size
+        for _ in range(n_tables):
+            name, rows, cols, offset = _ENTRY.unpack_from(self._mmap, pos)
+            self.entries[name.rstrip(b'\0').decode('utf-8')] = (rows, cols, offset)
+            pos += _ENTRY.size
+
+        self._meta_span = (pos, pos + meta_len)
+        self._meta = None
+        self._views = {}
+
+    @property
+    def names(self) -> List[str]:
+        """全部表名, 按文件中的顺序"""
+        return list(self.entries)
+
+    def meta(self, name: Optional[str] = None) -> dict:
+        """表的说明信息 (unit、axes、columns 等), name 为 None 时返回整个说明信息"""
+        if self._meta is None:
+            import json
+
+            start, end = self._meta_span
+            self._meta = json.loads(self._mmap[start:end].decode('utf-8'))
+        return self._meta if name is None else self._meta['tables'].get(name, {})
+
+    def table(self, name: str) -> memoryview:
+        """形状为 (行数, 列数) 的 float64 只读 memoryview, 以 view[i, j] 取值"""
+        view = self._views.get(name)
+        if view is None:
+            rows, cols, offset = self.entries[name]
+            raw = memoryview(self._mmap)[offset:offset + rows * cols * 8]
+            if sys.byteorder == 'little':
+                view = raw.cast('d', (rows, cols))
+            else:
+                # 大端平台无法直接映射, 复制一份并转换字节序
+                from array import array
+
+                values = array('d', raw.tobytes())
+                values.byteswap()
+                view = memoryview(values).cast('B').cast('d', (rows, cols))
+            self._views[name] = view
+        return view
+
+    def rows(self, name: str) -> List[List[Optional[float]]]:
+        """以嵌套列表返回表数据, NaN 转换为 None, 与原 egasp_data 中的列表字面量一致"""
+        return [[None if v != v else v for v in row] for row in self.table(name).tolist()]
+
+    def array(self, name: str):
+        """共享映射内存的只读 numpy 数组, 缺失数据为 NaN"""
+        import numpy as np
+
+        return np.asarray(self.table(name))
+
+
+class EGPView(Mapping):
+    """
+    与原 EGP 字典兼容的只读视图, 首次访问某张表时才转换为嵌套列表并缓存。
+    """
+
+    def __init__(self, store: TableStore):
+        self.store = store
+        self._cache = {}
+
+    def __getitem__(self, name: str) -> List[List[Optional[float]]]:
+        if name not in self._cache:
+            if name not in self.store.entries:
+                raise KeyError(name)
+            self._cache[name] = self.store.rows(name)
+        return self._cache[name]
+
+    def __iter__(self):
+        return iter(self.store.names)
+
+    def __len__(self) -> int:
+        return len(self.store.names)
+
+
+def write_store(path, tables: Dict[str, list], meta: Optional[Dict[str, dict]] = None, source: str = '') -> None:
+    """
+    将 {表名: 嵌套列表} 写为二进制数据文件, None 写为 NaN。
+
+    meta 为各表附加写入说明信息的字段 (单位、坐标轴等), source 为数据来源说明。
+    """
+    import json
+    import math
+    from array import array
+
+    meta_bytes = json.dumps({'source': source, 'tables': meta or {}}, ensure_ascii=False).encode('utf-8')
+
+    # 数据区起点按 8 字节对齐
+    data_start = _PREFIX.size + _ENTRY.size * len(tables) + len(meta_bytes)
+    meta_bytes += b' ' * (-data_start % 8)
+    offset = data_start + (-data_start % 8)
+
+    entries, chunks = [], []
+    for name, rows in tables.items():
+        encoded = name.encode('utf-8')
+        if len(encoded) > 16:
+            raise ValueError(f"表名 {name} 超过 16 字节")
+        values = array('d', (math.nan if v is None else float(v) for row in rows for v in row))
+        if len(values) != len(rows) * len(rows[0]):
+            raise ValueError(f"表 {name} 各行长度不一致")
+        if sys.byteorder != 'little':
+            values.byteswap()
+        entries.append(_ENTRY.pack(encoded, len(rows), len(rows[0]), offset))
+        chunks.append(values.tobytes())
+        offset += len(chunks[-1])
+
+    with open(path, 'wb') as f:
+        f.write(_PREFIX.pack(MAGIC, VERSION, len(tables), len(meta_bytes)))
+        for entry in entries:
+            f.write(entry)
+        f.write(meta_bytes)
+        for chunk in chunks:
+            f.write(chunk)
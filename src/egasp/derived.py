@@ -0,0 +1,65 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-16 17:20:36 +0800
+LastEditTime : 2026-10-16 17:20:36 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/src/egasp/derived.py
+Description  : 由插值结果派生的输运参数 (普朗特数、运动粘度、热扩散率、体积热容)
+ -----------------------------------------------------------------------
+'''
+from typing import Iterable, Tuple
+
+# get_egasp 返回的 8 个基本输出, 顺序与返回元组一致
+BASE_KEYS = ('mass', 'volume', 'freezing', 'boiling', 'rho', 'cp', 'k', 'mu')
+
+# 派生参数, 以 get_egasp 的单位 (mu 为 Pa·s) 计算, 对标量与 numpy 数组均适用
+# nu     : 运动粘度 (m²/s)      ν = μ / ρ
+# alpha  : 热扩散率 (m²/s)      α = k / (ρ·cp)
+# pr     : 普朗特数 (-)         Pr = cp·μ / k
+# rho_cp : 体积热容 (J/m³·K)    ρ·cp
+DERIVED = {
+    'nu': lambda r: r['mu'] / r['rho'],
+    'alpha': lambda r: r['k'] / (r['rho'] * r['cp']),
+    'pr': lambda r: r['cp'] * r['mu'] / r['k'],
+    'rho_cp': lambda r: r['rho'] * r['cp'],
+}
+
+# 全部可选输出名称
+OUTPUT_KEYS = BASE_KEYS + tuple(DERIVED)
+
+
+def normalize_props(props: Iterable[str]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    将输出名称 (大小写不敏感) 规整为元组, 单个名称也可以直接传入字符串。
+
+    返回 (规整后的名称, 无效名称)。
+    """
+    if isinstance(props, str):
+        props = (props,)
+    props = tuple(p.lower() for p in props)
+    return props, tuple(p for p in props if p not in OUTPUT_KEYS)
+
+
+def select(result: tuple, props: Tuple[str, ...]) -> dict:
+    """
+    从 get_egasp 顺序的 8 元组中按名称取出输出, 派生参数在同一次调用中计算。
+
+    返回按 props 顺序排列的 {名称: 值} 字典。
+    """
+    base = dict(zip(BASE_KEYS, result))
+    return {p: base[p] if p in base else DERIVED[p](base) for p in props}
@@ -0,0 +1,239 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-16 09:12:40 +0800
+LastEditTime : 2026-10-16 09:12:40 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/src/egasp/egasp_batch.py
+Description  : 基于 NumPy 的批量 (向量化) 物性计算
+ -----------------------------------------------------------------------
+'''
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from egasp.errors import Status
+from egasp.fb_table import FB_TABLE
+from egasp.interp import Interpolator
+from egasp.property_grid import ALL_VALID, PROP_KEYS, PROPERTY_GRID, PropertyGrid
+
+
+def _as_array(rows) -> np.ndarray:
+    """将嵌套序列转换为 float64 数组, None 以 NaN 表示"""
+    return np.array([[np.nan if v is None else v for v in row] for row in rows], dtype=np.float64)
+
+
+def _grid_tensor(values, grid: PropertyGrid) -> np.ndarray:
+    """将各物性的节点值 (布局同 PropertyGrid.values) 合为 (温度, 浓度, 物性) 三维数组, 最后一维顺序同 PROP_KEYS"""
+    planes = [np.frombuffer(plane, dtype=np.float64).reshape(-1, grid.stride)[:grid.n_temp, :grid.n_conc] for plane in values]
+    return np.stack(planes, axis=-1)
+
+
+PROP_TENSOR = _grid_tensor(PROPERTY_GRID.values, PROPERTY_GRID)
+
+# 单元有效性掩码, 下标为 (t_lower + t_upper, c_lower + c_upper), 与 PropertyGrid.valid 共享内存
+VALID_MASK = np.frombuffer(PROPERTY_GRID.valid, dtype=np.uint8).reshape(-1, PROPERTY_GRID.valid_stride)
+
+
+# 插值方案对应的数组表, 每种方案只展开一次; 并行计算的工作进程通过 install_tables 直接填入
+_INTERP_ARRAYS = {}
+
+
+def _interp_arrays(interp: Interpolator) -> Tuple[np.ndarray, dict]:
+    """插值方案对应的 (变换后的物性张量, {物性下标: 双三次系数数组})"""
+    arrays = _INTERP_ARRAYS.get(interp)
+    if arrays is None:
+        grid = interp.grid
+        tensor = _grid_tensor(interp.values, grid)
+        cubic = {
+            p: _as_array([(np.nan,) * 16 if a is None else a for a in table.cells]).reshape(grid.n_temp - 1, grid.n_conc - 1, 16)
+            for p, table in interp.cubic.items()
+        }
+        arrays = _INTERP_ARRAYS[interp] = (tensor, cubic)
+    return arrays
+
+# 冰点沸点表按查询类型预先展开为 (键, 区间起点, 区间差分, 区间完整性) 数组
+FB_ARRAYS = {
+    query_type: (
+        np.array(index.keys, dtype=np.float64),
+        _as_array(index.starts),
+        _as_array(index.deltas),
+        np.array(index.row_valid, dtype=bool),
+    )
+    for query_type, index in FB_TABLE.index.items()
+}
+FB_ARRAY_NAMES = ('keys', 'starts', 'deltas', 'row_valid')
+
+
+def export_tables(interp: Optional[Interpolator] = None) -> Dict[str, np.ndarray]:
+    """
+    导出批量计算用到的全部数组表 {名称: 数组}, 供复制到共享内存后由 install_tables 在其他进程中使用。
+    """
+    tables = {'tensor': PROP_TENSOR, 'valid': VALID_MASK}
+    for query_type, arrays in FB_ARRAYS.items():
+        for name, arr in zip(FB_ARRAY_NAMES, arrays):
+            tables[f'fb_{query_type}_{name}'] = arr
+    if interp is not None:
+        tensor, cubic = _interp_arrays(interp)
+        tables['interp_tensor'] = tensor
+        for p, coeffs in cubic.items():
+            tables[f'cubic_{p}'] = coeffs
+    return tables
+
+
+def install_tables(tables: Dict[str, np.ndarray], interp: Optional[Interpolator] = None) -> None:
+    """
+    以 export_tables 导出的数组 (如共享内存中的视图) 替换本进程的数组表, 不再重新展开。
+
+    供并行计算的工作进程使用, interp 须与导出时的插值方案一致。
+    """
+    global PROP_TENSOR, VALID_MASK
+
+    PROP_TENSOR, VALID_MASK = tables['tensor'], tables['valid']
+    for query_type in FB_ARRAYS:
+        FB_ARRAYS[query_type] = tuple(tables[f'fb_{query_type}_{name}'] for name in FB_ARRAY_NAMES)
+    if interp is not None:
+        _INTERP_ARRAYS[interp] = (tables['interp_tensor'], {p: tables[f'cubic_{p}'] for p in interp.cubic})
+
+
+def _locate(values: np.ndarray, start: float, step: float, n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    在等间距节点上定位插值区间, 即 PropertyGrid._locate 的向量化版本。
+
+    返回下、上节点索引, 区间内权重以及是否在节点范围内的掩码。
+    恰好落在节点上时上下索引相同。
+    """
+    pos = (values - start) / step
+    ok = (pos >= 0) & (pos <= n - 1)
+    pos = np.where(ok, pos, 0.0)
+
+    lower = np.floor(pos).astype(np.intp)
+    weight = pos - lower
+    upper = np.minimum(lower + (weight > 0), n - 1)
+
+    return lower, upper, weight, ok
+
+
+def _cubic_many(coeffs: np.ndarray, t_lower: np.ndarray, wt: np.ndarray, c_lower: np.ndarray, wc: np.ndarray) -> np.ndarray:
+    """批量双三次求值, 即 CubicTable.evaluate 的向量化版本, 不完整单元为 NaN"""
+    n_temp, n_conc = coeffs.shape[0] + 1, coeffs.shape[1] + 1
+    ci = np.minimum(t_lower, n_temp - 2)
+    cj = np.minimum(c_lower, n_conc - 2)
+    u = t_lower + wt - ci
+    v = c_lower + wc - cj
+
+    a = coeffs[ci, cj]
+    a = a.reshape(a.shape[:-1] + (4, 4))
+    r = a[..., 0] + v[..., np.newaxis] * (a[..., 1] + v[..., np.newaxis] * (a[..., 2] + v[..., np.newaxis] * a[..., 3]))
+
+    return r[..., 0] + u * (r[..., 1] + u * (r[..., 2] + u * r[..., 3]))
+
+
+def props_all_many(temp: np.ndarray, conc: np.ndarray, interp: Optional[Interpolator] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    批量插值, 一次定位同时得到 (rho, cp, k, mu)。
+
+    interp 为 egasp.interp 编译的插值方案, None 表示全部双线性插值。
+    返回形状为 (..., 4) 的物性数组 (缺失为 NaN) 以及逐点状态码数组,
+    任一物性缺失时状态码为 Status.DATA_GAP。
+    """
+    temp, conc = np.asarray(temp, dtype=np.float64), np.asarray(conc, dtype=np.float64)
+
+    grid = PROPERTY_GRID
+    t_lower, t_upper, wt, t_ok = _locate(temp, grid.temp_start, grid.temp_step, grid.n_temp)
+    c_lower, c_upper, wc, c_ok = _locate(conc, grid.conc_start, grid.conc_step, grid.n_conc)
+
+    tensor, cubic = (PROP_TENSOR, {}) if interp is None else _interp_arrays(interp)
+
+    v11 = tensor[t_lower, c_lower]
+    v12 = tensor[t_lower, c_upper]
+    v21 = tensor[t_upper, c_lower]
+    v22 = tensor[t_upper, c_upper]
+
+    wt_, wc_ = wt[..., np.newaxis], wc[..., np.newaxis]
+    v1 = v11 + (v12 - v11) * wc_
+    v2 = v21 + (v22 - v21) * wc_
+    result = v1 + (v2 - v1) * wt_
+
+    # 双三次单元不完整时保留双线性结果, 与 Interpolator 一致
+    for p, coeffs in cubic.items():
+        values = _cubic_many(coeffs, t_lower, wt, c_lower, wc)
+        result[..., p] = np.where(np.isnan(values) | np.isnan(result[..., p]), result[..., p], values)
+    if interp is not None:
+        for p in interp.log_props:
+            result[..., p] = np.exp(result[..., p])
+
+    # 状态判断顺序与标量接口一致: 温度范围、浓度范围、数据缺失
+    in_range = t_ok & c_ok
+    status = np.where(t_ok, np.where(c_ok, Status.OK, Status.CONC_OUT_OF_RANGE), Status.TEMP_OUT_OF_RANGE).astype(np.int8)
+    mask = VALID_MASK[t_lower + t_upper, c_lower + c_upper]
+    status[in_range & (mask != ALL_VALID)] = Status.DATA_GAP
+
+    return np.where(in_range[..., np.newaxis], result, np.nan), status
+
+
+def fb_props_many(query: np.ndarray, query_type: str = 'volume') -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """批量查询质量浓度、体积浓度、冰点和沸点, 最后一项为逐点状态码数组"""
+    query = np.asarray(query, dtype=np.float64)
+    keys, starts, deltas, row_valid = FB_ARRAYS[query_type]
+    key_col = FB_TABLE.index[query_type].key_col
+
+    # 与 FBTable.locate 一致: 取 bisect_left 所得位置的前一个区间
+    idx = np.searchsorted(keys, query, side='left')
+    in_range = (idx > 0) & (idx < len(keys))
+    seg = np.where(in_range, idx - 1, 0)
+    complete = row_valid[seg]
+
+    status = np.where(in_range, np.where(complete, Status.OK, Status.FB_DATA_GAP), Status.CONC_OUT_OF_RANGE).astype(np.int8)
+
+    start, delta = starts[seg], deltas[seg]
+    weight = (query - start[..., key_col]) / delta[..., key_col]
+    values = start + delta * weight[..., np.newaxis]
+
+    values[..., key_col] = query
+    values[status != Status.OK] = np.nan
+
+    return values[..., 0], values[..., 1], values[..., 2], values[..., 3], status
+
+
+def egasp_many(query_temp: np.ndarray, query_type: str, query_value: np.ndarray, interp: Optional[Interpolator] = None, lut=None) -> Tuple[tuple, np.ndarray]:
+    """
+    批量计算乙二醇水溶液的全部属性。
+
+    lut 为 egasp.lut.DenseLUT 时物性由查找表求值, 此时 interp 不再使用。
+    返回 8 个数组组成的元组以及逐点状态码数组 (egasp.errors.Status), 出错的数据点全部结果为 NaN。
+    """
+    query_temp, query_value = np.broadcast_arrays(np.asarray(query_temp, dtype=np.float64), np.asarray(query_value, dtype=np.float64))
+
+    mass, volume, freezing, boiling, status = fb_props_many(query_value, query_type)
+
+    if lut is not None:
+        props, props_status = lut.props_all_many(query_temp, volume)
+    else:
+        props, props_status = props_all_many(query_temp, volume, interp)
+
+    status = np.where(status == Status.OK, props_status, status)
+    status[np.isnan(query_temp) | np.isnan(query_value)] = Status.INVALID_INPUT
+
+    # 任一属性出错时整行置为 NaN, 与标量接口整体报错的语义一致
+    bad = status != Status.OK
+    props[bad] = np.nan
+    rho, cp, k, mu = np.moveaxis(props, -1, 0)
+    for arr in (mass, volume, freezing, boiling):
+        arr[bad] = np.nan
+
+    return (mass, volume, freezing, boiling, rho, cp, k, mu / 1000), status
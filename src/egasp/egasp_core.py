@@ -1,140 +1,351 @@
-import logging
 import sys
-import bisect
-from typing import Tuple
+from time import perf_counter
+from typing import Optional, Tuple
 
-from egasp.data.egasp_data import EGP
 from egasp.validate import Validate
+from egasp.errors import (Status, STATUS_ERRORS, EgaspError, InvalidParameterError, InvalidInputError, TempOutOfRangeError, ConcOutOfRangeError, DataGapError, FBDataGapError)
+from egasp.cache import QueryCache
+from egasp.fb_table import FB_COLUMNS, FB_TABLE
+from egasp.property_grid import PROP_KEYS, PROPERTY_GRID, compile_grid
+from egasp.interp import normalize_schemes, compile_interpolator
+from egasp.derived import OUTPUT_KEYS, normalize_props, select
 
 class EG_ASP_Core:
 
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
+    def __init__(self, on_error: str = 'exit', interp=None):
+        """
+        参数:
+        on_error (str): 查询出错时的处理方式。'exit' 记录错误日志并退出程序 (默认, 供命令行使用);
+            'raise' 抛出 egasp.errors 中对应的异常, 供库调用者自行处理。
+        interp (dict | str | None): 各物性的插值方案, 如 {'mu': 'log'}, 见 egasp.interp.SCHEMES。
+            默认全部为双线性插值。
+        """
+        if on_error not in ('exit', 'raise'):
+            raise ValueError(f"无效的错误处理方式 {on_error}，可选值: exit/raise")
+
+        self.on_error = on_error
         self.validate = Validate()
+        self.grid = PROPERTY_GRID
+        self.fb_table = FB_TABLE
+        self.cache = None  # 查询缓存, 默认关闭, 通过 enable_cache() 开启
+        self.lut_spec = None  # 稠密查找表分辨率, 默认关闭, 通过 enable_lut() 开启
+        self.stats = None  # 运行统计, 默认关闭, 通过 enable_stats() 开启
+        self.set_interp(interp)
 
-    @staticmethod
-    def _interpolate_linear(x1: float, y1: float, x2: float, y2: float, x: float) -> float:
-        """线性插值计算"""
-        try:
-            return y1 + (y2 - y1) * (x - x1) / (x2 - x1)
-        except ZeroDivisionError:
-            raise RuntimeError(f"插值节点间距为零 x1={x1}, x2={x2}")
+    @property
+    def logger(self):
+        """日志记录器, logging 仅在首次记录日志时导入, 不计入 import egasp 的耗时"""
+        import logging
 
-    def _error_exit(self, msg: str) -> None:
-        """记录错误日志并退出程序"""
-        self.logger.error(msg)
-        sys.exit()
+        return logging.getLogger(__name__)
 
-    def _find_nearest_nodes(self, nodes: list, value: float, name: str) -> Tuple[int, int]:
-        """查找最近的节点索引"""
-        try:
-            idx = bisect.bisect_right(nodes, value) - 1
-            lower_idx = max(idx, 0)
-            upper_idx = min(bisect.bisect_left(nodes, value), len(nodes) - 1)
+    def set_interp(self, interp=None) -> None:
+        """
+        设置各物性的插值方案, 如 {'rho': 'cubic', 'mu': 'logcubic'}; 传入单个方案名则对全部物性生效。
 
-            if not (nodes[lower_idx] <= value <= nodes[upper_idx]):
-                self._error_exit(f"{name} {value} 超出有效范围 [{nodes[0]}, {nodes[-1]}]")
+        系数表按方案组合编译一次后复用。切换方案会清空查询缓存。
+        """
+        self.schemes = normalize_schemes(interp)
+        self.interp = compile_interpolator(self.schemes)
+        self.cache_clear()
 
-            return lower_idx, upper_idx
-        except IndexError as e:
-            self._error_exit(f"节点索引错误: {str(e)}")
+    def enable_cache(self, maxsize: int = 4096, temp_decimals: int = 1, value_decimals: int = 1) -> None:
+        """
+        开启 get_egasp / get_props 的查询缓存。
 
-    def get_props(self, temp: float, conc: float, egp_key: str, temp_range: Tuple[int, int] = (-35, 125), conc_range: Tuple[float, float] = (10.0, 90.0), temp_step: int = 5, conc_step: float = 10.0) -> float:
-        """根据温度和浓度获取物性参数"""
-        if egp_key not in ['rho', 'cp', 'k', 'mu']:
-            self._error_exit(f"无效物性参数 {egp_key}，可选值: rho/cp/k/mu")
+        温度、浓度先按 temp_decimals / value_decimals 位小数取整再计算和缓存,
+        设为 None 则不量化。缓存为线程安全的 LRU, 超过 maxsize 条时淘汰最久未使用的条目。
+        重复调用会以新参数重建缓存。
+        """
+        self.cache = QueryCache(maxsize, temp_decimals, value_decimals)
 
-        # 生成数据节点
-        try:
-            temp_nodes = list(range(temp_range[0], temp_range[1] + 1, temp_step))
-            conc_nodes = [round(conc_range[0] + i * conc_step, 1) for i in range(int((conc_range[1] - conc_range[0]) / conc_step) + 1)]
-        except ValueError as e:
-            self._error_exit(f"参数范围错误: {str(e)}")
+    def disable_cache(self) -> None:
+        """关闭并丢弃查询缓存"""
+        self.cache = None
 
-        # 查找节点索引
-        t_lower_idx, t_upper_idx = self._find_nearest_nodes(temp_nodes, temp, "温度")
-        c_lower_idx, c_upper_idx = self._find_nearest_nodes(conc_nodes, conc, "浓度")
+    def cache_clear(self) -> None:
+        """清空缓存条目, 数据表变更后需要手动调用"""
+        if self.cache is not None:
+            self.cache.clear()
 
+    def cache_info(self) -> dict:
+        """缓存命中、未命中、淘汰次数等统计, 未开启缓存时返回空字典"""
+        return {} if self.cache is None else self.cache.info()
 
-        # 获取数据矩阵
-        data_matrix = EGP.get(egp_key)
+    def enable_stats(self) -> None:
+        """
+        开启运行统计 (见 egasp.stats.Stats): 记录 validate / fb_lookup / props / get_egasp / get_egasp_many
+        各阶段的调用次数、数据点数与累计耗时, 以及按状态码分类的出错次数。
 
-        # 提取四个角点数据
-        v11 = data_matrix[t_lower_idx][c_lower_idx]
-        v12 = data_matrix[t_lower_idx][c_upper_idx]
-        v21 = data_matrix[t_upper_idx][c_lower_idx]
-        v22 = data_matrix[t_upper_idx][c_upper_idx]
+        各阶段方法在 self.stats 不为 None 时计时, 未开启时只多一次判断; 校验器为 Validate 实例时
+        共享同一统计对象。重复调用会清空已有统计。
+        """
+        from egasp.stats import Stats
 
-        # 检查数据有效性
-        if any(v is None for v in [v11, v12, v21, v22]):
-            self._error_exit(f"温度 {temp}°C 浓度 {conc}% 附近存在数据缺失 (数据库本身缺失)")
+        self.stats = Stats()
+        if isinstance(self.validate, Validate):
+            self.validate.stats = self.stats
 
-        # 执行插值计算
-        t_lower, t_upper = temp_nodes[t_lower_idx], temp_nodes[t_upper_idx]
-        c_lower, c_upper = conc_nodes[c_lower_idx], conc_nodes[c_upper_idx]
+    def disable_stats(self) -> None:
+        """关闭并丢弃运行统计"""
+        self.stats = None
+        if isinstance(self.validate, Validate):
+            self.validate.stats = None
 
-        if t_lower == t_upper and c_lower == c_upper:
-            return v11
-        if t_lower == t_upper:
-            return self._interpolate_linear(c_lower, v11, c_upper, v12, conc)
-        if c_lower == c_upper:
-            return self._interpolate_linear(t_lower, v11, t_upper, v21, temp)
+    def stats_clear(self) -> None:
+        """清空统计数据, 保持统计开启"""
+        if self.stats is not None:
+            self.stats.reset()
 
-        v1 = self._interpolate_linear(c_lower, v11, c_upper, v12, conc)
-        v2 = self._interpolate_linear(c_lower, v21, c_upper, v22, conc)
+    def stats_info(self) -> dict:
+        """
+        运行统计 {'stages': {阶段: {'calls', 'points', 'total', 'mean'}}, 'errors': {状态码名称: 次数}, 'cache': cache_info()},
+        耗时单位为秒; 未开启统计时返回空字典
+        """
+        if self.stats is None:
+            return {}
+        return {**self.stats.info(), 'cache': self.cache_info()}
 
-        return self._interpolate_linear(t_lower, v1, t_upper, v2, temp)
+    def enable_lut(self, temp_res: float = 0.1, conc_res: float = 0.1, build: bool = False) -> None:
+        """
+        开启稠密查找表模式 (见 egasp.lut.DenseLUT), get_egasp / get_egasp_many 的物性改由细网格查找表求值。
+
+        查找表在首次查询时才构造 (build=True 时立即构造), 按分辨率与插值方案缓存复用。
+        默认 0.1°C × 0.1% 约占用 41 MB 内存, 误差可通过 lut_report() 查看。开启或关闭会清空查询缓存。
+        分辨率不是正数或估算内存超过 egasp.lut.MAX_NBYTES 时报错 (InvalidParameterError)。
+        """
+        from egasp.lut import estimate_nbytes
+
+        try:
+            estimate_nbytes(temp_res, conc_res)
+        except ValueError as e:
+            self._error_exit(str(e), InvalidParameterError)
+
+        self.lut_spec = (float(temp_res), float(conc_res))
+        self.cache_clear()
+        if build:
+            self._lut()
+
+    def disable_lut(self) -> None:
+        """关闭稠密查找表模式"""
+        self.lut_spec = None
+        self.cache_clear()
+
+    def _lut(self):
+        """当前分辨率与插值方案对应的查找表"""
+        from egasp.lut import get_lut
+
+        return get_lut(*self.lut_spec, self.interp)
+
+    def lut_report(self, samples: int = 200000, seed: int = 0) -> dict:
+        """查找表相对直接插值的误差报告, 见 DenseLUT.error_report; 未开启查找表时返回空字典"""
+        return {} if self.lut_spec is None else self._lut().error_report(samples, seed)
+
+    def _error_exit(self, msg: str, error: type = EgaspError) -> None:
+        """记录错误日志并退出程序, on_error='raise' 时改为抛出 error 类型的异常"""
+        if self.stats is not None:
+            # 按状态码 (无状态码时按异常类型) 计数
+            self.stats.count_error(error.status.name if error.status is not None else error.__name__)
+        if self.on_error == 'raise':
+            raise error(msg)
+        self.logger.error(msg)
+        sys.exit()
+
+    def get_props(self, temp: float, conc: float, egp_key: str, temp_range: Optional[Tuple[int, int]] = None, conc_range: Optional[Tuple[float, float]] = None, temp_step: Optional[int] = None, conc_step: Optional[float] = None) -> float:
+        """根据温度和浓度获取物性参数, 未给出的节点参数取数据文件中记录的坐标轴"""
+        stats = self.stats
+        start = perf_counter() if stats is not None else 0.0
+        try:
+            if egp_key not in PROP_KEYS:
+                self._error_exit(f"无效物性参数 {egp_key}，可选值: rho/cp/k/mu", InvalidParameterError)
+
+            # 获取预编译的数据网格, 默认参数直接复用导入时编译的网格 (与默认坐标轴相同的参数同样得到该网格)
+            grid = self.grid
+            if not (temp_range is conc_range is temp_step is conc_step is None):
+                try:
+                    grid = compile_grid(temp_range, conc_range, temp_step, conc_step)
+                except ValueError as e:
+                    self._error_exit(f"参数范围错误: {str(e)}", InvalidParameterError)
+
+            # 插值方案与缓存仅作用于默认网格
+            interp = self.interp if grid is self.grid else None
+            cache = self.cache if grid is self.grid else None
+            if cache is not None:
+                temp, conc = cache.quantize_temp(temp), cache.quantize_value(conc)
+                key = ('props', egp_key, temp, conc)
+                hit, value = cache.get(key)
+                if hit:
+                    return value
+
+            t_cell, c_cell = self._locate_cell(grid, temp, conc)
+
+            # 执行插值计算
+            value = (interp or grid).interpolate(egp_key, t_cell, c_cell)
+
+            # 检查数据有效性
+            if value is None:
+                self._error_exit(f"温度 {temp}°C 浓度 {conc}% 附近存在数据缺失 (数据库本身缺失)", DataGapError)
+
+            if cache is not None:
+                cache.put(key, value)
+
+            return value
+        finally:
+            if stats is not None:
+                stats.record('props', perf_counter() - start)
+
+    def get_props_all(self, temp: float, conc: float) -> Tuple[float, float, float, float]:
+        """根据温度和体积浓度一次性获取 (rho, cp, k, mu), 单位与数据表一致 (mu 为 mPa·s)"""
+        stats = self.stats
+        start = perf_counter() if stats is not None else 0.0
+        try:
+            if self.lut_spec is not None:
+                values, status = self._lut().props_all(temp, conc)
+                if status != Status.OK:
+                    # 复用常规路径的定位与报错信息
+                    self._locate_cell(self.grid, temp, conc)
+                    self._error_exit(f"温度 {temp}°C 浓度 {conc}% 附近存在数据缺失 (数据库本身缺失)", STATUS_ERRORS[status])
+                return values
+
+            t_cell, c_cell = self._locate_cell(self.grid, temp, conc)
+
+            # 一次定位、一组权重同时插值四个物性
+            values = (self.interp or self.grid).interpolate_all(t_cell, c_cell)
+
+            if None in values:
+                self._error_exit(f"温度 {temp}°C 浓度 {conc}% 附近存在数据缺失 (数据库本身缺失)", DataGapError)
+
+            return values
+        finally:
+            if stats is not None:
+                stats.record('props', perf_counter() - start)
+
+    def _locate_cell(self, grid, temp: float, conc: float) -> tuple:
+        """定位温度、浓度所在的插值单元, 超出范围时报错"""
+        t_cell = grid.locate_temp(temp)
+        if t_cell is None:
+            self._error_exit(f"温度 {temp} 超出有效范围 [{grid.temp_nodes[0]}, {grid.temp_nodes[-1]}]", TempOutOfRangeError)
+        c_cell = grid.locate_conc(conc)
+        if c_cell is None:
+            self._error_exit(f"浓度 {conc} 超出有效范围 [{grid.conc_nodes[0]}, {grid.conc_nodes[-1]}]", ConcOutOfRangeError)
+
+        return t_cell, c_cell
 
 
     def get_fb_props(self, query: float, query_type: str = 'volume') -> Tuple[float, float, float, float]:
         """根据浓度查询物性参数"""
-        if query_type not in ['mass', 'volume']:
-            self._error_exit(f"无效查询类型 {query_type}，必须为 'mass' 或 'volume'")
+        stats = self.stats
+        start = perf_counter() if stats is not None else 0.0
+        try:
+            if query_type not in ['mass', 'volume']:
+                self._error_exit(f"无效查询类型 {query_type}，必须为 'mass' 或 'volume'", InvalidParameterError)
 
-        data = EGP.get('fb')
+            # 查找相邻数据点所在区间
+            seg = self.fb_table.locate(query, query_type)
+            if seg < 0:
+                lower, upper = self.fb_table.key_range(query_type)
+                self._error_exit(f"浓度 {query}% 超出数据范围 [{lower}, {upper}]", ConcOutOfRangeError)
 
-        # 排序数据
-        sort_key = 1 if query_type == 'volume' else 0
-        sorted_data = sorted(data, key=lambda x: x[sort_key])
-        sorted_values = [item[sort_key] for item in sorted_data]
+            # 检查数据完整性
+            if not self.fb_table.is_complete(seg, query_type):
+                self._error_exit(f"浓度 {query}% 附近存在数据缺失 (数据库本身缺失)", FBDataGapError)
+
+            # 执行插值
+            return self.fb_table.interpolate(seg, query, query_type)
+        finally:
+            if stats is not None:
+                stats.record('fb_lookup', perf_counter() - start)
 
-        # 查找相邻数据点
-        try:
-            idx = bisect.bisect_left(sorted_values, query)
-            if idx == 0 or idx == len(sorted_data):
-                self._error_exit(f"浓度 {query}% 超出数据范围 [{sorted_values[0]}, {sorted_values[-1]}]")
 
-            prev, curr = sorted_data[idx - 1], sorted_data[idx]
-            p_val, c_val = prev[sort_key], curr[sort_key]
 
-            if not (p_val <= query <= c_val):
-                self._error_exit(f"浓度 {query}% 不在相邻数据点之间 [{p_val}, {c_val}]")
-        except Exception as e:
-            self._error_exit(f"数据查询失败: {str(e)}")
+    def get_fb_value(self, query: float, column: str, query_type: str = 'volume') -> float:
+        """
+        根据浓度查询冰点沸点表中的单列数值, 只要求该列数据完整。
 
-        # 解包数据
-        m1, v1, f1, b1 = prev
-        m2, v2, f2, b2 = curr
+        冰点数据缺失的区间 (体积浓度 57.8% ~ 78.9%, 质量浓度 60% ~ 80%) 内 get_fb_props 无法求值,
+        但仍可换算质量与体积浓度、查询沸点。
 
-        # 检查数据完整性
-        if any(v is None for v in [m1, v1, f1, b1, m2, v2, f2, b2]):
-            self._error_exit(f"浓度 {query}% 附近存在数据缺失 (数据库本身缺失)")
+        Parameters
+        ----------
+        query : float
+            查询的浓度值 (%), 类型由 query_type 指定。
+        column : str
+            查询的列, 可选值为 "mass"、"volume"、"freezing"、"boiling"。
+        query_type : str
+            查询浓度的类型, 必须为 "mass" 或 "volume", 默认值为 "volume"。
 
-        # 执行插值
-        if query_type == 'volume':
-            mass = self._interpolate_linear(v1, m1, v2, m2, query)
-            volume = query
-            freezing = self._interpolate_linear(v1, f1, v2, f2, query)
-            boiling = self._interpolate_linear(v1, b1, v2, b2, query)
-        else:
-            volume = self._interpolate_linear(m1, v1, m2, v2, query)
-            mass = query
-            freezing = self._interpolate_linear(m1, f1, m2, f2, query)
-            boiling = self._interpolate_linear(m1, b1, m2, b2, query)
+        Returns
+        -------
+        float
+            质量浓度、体积浓度 (%) 或冰点、沸点 (°C)。
+        """
+        stats = self.stats
+        start = perf_counter() if stats is not None else 0.0
+        try:
+            if query_type not in ['mass', 'volume']:
+                self._error_exit(f"无效查询类型 {query_type}，必须为 'mass' 或 'volume'", InvalidParameterError)
+            if column not in FB_COLUMNS:
+                self._error_exit(f"无效查询列 {column}，可选值: {'/'.join(FB_COLUMNS)}", InvalidParameterError)
+
+            seg = self.fb_table.locate(query, query_type)
+            if seg < 0:
+                lower, upper = self.fb_table.key_range(query_type)
+                self._error_exit(f"浓度 {query}% 超出数据范围 [{lower}, {upper}]", ConcOutOfRangeError)
+
+            value = self.fb_table.column(seg, query, column, query_type)
+            if value is None:
+                self._error_exit(f"浓度 {query}% 附近缺少{column}数据 (数据库本身缺失)", FBDataGapError)
+
+            return value
+        finally:
+            if stats is not None:
+                stats.record('fb_lookup', perf_counter() - start)
+
+    def get_fb_props_many(self, query, query_type: str = 'volume', with_status: bool = False) -> tuple:
+        """
+        get_fb_props 的批量版本, 结果与逐点调用 get_fb_props 一致。
 
-        return (mass, volume, freezing, boiling)
+        Parameters
+        ----------
+        query : array_like
+            查询的浓度值数组 (%), 类型由 query_type 指定。
+        query_type : str
+            查询浓度的类型, 必须为 "mass" 或 "volume", 对全部数据点生效, 默认值为 "volume"。
+        with_status : bool
+            为 True 时不因个别数据点出错而退出或抛出异常, 出错的数据点结果为 NaN,
+            并额外返回逐点状态码数组 (见 egasp.errors.Status), NaN 输入为 INVALID_INPUT。默认值为 False。
+
+        Returns
+        -------
+        tuple
+            mass, volume, freezing, boiling 四个 numpy.ndarray; with_status=True 时返回 (上述元组, status)。
+        """
+        import numpy as np
+        from egasp.egasp_batch import fb_props_many
+
+        stats = self.stats
+        start, points = perf_counter(), 0
+        try:
+            if query_type not in ['mass', 'volume']:
+                self._error_exit(f"无效查询类型 {query_type}，必须为 'mass' 或 'volume'", InvalidParameterError)
 
+            query = np.asarray(query, dtype=np.float64)
+            *result, status = fb_props_many(query, query_type)
+            status[np.isnan(query)] = Status.INVALID_INPUT
+            result = tuple(result)
+            points = status.size
 
+            if with_status:
+                if stats is not None:
+                    stats.count_status(status)
+                return result, status
+
+            self._check_status(status, lambda i: f"浓度 {query.ravel()[i]}%")
+
+            return result
+        finally:
+            if stats is not None:
+                stats.record('fb_lookup', perf_counter() - start, points)
 
     def get_egasp(self, query_temp: float, query_type: str = 'volume', query_value: float = 50) -> tuple:
         """
@@ -163,28 +374,280 @@ class EG_ASP_Core:
             - mu: 动力粘度 (Pa·s)
         """
 
-        # 校验查询类型, 确保其为合法值 ("volume" 或 "mass")
+        stats = self.stats
+        start = perf_counter() if stats is not None else 0.0
+        try:
+            # 校验查询类型, 确保其为合法值 ("volume" 或 "mass")
+            query_type = self.validate.type_value(query_type)
+
+            # 校验查询浓度, 确保其在 10% 到 90% 的范围内
+            query_value = self.validate.input_value(query_value, min_val=10, max_val=90)
+
+            # 校验查询温度, 确保其在 -35°C 到 125°C 的范围内
+            query_temp = self.validate.input_value(query_temp, min_val=-35, max_val=125)
+
+            if query_temp != query_temp or query_value != query_value:
+                self._error_exit(f"查询温度 {query_temp} 或浓度 {query_value} 不是有效数字", InvalidInputError)
+
+            # 开启缓存时先量化查询值, 命中则直接返回
+            cache = self.cache
+            if cache is not None:
+                query_temp, query_value = cache.quantize_temp(query_temp), cache.quantize_value(query_value)
+                key = ('egasp', query_type, query_temp, query_value)
+                hit, result = cache.get(key)
+                if hit:
+                    return result
+
+            # 根据查询类型调用相应的函数, 获取冰点和沸点属性
+            mass, volume, freezing, boiling = self.get_fb_props(query_value, query_type=query_type)
+
+            # 一次插值获取密度 (rho, kg/m³)、比热容 (cp, J/kg·K)、导热率 (k, W/m·K) 和动力粘度 (mu, mPa·s)
+            rho, cp, k, mu = self.get_props_all(temp=query_temp, conc=volume)
+
+            # 动力粘度单位从 mPa·s 转换为 Pa·s
+            mu = mu / 1000
+
+            result = (mass, volume, freezing, boiling, rho, cp, k, mu)
+            if cache is not None:
+                cache.put(key, result)
+
+            return result
+        finally:
+            if stats is not None:
+                stats.record('get_egasp', perf_counter() - start)
+
+    def get_egasp_props(self, query_temp: float, query_type: str = 'volume', query_value: float = 50, props=OUTPUT_KEYS) -> dict:
+        """
+        按名称选择 get_egasp 的输出及派生参数, 派生参数由同一次插值结果计算。
+
+        props 可选值为 mass/volume/freezing/boiling/rho/cp/k/mu 以及派生参数
+        nu (运动粘度 m²/s)、alpha (热扩散率 m²/s)、pr (普朗特数)、rho_cp (体积热容 J/m³·K),
+        默认返回全部。返回按 props 顺序排列的 {名称: 值} 字典。
+        """
+        props = self.check_outputs(props)
+        return select(self.get_egasp(query_temp, query_type, query_value), props)
+
+    def cursor(self, query_value: float = 50, query_type: str = 'volume'):
+        """
+        创建绑定固定浓度的查询游标 (见 egasp.cursor.EgaspCursor), 适用于温度逐步缓慢变化的瞬态计算。
+
+        游标记住当前温度单元及其插值系数, 温度仍在单元内时不再重新定位:
+            cur = eg.cursor(50, 'volume')
+            for t in temps:
+                mass, volume, freezing, boiling, rho, cp, k, mu = cur.get_egasp(t)
+        """
+        from egasp.cursor import EgaspCursor
+
+        return EgaspCursor(self, query_value, query_type)
+
+    def get_egasp_many(self, query_temp, query_type: str = 'volume', query_value=50, with_status: bool = False) -> tuple:
+        """
+        批量计算乙二醇水溶液的相关属性, 结果与逐点调用 get_egasp 一致。
+
+        Parameters
+        ----------
+        query_temp : array_like
+            查询的温度值数组, 范围为 -35°C 到 125°C。
+        query_type : str
+            查询浓度的类型, 可选值为 "volume" 或 "mass", 对全部数据点生效, 默认值为 "volume"。
+        query_value : array_like
+            查询的浓度值数组, 范围为 10% 到 90%, 默认值为 50。与 query_temp 按 NumPy 规则广播。
+        with_status : bool
+            为 True 时不因个别数据点出错而退出或抛出异常, 出错的数据点结果为 NaN,
+            并额外返回逐点状态码数组 (见 egasp.errors.Status)。默认值为 False。
+
+        Returns
+        -------
+        tuple
+            返回与 get_egasp 顺序相同的 8 个 numpy.ndarray：
+            mass, volume, freezing, boiling, rho, cp, k, mu
+            with_status=True 时返回 (上述元组, status)。
+        """
+        # numpy 仅在批量计算时导入, 不影响标量接口
+        import numpy as np
+        from egasp.egasp_batch import egasp_many
+
+        stats = self.stats
+        start, points = perf_counter(), 0
+        try:
+            query_type = self.validate.type_value(query_type)
+
+            result, status = egasp_many(query_temp, query_type, query_value, self.interp, None if self.lut_spec is None else self._lut())
+            points = status.size
+
+            if with_status:
+                # 出错数据点不经由 _error_exit, 按状态码计数
+                if stats is not None:
+                    stats.count_status(status)
+                return result, status
+
+            self._check_status(status, lambda i: f"温度 {np.broadcast_to(query_temp, status.shape).ravel()[i]}°C 浓度 {np.broadcast_to(query_value, status.shape).ravel()[i]}%")
+
+            return result
+        finally:
+            # 批量接口按数组大小计数据点
+            if stats is not None:
+                stats.record('get_egasp_many', perf_counter() - start, points)
+
+    def get_egasp_props_many(self, query_temp, query_type: str = 'volume', query_value=50, props=OUTPUT_KEYS, with_status: bool = False):
+        """
+        get_egasp_props 的批量版本, 返回 {名称: numpy.ndarray} 字典, 参数含义同 get_egasp_many。
+
+        派生参数在批量结果上直接以数组运算得到, 出错数据点的派生参数同样为 NaN。
+        with_status=True 时返回 (字典, status)。
+        """
+        props = self.check_outputs(props)
+        result = self.get_egasp_many(query_temp, query_type, query_value, with_status)
+
+        if with_status:
+            result, status = result
+            return select(result, props), status
+
+        return select(result, props)
+
+    def get_egasp_sweep(self, query_temp, query_type: str = 'volume', query_value=50, workers: Optional[int] = None, chunk_size: Optional[int] = None, with_status: bool = False) -> tuple:
+        """
+        多进程并行版本的 get_egasp_many, 适用于百万点以上的参数扫描, 结果与 get_egasp_many 一致。
+
+        输入按 chunk_size 个数据点分块交给 workers 个工作进程 (默认 CPU 核数), 物性表与输入输出数组
+        通过共享内存传递, 不在进程间复制。数据点不超过一个分块时直接在当前进程计算。
+        并行路径始终按插值方案直接计算, 不使用 enable_lut 的查表模式。其余参数与返回值同 get_egasp_many。
+        """
+        import numpy as np
+        from egasp.parallel import DEFAULT_CHUNK_SIZE, sweep_many
+
         query_type = self.validate.type_value(query_type)
 
-        # 校验查询浓度, 确保其在 10% 到 90% 的范围内
-        query_value = self.validate.input_value(query_value, min_val=10, max_val=90)
+        result, status = sweep_many(query_temp, query_type, query_value, self.schemes, workers, chunk_size or DEFAULT_CHUNK_SIZE)
+
+        if with_status:
+            return result, status
+
+        self._check_status(status, lambda i: f"温度 {np.broadcast_to(query_temp, status.shape).ravel()[i]}°C 浓度 {np.broadcast_to(query_value, status.shape).ravel()[i]}%")
 
-        # 校验查询温度, 确保其在 -35°C 到 125°C 的范围内
-        query_temp = self.validate.input_value(query_temp, min_val=-35, max_val=125)
+        return result
 
-        # 根据查询类型调用相应的函数, 获取冰点和沸点属性
-        mass, volume, freezing, boiling = self.get_fb_props(query_value, query_type=query_type)
+    def check_outputs(self, props) -> tuple:
+        """校验输出名称 (大小写不敏感, 可含派生参数), 返回规整后的名称元组, 含无效名称时报错 (InvalidParameterError)"""
+        props, unknown = normalize_props(props)
+        if unknown:
+            self._error_exit(f"无效输出参数 {', '.join(unknown)}，可选值: {'/'.join(OUTPUT_KEYS)}", InvalidParameterError)
+        return props
+
+    def _check_status(self, status, describe) -> None:
+        """批量计算存在出错数据点时按首个出错点报错, describe(i) 返回第 i 个数据点的描述"""
+        import numpy as np
+
+        bad = np.flatnonzero(status.ravel())
+        if len(bad):
+            first = bad[0]
+            code = Status(status.ravel()[first])
+            self._error_exit(f"共 {len(bad)} 个数据点超出有效范围或附近存在数据缺失, 首个位于第 {first} 个 ({code.name}): {describe(first)}", STATUS_ERRORS[code])
+
+    def solve_conc(self, query_temp, egp_key: str, target, query_type: str = 'volume', with_status: bool = False):
+        """
+        反查在给定温度下使物性达到目标值的浓度, 如由密度计读数求乙二醇浓度。
+
+        Parameters
+        ----------
+        query_temp : array_like
+            温度 (°C)。
+        egp_key : str
+            物性名称, 可选值为 rho/cp/k/mu。
+        target : array_like
+            目标物性值, 单位与 get_egasp 的返回值一致 (mu 为 Pa·s)。与 query_temp 按 NumPy 规则广播。
+        query_type : str
+            返回的浓度类型, "volume" 或 "mass", 默认值为 "volume"。
+        with_status : bool
+            为 True 时返回 (浓度数组, 状态码数组), 无解的数据点为 NaN, 不退出或抛出异常。
+
+        Returns
+        -------
+        numpy.ndarray
+            浓度 (%)。沿浓度方向存在多个解时返回最低的浓度。
+        """
+        import numpy as np
+        from egasp.inverse import solve_axis, convert_conc
+
+        egp_key = self._check_prop(egp_key)
+        query_type = self.validate.type_value(query_type)
+        target = np.asarray(target, dtype=np.float64) * (1000 if egp_key == 'mu' else 1)
+
+        conc, status = solve_axis('conc', query_temp, egp_key, target, self.interp)
+        if query_type == 'mass':
+            conc, conv_status = convert_conc(conc, 'volume', 'mass')
+            status = np.where(status == Status.OK, conv_status, status).astype(np.int8)
+
+        if with_status:
+            return conc, status
+
+        self._check_status(status, lambda i: f"温度 {np.broadcast_to(query_temp, status.shape).ravel()[i]}°C {egp_key} 目标值 {np.broadcast_to(target, status.shape).ravel()[i]}")
+
+        return conc
+
+    def solve_temp(self, query_value, egp_key: str, target, query_type: str = 'volume', with_status: bool = False):
+        """
+        反查在给定浓度下使物性达到目标值的温度, 如粘度达到泵送上限时的温度。
+
+        Parameters
+        ----------
+        query_value : array_like
+            浓度 (%), 类型由 query_type 指定。
+        egp_key : str
+            物性名称, 可选值为 rho/cp/k/mu。
+        target : array_like
+            目标物性值, 单位与 get_egasp 的返回值一致 (mu 为 Pa·s)。与 query_value 按 NumPy 规则广播。
+        query_type : str
+            浓度类型, "volume" 或 "mass", 默认值为 "volume"。
+        with_status : bool
+            为 True 时返回 (温度数组, 状态码数组), 无解的数据点为 NaN, 不退出或抛出异常。
+
+        Returns
+        -------
+        numpy.ndarray
+            温度 (°C)。沿温度方向存在多个解时返回最低的温度。
+        """
+        import numpy as np
+        from egasp.inverse import solve_axis, convert_conc
+
+        egp_key = self._check_prop(egp_key)
+        query_type = self.validate.type_value(query_type)
+        target = np.asarray(target, dtype=np.float64) * (1000 if egp_key == 'mu' else 1)
+
+        volume, status = convert_conc(query_value, query_type, 'volume')
+        temp, temp_status = solve_axis('temp', volume, egp_key, target, self.interp)
+        status = np.where(status == Status.OK, temp_status, status).astype(np.int8)
+        temp = np.where(status == Status.OK, temp, np.nan)
+
+        if with_status:
+            return temp, status
+
+        self._check_status(status, lambda i: f"浓度 {np.broadcast_to(query_value, status.shape).ravel()[i]}% {egp_key} 目标值 {np.broadcast_to(target, status.shape).ravel()[i]}")
+
+        return temp
+
+    def solve_freezing(self, freezing, query_type: str = 'volume', with_status: bool = False):
+        """
+        由冰点 (°C) 反查浓度, 存在两个解时返回较低的浓度。
+
+        with_status 为 True 时返回 (浓度数组, 状态码数组), 不退出或抛出异常。
+        """
+        import numpy as np
+        from egasp.inverse import solve_freezing
+
+        query_type = self.validate.type_value(query_type)
 
-        # 获取密度 (rho), 单位为 kg/m³
-        rho = self.get_props(temp=query_temp, conc=volume, egp_key='rho')
+        conc, status = solve_freezing(freezing, query_type)
 
-        # 获取比热容 (cp), 单位为 J/kg·K
-        cp = self.get_props(temp=query_temp, conc=volume, egp_key='cp')
+        if with_status:
+            return conc, status
 
-        # 获取导热率 (k), 单位为 W/m·K
-        k = self.get_props(temp=query_temp, conc=volume, egp_key='k')
+        self._check_status(status, lambda i: f"冰点 {np.broadcast_to(freezing, status.shape).ravel()[i]}°C")
 
-        # 获取动力粘度 (mu), 单位为 Pa·s, 并将结果从 mPa·s 转换为 Pa·s
-        mu = self.get_props(temp=query_temp, conc=volume, egp_key='mu') / 1000
+        return conc
 
-        return mass, volume, freezing, boiling, rho, cp, k, mu
+    def _check_prop(self, egp_key: str) -> str:
+        """校验物性名称"""
+        if egp_key not in PROP_KEYS:
+            self._error_exit(f"无效物性参数 {egp_key}，可选值: rho/cp/k/mu", InvalidParameterError)
+        return egp_key
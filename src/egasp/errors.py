@@ -0,0 +1,90 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-16 14:10:45 +0800
+LastEditTime : 2026-10-16 14:10:45 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/src/egasp/errors.py
+Description  : 查询错误的异常类型与批量计算的逐行状态码
+ -----------------------------------------------------------------------
+'''
+from enum import IntEnum
+
+
+class Status(IntEnum):
+    """批量计算中每个数据点的状态码"""
+    OK = 0
+    TEMP_OUT_OF_RANGE = 1   # 温度超出物性表范围
+    CONC_OUT_OF_RANGE = 2   # 浓度超出冰点沸点表或物性表范围
+    FB_DATA_GAP = 3         # 冰点沸点表在该浓度附近存在缺失数据
+    DATA_GAP = 4            # 物性表在该温度、浓度附近存在缺失数据
+    INVALID_INPUT = 5       # 输入不是有效数字 (NaN)
+    NO_SOLUTION = 6         # 反查时目标值不在可达范围内
+
+
+class EgaspError(Exception):
+    """egasp 查询错误的基类"""
+    status = None
+
+
+class InvalidParameterError(EgaspError, ValueError):
+    """无效的查询类型或物性名称"""
+
+
+class OutOfRangeError(EgaspError, ValueError):
+    """查询值超出数据库范围"""
+
+
+class TempOutOfRangeError(OutOfRangeError):
+    """温度超出范围"""
+    status = Status.TEMP_OUT_OF_RANGE
+
+
+class ConcOutOfRangeError(OutOfRangeError):
+    """浓度超出范围"""
+    status = Status.CONC_OUT_OF_RANGE
+
+
+class DataGapError(EgaspError, LookupError):
+    """数据库本身缺失数据"""
+    status = Status.DATA_GAP
+
+
+class FBDataGapError(DataGapError):
+    """冰点沸点表缺失数据"""
+    status = Status.FB_DATA_GAP
+
+
+class InvalidInputError(EgaspError, ValueError):
+    """输入不是有效数字"""
+    status = Status.INVALID_INPUT
+
+
+class NoSolutionError(OutOfRangeError):
+    """反查时目标值不在可达范围内"""
+    status = Status.NO_SOLUTION
+
+
+# 状态码对应的异常类型
+STATUS_ERRORS = {
+    Status.TEMP_OUT_OF_RANGE: TempOutOfRangeError,
+    Status.CONC_OUT_OF_RANGE: ConcOutOfRangeError,
+    Status.FB_DATA_GAP: FBDataGapError,
+    Status.DATA_GAP: DataGapError,
+    Status.INVALID_INPUT: InvalidInputError,
+    Status.NO_SOLUTION: NoSolutionError,
+}
@@ -0,0 +1,298 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-16 21:05:33 +0800
+LastEditTime : 2026-10-16 21:05:33 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/src/egasp/excel.py
+Description  : Excel 加载项的调用接口: 单次查询、常驻工作进程与批量请求文件
+ -----------------------------------------------------------------------
+'''
+# 单次查询 (--excel) 每次调用都会启动新进程, 模块级只导入计算核心, 其余依赖在用到时导入
+import os
+import sys
+from itertools import count
+from typing import Dict, Optional, Sequence, TextIO
+
+from egasp.egasp_core import EG_ASP_Core
+from egasp.errors import EgaspError, Status
+from egasp.derived import OUTPUT_KEYS
+from egasp.version import __version__
+
+# 输入有误或超出数据库范围时返回给 Excel 的标记, 与加载项的错误提示一致
+NO_OUTPUT = '#NO_OUTPUT'
+
+# 未指定请求编号时的结果文件名, 与旧版加载项兼容
+LEGACY_OUTPUT = 'egasp_output.tmp'
+
+# 常驻工作进程默认空闲超时, 单位: 秒
+DEFAULT_IDLE_TIMEOUT = 300.0
+
+# 同一进程内临时文件名的序号
+_tmp_seq = count()
+
+
+class UsageError(ValueError):
+    """命令行参数错误"""
+
+
+def parse_options(argv: Sequence[str], required: Sequence[str], optional: Sequence[str] = ()) -> Dict[str, str]:
+    """
+    解析 --name=value 或 --name value 形式的参数, 返回 {name: value}。
+
+    仅供机器调用的入口使用, 比 argparse 少一次模块导入与解析器构建; 缺少必需参数或存在未知参数时抛出 UsageError。
+    """
+    names = set(required) | set(optional)
+    options, args = {}, list(argv)
+    while args:
+        arg = args.pop(0)
+        if not arg.startswith('--'):
+            raise UsageError(f"无法识别的参数 {arg}")
+        name, sep, value = arg[2:].partition('=')
+        if name not in names:
+            raise UsageError(f"未知参数 --{name}")
+        if not sep:
+            if not args:
+                raise UsageError(f"参数 --{name} 缺少取值")
+            value = args.pop(0)
+        options[name] = value
+
+    missing = [name for name in required if name not in options]
+    if missing:
+        raise UsageError(f"缺少参数 {', '.join('--' + name for name in missing)}")
+    return options
+
+
+def evaluate(eg: EG_ASP_Core, query_type: str, query_value: str, query_temp: str, prop: str) -> str:
+    """计算单个属性并格式化为返回给 Excel 的文本, 出错时返回 NO_OUTPUT; eg 需以 on_error='raise' 创建"""
+    try:
+        prop = prop.strip().lower()
+        result = eg.get_egasp_props(float(query_temp), query_type.strip(), float(query_value), (prop,))
+    except (EgaspError, ValueError):
+        return NO_OUTPUT
+    return str(result[prop])
+
+
+def write_atomic(path: str, text: str, retries: int = 5) -> None:
+    """
+    先写入同目录下的临时文件再重命名为 path, 读取方只会看到完整的旧文件或新文件。
+
+    Windows 上目标文件正被读取时重命名会失败, 短暂等待后重试。
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    # 进程号与进程内序号保证临时文件名唯一, O_EXCL 防止意外覆盖
+    tmp_path = os.path.join(directory, f'.{name}.{os.getpid()}.{next(_tmp_seq)}.part')
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+        for attempt in range(retries):
+            try:
+                os.replace(tmp_path, path)
+                return
+            except PermissionError:
+                if attempt == retries - 1:
+                    raise
+                import time
+                time.sleep(0.01 * (attempt + 1))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def output_path(request_id: Optional[str], output: Optional[str] = None) -> str:
+    """
+    单次查询的结果文件路径: 优先使用 output, 否则为程序所在目录下的 egasp_output_<request_id>.tmp,
+    未指定请求编号时为旧版加载项读取的 egasp_output.tmp。
+    """
+    if output:
+        return output
+    name = LEGACY_OUTPUT if request_id is None else f'egasp_output_{request_id}.tmp'
+    return os.path.join(os.path.dirname(sys.argv[0]), name)
+
+
+def entry_main(argv=None) -> None:
+    """
+    用于 Excel 调用的入口函数，接收参数并输出单一属性值到临时文件
+    使用方式：
+        egasp.exe --excel --type=volume --value=50 --temp=25 --prop=rho --id=<请求编号>
+    指定 --id 时结果写入各自的 egasp_output_<id>.tmp, --id=auto 时自动生成编号,
+    并在结果之后输出一行 "<编号> <结果文件路径>"; 并发调用互不覆盖, 可开启 Excel 多线程重算。
+    结果文件先写入临时文件再重命名, 读取方不会读到写了一半的内容。出错时结果为 #NO_OUTPUT。
+    """
+    try:
+        args = parse_options(sys.argv[1:] if argv is None else argv, ('type', 'value', 'temp', 'prop'), ('id', 'output'))
+        # 随机编号直接取自 os.urandom, 不导入 uuid
+        request_id = os.urandom(16).hex() if args.get('id') == 'auto' else args.get('id')
+        if request_id is not None:
+            import re
+
+            # 仅允许 ASCII 字母、数字、- 和 _ (str.isalnum 会放行其他文字的字母与数字), 编号直接作为文件名的一部分
+            if not re.fullmatch(r'[A-Za-z0-9_-]{1,64}', request_id):
+                raise UsageError(f"请求编号只能包含 1 ~ 64 个字母、数字、- 和 _: {request_id}")
+    except UsageError as e:
+        sys.exit(f"egasp --excel: {e}\n用法: egasp --excel --type=volume --value=50 --temp=25 --prop=rho [--id=<请求编号>|auto] [--output=<路径>]")
+
+    # 基本属性与派生参数 (pr/nu/alpha/rho_cp) 均可按名称选择
+    result = evaluate(EG_ASP_Core(on_error='raise'), args['type'], args['value'], args['temp'], args['prop'])
+
+    path = output_path(request_id, args.get('output'))
+    write_atomic(path, result)
+
+    print(result)
+    if request_id is not None:
+        print(request_id, path)
+
+
+def _fields(line: str) -> list:
+    """拆分请求行, 字段以制表符或逗号分隔"""
+    line = line.strip()
+    return line.split('\t') if '\t' in line else line.split(',')
+
+
+def serve(eg: EG_ASP_Core, instream: TextIO, outstream: TextIO, idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT) -> int:
+    """
+    常驻工作进程的请求循环, 返回处理的查询数。
+
+    每行一个请求 "type,value,temp,prop" (也可用制表符分隔), 按顺序每行返回一个结果并立即刷新,
+    出错时返回 NO_OUTPUT。PING 返回 PONG, QUIT 或输入结束时退出, 空行忽略。
+    idle_timeout 秒内没有新请求时退出, None 或 0 表示不超时。
+    """
+    import queue
+    from egasp._io import start_reader
+
+    lines = start_reader(instream)
+
+    count = 0
+    while True:
+        try:
+            line = lines.get(timeout=idle_timeout or None)
+        except queue.Empty:
+            break
+        if line is None:
+            break
+
+        line = line.strip()
+        if not line:
+            continue
+        command = line.upper()
+        if command == 'QUIT':
+            break
+        if command == 'PING':
+            reply = 'PONG'
+        else:
+            fields = _fields(line)
+            reply = evaluate(eg, *fields) if len(fields) == 4 else NO_OUTPUT
+            count += 1
+
+        outstream.write(reply + '\n')
+        outstream.flush()
+
+    return count
+
+
+def evaluate_batch(eg: EG_ASP_Core, requests: list) -> list:
+    """
+    批量计算请求 [(type, value, temp, prop), ...], 返回逐行对齐的结果文本, 出错行为 NO_OUTPUT。
+
+    同一浓度类型的请求合并为一次 get_egasp_props_many 向量化计算, 结果与逐行调用 evaluate 一致。
+    """
+    # 延迟导入, 单次查询与常驻进程不需要 numpy
+    import numpy as np
+
+    n = len(requests)
+    replies = [NO_OUTPUT] * n
+    temp, value = np.full(n, np.nan), np.full(n, np.nan)
+    types, props = [None] * n, [None] * n
+
+    for i, fields in enumerate(requests):
+        if len(fields) != 4:
+            continue
+        query_type, query_value, query_temp, prop = (f.strip() for f in fields)
+        prop = prop.lower()
+        try:
+            value[i], temp[i] = float(query_value), float(query_temp)
+        except ValueError:
+            continue
+        if prop in OUTPUT_KEYS:
+            # 浓度类型经由与逐行调用相同的校验器规整, 无效类型按默认值 volume 处理
+            types[i], props[i] = eg.validate.type_value(query_type), prop
+
+    for query_type in ('volume', 'mass'):
+        rows = [i for i in range(n) if types[i] == query_type]
+        if not rows:
+            continue
+        wanted = tuple(sorted({props[i] for i in rows}))
+        result, status = eg.get_egasp_props_many(temp[rows], query_type, value[rows], wanted, with_status=True)
+        columns = {p: result[p].tolist() for p in wanted}
+        for j, (i, code) in enumerate(zip(rows, status.tolist())):
+            if code == Status.OK:
+                replies[i] = str(columns[props[i]][j])
+
+    return replies
+
+
+def batch_main(argv=None) -> None:
+    """
+    Excel 批量请求文件入口, 一次进程启动计算整个区域
+    使用方式：
+        egasp.exe --excel-batch --input=requests.txt --output=results.txt
+    未指定 --output 时结果写入请求文件所在目录下的 <请求文件名>_output.tmp (如 requests_output.tmp)。
+    请求文件每行 "type,value,temp,prop" (也可用制表符分隔), 结果文件每行对应一个请求, 出错行为 #NO_OUTPUT。
+    """
+    import argparse
+    import logging
+
+    parser = argparse.ArgumentParser(prog='egasp --excel-batch')
+    parser.add_argument('--input', type=str, required=True, help='请求文件路径')
+    parser.add_argument('--output', type=str, default=None, help='结果文件路径, 默认为请求文件所在目录下的 <请求文件名>_output.tmp')
+    args = parser.parse_args(argv)
+
+    logging.getLogger('egasp').setLevel(logging.ERROR)
+
+    with open(args.input, encoding='utf-8-sig') as f:
+        requests = [_fields(line) for line in f.read().splitlines()]
+
+    replies = evaluate_batch(EG_ASP_Core(on_error='raise'), requests)
+
+    # 默认结果文件按请求文件命名, 不同请求文件的结果不会写入同一个 egasp_output.tmp
+    path = args.output or os.path.splitext(os.path.abspath(args.input))[0] + '_output.tmp'
+    write_atomic(path, '\n'.join(replies) + '\n')
+
+    print(path)
+
+
+def worker_main(argv=None) -> None:
+    """
+    Excel 常驻工作进程入口, 引擎只加载一次, 通过标准输入输出逐行应答
+    使用方式：
+        egasp.exe --excel-worker --idle-timeout=300
+    启动完成后先输出一行 "READY egasp <版本号>"。
+    """
+    import argparse
+    from egasp._io import reply_stdout
+
+    parser = argparse.ArgumentParser(prog='egasp --excel-worker')
+    parser.add_argument('--idle-timeout', type=float, default=DEFAULT_IDLE_TIMEOUT, help='空闲超时 (秒), 0 表示不超时')
+    args = parser.parse_args(argv)
+
+    with reply_stdout() as out:
+        eg = EG_ASP_Core(on_error='raise')
+        out.write(f"READY egasp {__version__}\n")
+        out.flush()
+        serve(eg, sys.stdin, out, args.idle_timeout)
@@ -0,0 +1,54 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-16 21:56:02 +0800
+LastEditTime : 2026-10-16 21:56:02 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/src/egasp/fast.py
+Description  : 供脚本等机器调用的快速入口, 只加载计算核心, 直接输出数值
+ -----------------------------------------------------------------------
+'''
+import sys
+
+from egasp.egasp_core import EG_ASP_Core
+from egasp.excel import NO_OUTPUT, UsageError, evaluate, parse_options
+
+USAGE = "用法: egasp-fast --type=volume --value=50 --temp=25 --prop=rho"
+
+
+def main(argv=None) -> int:
+    """
+    快速入口, 不导入 rich、日志配置与更新检查, 不写结果文件, 只向标准输出打印数值
+    使用方式：
+        egasp-fast --type=volume --value=50 --temp=25 --prop=rho
+    --prop 可为 mass/volume/freezing/boiling/rho/cp/k/mu 及派生参数 nu/alpha/pr/rho_cp。
+    查询出错时输出 #NO_OUTPUT 并返回 1, 参数错误时返回 2。
+    """
+    try:
+        args = parse_options(sys.argv[1:] if argv is None else argv, ('type', 'value', 'temp', 'prop'))
+    except UsageError as e:
+        print(f"egasp-fast: {e}\n{USAGE}", file=sys.stderr)
+        return 2
+
+    result = evaluate(EG_ASP_Core(on_error='raise'), args['type'], args['value'], args['temp'], args['prop'])
+    print(result)
+
+    return 1 if result == NO_OUTPUT else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-16 11:20:37 +0800
+LastEditTime : 2026-10-16 11:20:37 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/src/egasp/fb_table.py
+Description  : 预计算的质量/体积浓度换算及冰点、沸点查找表
+ -----------------------------------------------------------------------
+'''
+import bisect
+from typing import Optional, Tuple
+
+from egasp.data.egasp_data import STORE
+
+# eg_fb 各列含义
+FB_COLUMNS = ('mass', 'volume', 'freezing', 'boiling')
+
+
+class _FBIndex:
+    """以某一浓度列为自变量的单调查找表, 预先保存每个区间的起点、差分与有效性"""
+
+    def __init__(self, rows: list, key_col: int):
+        rows = sorted(rows, key=lambda row: row[key_col])
+
+        self.key_col = key_col
+        self.keys = tuple(row[key_col] for row in rows)
+
+        # 区间 j 位于 rows[j] 与 rows[j + 1] 之间
+        self.starts = []
+        self.deltas = []
+        self.col_valid = []
+        self.row_valid = []
+        for prev, curr in zip(rows[:-1], rows[1:]):
+            valid = tuple(p is not None and c is not None for p, c in zip(prev, curr))
+            self.starts.append(prev)
+            self.deltas.append(tuple(c - p if ok else None for p, c, ok in zip(prev, curr, valid)))
+            self.col_valid.append(valid)
+            self.row_valid.append(all(valid))
+
+        self.starts = tuple(self.starts)
+        self.deltas = tuple(self.deltas)
+        self.col_valid = tuple(self.col_valid)
+        self.row_valid = tuple(self.row_valid)
+
+
+class FBTable:
+    """
+    冰点沸点表 (eg_fb) 的查找结构, 在构造时按质量、体积浓度分别排序并预计算插值区间。
+
+    区间定位与原 get_fb_props 一致: 取 bisect_left 所得位置的前一个与当前数据点,
+    因此查询值等于首个数据点或大于末尾数据点时视为超出范围。
+    """
+
+    def __init__(self, fb_rows: list):
+        self.index = {
+            'mass': _FBIndex(fb_rows, 0),
+            'volume': _FBIndex(fb_rows, 1),
+        }
+
+    def locate(self, query: float, query_type: str = 'volume') -> int:
+        """返回查询值所在区间的下标, 超出数据范围时返回 -1"""
+        keys = self.index[query_type].keys
+        idx = bisect.bisect_left(keys, query)
+        if idx == 0 or idx == len(keys):
+            return -1
+        return idx - 1
+
+    def key_range(self, query_type: str = 'volume') -> Tuple[float, float]:
+        """查询浓度列的数据范围"""
+        keys = self.index[query_type].keys
+        return keys[0], keys[-1]
+
+    def is_complete(self, seg: int, query_type: str = 'volume') -> bool:
+        """区间两端数据点是否完整 (无缺失)"""
+        return self.index[query_type].row_valid[seg]
+
+    def interpolate(self, seg: int, query: float, query_type: str = 'volume') -> Tuple[float, float, float, float]:
+        """在完整区间内插值得到 (mass, volume, freezing, boiling)"""
+        index = self.index[query_type]
+        key_col = index.key_col
+
+        start = index.starts[seg]
+        delta = index.deltas[seg]
+        weight = (query - start[key_col]) / delta[key_col]
+
+        m = start[0] + delta[0] * weight
+        v = start[1] + delta[1] * weight
+        f = start[2] + delta[2] * weight
+        b = start[3] + delta[3] * weight
+
+        if key_col == 1:
+            return m, query, f, b
+        return query, v, f, b
+
+    def column(self, seg: int, query: float, column: str, query_type: str = 'volume') -> Optional[float]:
+        """在区间内仅插值单列数值 (见 FB_COLUMNS), 只要求该列与查询列数据完整, 否则返回 None"""
+        index = self.index[query_type]
+        col = FB_COLUMNS.index(column)
+        key_col = index.key_col
+        if not (index.col_valid[seg][col] and index.col_valid[seg][key_col]):
+            return None
+
+        start = index.starts[seg]
+        delta = index.deltas[seg]
+        return start[col] + delta[col] * ((query - start[key_col]) / delta[key_col])
+
+
+# 导入时一次性构建, 直接读取内存映射的数据表, 不经过 EGP 兼容视图 (不缓存嵌套列表)
+FB_TABLE = FBTable(STORE.rows('fb'))
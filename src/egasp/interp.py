@@ -0,0 +1,202 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-16 15:30:08 +0800
+LastEditTime : 2026-10-16 15:30:08 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/src/egasp/interp.py
+Description  : 按物性选择的插值方案 (双线性 / 对数 / 单调双三次), 系数在构造时预计算
+ -----------------------------------------------------------------------
+'''
+import math
+from array import array
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from egasp.property_grid import PROP_KEYS, PROPERTY_GRID, PropertyGrid
+
+# 可选插值方案
+# linear   : 双线性插值 (默认, 与原 get_props 一致)
+# log      : 对物性取对数后双线性插值, 适用于跨数量级变化的粘度
+# cubic    : 单调双三次 Hermite 插值, 节点导数按 Fritsch-Carlson 方法限幅
+# logcubic : 对物性取对数后做单调双三次插值
+SCHEMES = ('linear', 'log', 'cubic', 'logcubic')
+
+# 双三次 Hermite 系数矩阵, 系数 A = M · F · Mᵀ
+_HERMITE = ((1, 0, 0, 0), (0, 0, 1, 0), (-3, 3, -2, -1), (2, -2, 1, 1))
+
+
+def _monotone_slope(prev: Optional[float], curr: Optional[float], next_: Optional[float]) -> float:
+    """等间距节点上的单调限幅导数 (以单元宽度为单位), 缺失一侧时取单侧差分"""
+    if curr is None:
+        return 0.0
+    d_prev = None if prev is None else curr - prev
+    d_next = None if next_ is None else next_ - curr
+
+    if d_prev is None and d_next is None:
+        return 0.0
+    if d_prev is None:
+        return d_next
+    if d_next is None:
+        return d_prev
+    if d_prev * d_next <= 0:
+        return 0.0
+    return 2 * d_prev * d_next / (d_prev + d_next)
+
+
+def _matmul(a: tuple, b: tuple) -> tuple:
+    return tuple(tuple(sum(a[i][k] * b[k][j] for k in range(4)) for j in range(4)) for i in range(4))
+
+
+class CubicTable:
+    """
+    单个物性的单调双三次系数表。
+
+    每个单元存储 16 个系数 a[i * 4 + j], 单元内 p(u, v) = Σ a[i * 4 + j] · uⁱ · vʲ,
+    u、v 分别为温度、浓度方向的单元内相对坐标 [0, 1]。角点存在缺失数据的单元系数为 None。
+    """
+
+    def __init__(self, grid: PropertyGrid, values: tuple):
+        nt, nc = grid.n_temp, grid.n_conc
+        self.n_temp, self.n_conc = nt, nc
+
+        def node(i, j):
+            if 0 <= i < nt and 0 <= j < nc:
+                return values[i * nc + j]
+            return None
+
+        # 节点函数值及两个方向的导数, 交叉导数取 0
+        f = [[node(i, j) for j in range(nc)] for i in range(nt)]
+        fu = [[_monotone_slope(node(i - 1, j), node(i, j), node(i + 1, j)) for j in range(nc)] for i in range(nt)]
+        fv = [[_monotone_slope(node(i, j - 1), node(i, j), node(i, j + 1)) for j in range(nc)] for i in range(nt)]
+
+        m_t = tuple(zip(*_HERMITE))
+        cells = []
+        for i in range(nt - 1):
+            for j in range(nc - 1):
+                if None in (f[i][j], f[i][j + 1], f[i + 1][j], f[i + 1][j + 1]):
+                    cells.append(None)
+                    continue
+                F = (
+                    (f[i][j], f[i][j + 1], fv[i][j], fv[i][j + 1]),
+                    (f[i + 1][j], f[i + 1][j + 1], fv[i + 1][j], fv[i + 1][j + 1]),
+                    (fu[i][j], fu[i][j + 1], 0.0, 0.0),
+                    (fu[i + 1][j], fu[i + 1][j + 1], 0.0, 0.0),
+                )
+                a = _matmul(_matmul(_HERMITE, F), m_t)
+                cells.append(tuple(a[r][c] for r in range(4) for c in range(4)))
+
+        self.cells = tuple(cells)
+
+    def evaluate(self, t_cell: Tuple[int, int, float], c_cell: Tuple[int, int, float]) -> Optional[float]:
+        """在已定位的单元内求值, 单元不完整时返回 None"""
+        # 恰好位于最后一个节点时使用前一个单元的 u = 1 处
+        ci = min(t_cell[0], self.n_temp - 2)
+        cj = min(c_cell[0], self.n_conc - 2)
+        a = self.cells[ci * (self.n_conc - 1) + cj]
+        if a is None:
+            return None
+
+        u = t_cell[0] + t_cell[2] - ci
+        v = c_cell[0] + c_cell[2] - cj
+
+        r0 = a[0] + v * (a[1] + v * (a[2] + v * a[3]))
+        r1 = a[4] + v * (a[5] + v * (a[6] + v * a[7]))
+        r2 = a[8] + v * (a[9] + v * (a[10] + v * a[11]))
+        r3 = a[12] + v * (a[13] + v * (a[14] + v * a[15]))
+
+        return r0 + u * (r1 + u * (r2 + u * r3))
+
+
+class Interpolator:
+    """
+    按物性组合插值方案的求值器, 与 PropertyGrid 共用单元定位与有效性掩码。
+
+    对数方案的节点值在构造时取对数; 双三次方案的单元系数在构造时预计算。
+    双三次单元角点存在缺失数据时 (仅出现在缺失区域边缘的节点线上) 退化为双线性插值,
+    双线性也无法求值时返回 None, 与默认方案的缺失判断一致。
+    """
+
+    def __init__(self, grid: PropertyGrid, schemes: Tuple[str, ...]):
+        self.grid = grid
+        self.schemes = schemes
+
+        self.log_props = tuple(p for p, scheme in enumerate(schemes) if scheme in ('log', 'logcubic'))
+        self.cubic_props = tuple(p for p, scheme in enumerate(schemes) if scheme in ('cubic', 'logcubic'))
+
+        # 对数方案的节点值取对数, 布局与网格的 values 相同, 缺失数据为 NaN; 其余物性直接使用网格的 values
+        self.values = tuple(
+            array('d', (math.log(v) if v == v else v for v in plane)) if p in self.log_props else plane
+            for p, plane in enumerate(grid.values)
+        )
+        self.cubic = {
+            p: CubicTable(grid, tuple(None if v != v else v for v in grid.node_values(self.values[p])))
+            for p in self.cubic_props
+        }
+
+    def __reduce__(self):
+        # 未取对数的物性直接引用网格的 values (内存映射), 按网格与方案在目标进程中重新构造
+        return Interpolator, (self.grid, self.schemes)
+
+    def _finish(self, p: int, value: Optional[float], t_cell: Tuple[int, int, float], c_cell: Tuple[int, int, float]) -> Optional[float]:
+        """在双线性结果的基础上应用双三次与对数变换"""
+        if value is None:
+            return None
+        if p in self.cubic:
+            cubic = self.cubic[p].evaluate(t_cell, c_cell)
+            if cubic is not None:
+                value = cubic
+        if p in self.log_props:
+            value = math.exp(value)
+        return value
+
+    def interpolate(self, egp_key: str, t_cell: Tuple[int, int, float], c_cell: Tuple[int, int, float]) -> Optional[float]:
+        """在已定位的单元内对单个物性插值, 无法求值时返回 None"""
+        p = PROP_KEYS.index(egp_key)
+        return self._finish(p, self.grid.bilinear(self.values, p, t_cell, c_cell), t_cell, c_cell)
+
+    def interpolate_all(self, t_cell: Tuple[int, int, float], c_cell: Tuple[int, int, float]) -> Tuple[Optional[float], ...]:
+        """在已定位的单元内一次性插值 (rho, cp, k, mu), 无法求值的物性为 None"""
+        values = self.grid.bilinear_all(self.values, t_cell, c_cell)
+        return tuple(self._finish(p, value, t_cell, c_cell) for p, value in enumerate(values))
+
+
+def normalize_schemes(interp) -> Tuple[str, ...]:
+    """将 {物性: 方案} 字典或单个方案名转换为按 PROP_KEYS 排列的方案元组"""
+    if interp is None:
+        interp = {}
+    if isinstance(interp, str):
+        interp = {key: interp for key in PROP_KEYS}
+
+    unknown = set(interp) - set(PROP_KEYS)
+    if unknown:
+        raise ValueError(f"无效物性参数 {', '.join(sorted(unknown))}，可选值: rho/cp/k/mu")
+
+    schemes = tuple(interp.get(key, 'linear') for key in PROP_KEYS)
+    for scheme in schemes:
+        if scheme not in SCHEMES:
+            raise ValueError(f"无效插值方案 {scheme}，可选值: {'/'.join(SCHEMES)}")
+
+    return schemes
+
+
+@lru_cache(maxsize=None)
+def compile_interpolator(schemes: Tuple[str, ...]) -> Optional[Interpolator]:
+    """按方案编译默认网格的求值器, 全部为双线性时返回 None (直接使用 PropertyGrid)"""
+    if all(scheme == 'linear' for scheme in schemes):
+        return None
+    return Interpolator(PROPERTY_GRID, schemes)
@@ -0,0 +1,160 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-16 16:45:51 +0800
+LastEditTime : 2026-10-16 16:45:51 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/src/egasp/inverse.py
+Description  : 物性反查: 由目标物性值求浓度或温度, 由冰点求浓度 (向量化)
+ -----------------------------------------------------------------------
+'''
+from typing import Optional, Tuple
+
+import numpy as np
+
+from egasp.errors import Status
+from egasp.fb_table import FB_TABLE
+from egasp.interp import Interpolator
+from egasp.property_grid import PROP_KEYS, PROPERTY_GRID
+from egasp.egasp_batch import FB_ARRAYS, fb_props_many, props_all_many
+
+# 双三次方案在区间内二分求根的迭代次数, 2⁻⁴⁸ 个单元宽度已低于浮点误差
+BISECT_ITERATIONS = 48
+
+
+def _first_bracket(line: np.ndarray, target: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    在沿坐标轴排列的节点值 line (..., n) 中查找首个包含 target 的区间。
+
+    返回区间下标以及是否找到的掩码。两端存在 NaN 的区间跳过。
+    """
+    lo, hi = line[..., :-1], line[..., 1:]
+    t = target[..., np.newaxis]
+    hit = ((lo - t) * (hi - t) <= 0) & ~np.isnan(lo) & ~np.isnan(hi)
+
+    found = hit.any(axis=-1)
+    seg = np.argmax(hit, axis=-1)
+
+    return seg, found
+
+
+def _solve_segment(lo: np.ndarray, hi: np.ndarray, target: np.ndarray, log: bool) -> np.ndarray:
+    """区间内线性 (或对数线性) 插值的解析反解, 返回区间内相对位置 [0, 1]"""
+    if log:
+        lo, hi, target = np.log(lo), np.log(hi), np.log(target)
+    span = hi - lo
+    with np.errstate(divide='ignore', invalid='ignore'):
+        w = np.where(span != 0, (target - lo) / np.where(span != 0, span, 1), 0.0)
+    return np.clip(w, 0.0, 1.0)
+
+
+def solve_axis(axis: str, fixed: np.ndarray, prop: str, target: np.ndarray, interp: Optional[Interpolator] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    沿温度 (axis='temp', fixed 为体积浓度) 或体积浓度 (axis='conc', fixed 为温度) 方向反查物性。
+
+    target 的单位与物性表一致 (mu 为 mPa·s)。先在固定坐标上求出沿另一方向全部节点的插值结果,
+    找到首个包含目标值的单元后在单元内求解: 双线性与对数方案直接解析反解, 双三次方案在单元内二分。
+    返回 (坐标数组, 状态码数组), 无解的数据点坐标为 NaN。
+    """
+    grid = PROPERTY_GRID
+    p = PROP_KEYS.index(prop)
+    fixed, target = np.broadcast_arrays(np.asarray(fixed, dtype=np.float64), np.asarray(target, dtype=np.float64))
+
+    if axis == 'conc':
+        nodes = np.asarray(grid.conc_nodes, dtype=np.float64)
+        start, step = grid.conc_start, grid.conc_step
+        fixed_status = Status.TEMP_OUT_OF_RANGE
+    else:
+        nodes = np.asarray(grid.temp_nodes, dtype=np.float64)
+        start, step = grid.temp_start, grid.temp_step
+        fixed_status = Status.CONC_OUT_OF_RANGE
+
+    def evaluate(x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """在固定坐标与求解方向坐标 x (..., k) 处求物性值"""
+        f = fixed[..., np.newaxis]
+        values, status = props_all_many(*((f, x) if axis == 'conc' else (x, f)), interp)
+        return values[..., p], status
+
+    # 沿求解方向的全部节点值
+    line, line_status = evaluate(nodes)
+    seg, found = _first_bracket(line, target)
+
+    lo = np.take_along_axis(line, seg[..., np.newaxis], axis=-1)[..., 0]
+    hi = np.take_along_axis(line, seg[..., np.newaxis] + 1, axis=-1)[..., 0]
+
+    scheme = 'linear' if interp is None else interp.schemes[p]
+    if scheme in ('linear', 'log'):
+        w = _solve_segment(lo, hi, target, scheme == 'log')
+    else:
+        # 双三次方案: 在包含目标值的单元内二分
+        a, b = np.zeros(target.shape), np.ones(target.shape)
+        rising = hi >= lo
+        for _ in range(BISECT_ITERATIONS):
+            mid = (a + b) / 2
+            value = evaluate((start + (seg + mid) * step)[..., np.newaxis])[0][..., 0]
+            below = np.where(rising, value < target, value > target)
+            a = np.where(below, mid, a)
+            b = np.where(below, b, mid)
+        w = (a + b) / 2
+
+    result = start + (seg + w) * step
+
+    # 固定坐标超出范围时整条线均无法求值
+    fixed_ok = (line_status != fixed_status).all(axis=-1)
+    status = np.where(found, Status.OK, Status.NO_SOLUTION).astype(np.int8)
+    status[~fixed_ok] = fixed_status
+    status[np.isnan(fixed) | np.isnan(target)] = Status.INVALID_INPUT
+
+    return np.where(status == Status.OK, result, np.nan), status
+
+
+def solve_freezing(freezing: np.ndarray, query_type: str = 'volume') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    由冰点反查浓度。
+
+    冰点随浓度先降后升, 存在两个解时返回较低的浓度。返回 (浓度数组, 状态码数组)。
+    """
+    freezing = np.asarray(freezing, dtype=np.float64)
+    _keys, starts, deltas, _row_valid = FB_ARRAYS[query_type]
+    key_col = FB_TABLE.index[query_type].key_col
+
+    # 每个区间两端的冰点, 区间缺失数据时为 NaN
+    lo = starts[:, 2]
+    hi = starts[:, 2] + deltas[:, 2]
+
+    t = freezing[..., np.newaxis]
+    hit = ((lo - t) * (hi - t) <= 0) & ~np.isnan(lo) & ~np.isnan(hi)
+    found = hit.any(axis=-1)
+    seg = np.argmax(hit, axis=-1)
+
+    w = _solve_segment(lo[seg], hi[seg], freezing, False)
+    result = starts[seg, key_col] + deltas[seg, key_col] * w
+
+    status = np.where(found, Status.OK, Status.NO_SOLUTION).astype(np.int8)
+    status[np.isnan(freezing)] = Status.INVALID_INPUT
+
+    return np.where(status == Status.OK, result, np.nan), status
+
+
+def convert_conc(conc: np.ndarray, from_type: str, to_type: str) -> Tuple[np.ndarray, np.ndarray]:
+    """质量浓度与体积浓度批量换算, 返回 (浓度数组, 状态码数组)"""
+    conc = np.asarray(conc, dtype=np.float64)
+    if from_type == to_type:
+        return conc, np.where(np.isnan(conc), Status.INVALID_INPUT, Status.OK).astype(np.int8)
+
+    mass, volume, _freezing, _boiling, status = fb_props_many(conc, from_type)
+    return (mass if to_type == 'mass' else volume), status
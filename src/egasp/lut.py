@@ -0,0 +1,236 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-16 18:25:40 +0800
+LastEditTime : 2026-10-16 18:25:40 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/src/egasp/lut.py
+Description  : 稠密查找表: 将物性表重采样到细网格上, 以数组下标直接取值
+ -----------------------------------------------------------------------
+'''
+import math
+import time
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+
+from egasp.errors import Status
+from egasp.interp import Interpolator
+from egasp.property_grid import PROP_KEYS, PROPERTY_GRID
+from egasp.egasp_batch import props_all_many
+
+N_PROPS = len(PROP_KEYS)
+
+# 查找表内存上限, 单位: 字节; 默认分辨率约 41 MB, 过细的分辨率在构造前即拒绝
+MAX_NBYTES = 512 * 1024 * 1024
+
+
+def _node_count(span: float, res: float) -> int:
+    """按分辨率覆盖 span 所需的节点数, 向上取整使实际分辨率不超过请求值, 至少 2 个节点"""
+    # 微小容差避免 160 / 0.1 之类的舍入多出一个节点
+    return max(math.ceil(span / res - 1e-9), 1) + 1
+
+
+def estimate_nbytes(temp_res: float, conc_res: float) -> int:
+    """
+    按分辨率估算查找表占用的内存 (字节), 分辨率不是正数或超过 MAX_NBYTES 时抛出 ValueError。
+    """
+    if not (temp_res > 0 and conc_res > 0):
+        raise ValueError(f"查找表分辨率必须为正数 temp_res={temp_res}, conc_res={conc_res}")
+    grid = PROPERTY_GRID
+    n_temp = _node_count(float(grid.temp_nodes[-1] - grid.temp_nodes[0]), temp_res)
+    n_conc = _node_count(float(grid.conc_nodes[-1] - grid.conc_nodes[0]), conc_res)
+    nbytes = n_temp * n_conc * N_PROPS * 8
+    if nbytes > MAX_NBYTES:
+        raise ValueError(f"查找表分辨率过细 temp_res={temp_res}, conc_res={conc_res}: 需要约 {nbytes / 2**20:.0f} MB, 上限 {MAX_NBYTES / 2**20:.0f} MB")
+    return nbytes
+
+
+class DenseLUT:
+    """
+    重采样到细网格上的 (rho, cp, k, mu) 查找表, 以内存换取速度。
+
+    构造时在细网格节点上按指定插值方案求值一次, 查询时由下标直接取出所在细单元的
+    四个角点做双线性插值, 不再经过原网格的定位与插值方案计算。
+    细网格分辨率不超过请求值, 使节点恰好覆盖原网格范围; 分辨率能整除原网格步长时
+    对默认双线性方案的结果与 get_props 相同 (仅有舍入误差)。
+    细单元角点落在缺失数据上 (结果为 NaN) 的点改按直接插值计算, 是否缺失的判断与 get_props 一致。
+    默认 0.1°C × 0.1% 时表大小约为 1601 × 801 × 4 个 float64 (约 41 MB), 超过 MAX_NBYTES 时拒绝构造。
+    """
+
+    def __init__(self, temp_res: float = 0.1, conc_res: float = 0.1, interp: Optional[Interpolator] = None):
+        estimate_nbytes(temp_res, conc_res)
+
+        grid = PROPERTY_GRID
+        self.interp = interp
+        self.temp_start, temp_end = float(grid.temp_nodes[0]), float(grid.temp_nodes[-1])
+        self.conc_start, conc_end = float(grid.conc_nodes[0]), float(grid.conc_nodes[-1])
+
+        self.n_temp = _node_count(temp_end - self.temp_start, temp_res)
+        self.n_conc = _node_count(conc_end - self.conc_start, conc_res)
+        self.temp_res = (temp_end - self.temp_start) / (self.n_temp - 1)
+        self.conc_res = (conc_end - self.conc_start) / (self.n_conc - 1)
+
+        start = time.perf_counter()
+        temp_nodes = np.linspace(self.temp_start, temp_end, self.n_temp)
+        conc_nodes = np.linspace(self.conc_start, conc_end, self.n_conc)
+        table, _status = props_all_many(temp_nodes[:, np.newaxis], conc_nodes[np.newaxis, :], interp)
+        self.table = np.ascontiguousarray(table)
+        self.build_time = time.perf_counter() - start
+
+        # 标量查询通过一维 memoryview 取值, 直接得到 Python float
+        self._flat = memoryview(self.table.reshape(-1))
+
+    @property
+    def nbytes(self) -> int:
+        """查找表占用的内存 (字节)"""
+        return self.table.nbytes
+
+    def props_all(self, temp: float, conc: float) -> Tuple[Optional[Tuple[float, ...]], Status]:
+        """标量查询 (rho, cp, k, mu), 返回 (物性元组, 状态码), 出错时物性元组为 None"""
+        pos_t = (temp - self.temp_start) / self.temp_res
+        pos_c = (conc - self.conc_start) / self.conc_res
+        if not (0 <= pos_t <= self.n_temp - 1):
+            return None, (Status.INVALID_INPUT if temp != temp else Status.TEMP_OUT_OF_RANGE)
+        if not (0 <= pos_c <= self.n_conc - 1):
+            return None, (Status.INVALID_INPUT if conc != conc else Status.CONC_OUT_OF_RANGE)
+
+        # 最后一个节点并入前一个单元 (权重为 1)
+        i = min(int(pos_t), self.n_temp - 2)
+        j = min(int(pos_c), self.n_conc - 2)
+        wt, wc = pos_t - i, pos_c - j
+
+        # 一次切片取出相邻两个节点的 8 个值: 下行 (v11 × 4, v12 × 4)、上行 (v21 × 4, v22 × 4)
+        flat = self._flat
+        base = (i * self.n_conc + j) * N_PROPS
+        lower = flat[base:base + 2 * N_PROPS].tolist()
+        base += self.n_conc * N_PROPS
+        upper = flat[base:base + 2 * N_PROPS].tolist()
+
+        result = []
+        for v11, v12, v21, v22 in zip(lower[:N_PROPS], lower[N_PROPS:], upper[:N_PROPS], upper[N_PROPS:]):
+            v1 = v11 + (v12 - v11) * wc
+            v2 = v21 + (v22 - v21) * wc
+            value = v1 + (v2 - v1) * wt
+            if value != value:
+                # 细单元的角点可能落在原网格节点线另一侧的缺失单元中, 由直接插值判断是否真的缺失
+                return self._direct(temp, conc)
+            result.append(value)
+
+        return tuple(result), Status.OK
+
+    def _direct(self, temp: float, conc: float) -> Tuple[Optional[Tuple[float, ...]], Status]:
+        """按原网格直接插值, 与 get_props_all 的常规路径相同"""
+        grid = PROPERTY_GRID
+        values = (self.interp or grid).interpolate_all(grid.locate_temp(temp), grid.locate_conc(conc))
+        if None in values:
+            return None, Status.DATA_GAP
+        return tuple(values), Status.OK
+
+    def props_all_many(self, temp: np.ndarray, conc: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """批量查询, 返回值与 egasp_batch.props_all_many 相同: (..., 4) 物性数组及逐点状态码"""
+        temp, conc = np.asarray(temp, dtype=np.float64), np.asarray(conc, dtype=np.float64)
+
+        pos_t = (temp - self.temp_start) / self.temp_res
+        pos_c = (conc - self.conc_start) / self.conc_res
+        t_ok = (pos_t >= 0) & (pos_t <= self.n_temp - 1)
+        c_ok = (pos_c >= 0) & (pos_c <= self.n_conc - 1)
+
+        # 超出范围的点先夹到表内参与计算, 最后统一置为 NaN, 计算过程不分支
+        pos_t = np.clip(np.where(t_ok, pos_t, 0.0), 0, self.n_temp - 1)
+        pos_c = np.clip(np.where(c_ok, pos_c, 0.0), 0, self.n_conc - 1)
+        i = np.minimum(pos_t.astype(np.intp), self.n_temp - 2)
+        j = np.minimum(pos_c.astype(np.intp), self.n_conc - 2)
+        wt = (pos_t - i)[..., np.newaxis]
+        wc = (pos_c - j)[..., np.newaxis]
+
+        # 按一维节点下标整行取出 4 个物性, 比二维花式索引快数倍
+        table = self.table.reshape(-1, N_PROPS)
+        idx = i * self.n_conc + j
+        v11, v12 = np.take(table, idx, axis=0), np.take(table, idx + 1, axis=0)
+        v21, v22 = np.take(table, idx + self.n_conc, axis=0), np.take(table, idx + self.n_conc + 1, axis=0)
+        v1 = v11 + (v12 - v11) * wc
+        v2 = v21 + (v22 - v21) * wc
+        result = v1 + (v2 - v1) * wt
+
+        in_range = t_ok & c_ok
+        status = np.where(t_ok, np.where(c_ok, Status.OK, Status.CONC_OUT_OF_RANGE), Status.TEMP_OUT_OF_RANGE).astype(np.int8)
+        result = np.where(in_range[..., np.newaxis], result, np.nan)
+
+        # 结果为 NaN 的点改按直接插值计算, 缺失判断与 get_props 一致
+        redo = in_range & np.isnan(result).any(axis=-1)
+        if redo.any():
+            temp, conc = np.broadcast_arrays(temp, conc)
+            result[redo], status[redo] = props_all_many(temp[redo], conc[redo], self.interp)
+
+        return result, status
+
+    def error_report(self, samples: int = 200000, seed: int = 0) -> dict:
+        """
+        与直接插值 (默认方案即 get_props 的双线性插值) 比较误差。
+
+        取点包括原网格范围内 samples 个随机点, 以及沿原网格每条节点线按细网格两倍密度均匀取的点
+        (缺失单元的边界都在节点线上, 随机点几乎取不到)。
+        返回 {物性: {max_abs, max_rel, rms_rel}} 以及两者缺失判断不一致的点数 gap_mismatch、
+        总取点数 samples、查找表分辨率、内存占用与构造耗时。
+        """
+        grid = PROPERTY_GRID
+        temp_end = self.temp_start + self.temp_res * (self.n_temp - 1)
+        conc_end = self.conc_start + self.conc_res * (self.n_conc - 1)
+        rng = np.random.default_rng(seed)
+        temp_line = np.linspace(self.temp_start, temp_end, 2 * self.n_temp - 1)
+        conc_line = np.linspace(self.conc_start, conc_end, 2 * self.n_conc - 1)
+        temp_nodes, conc_nodes = np.asarray(grid.temp_nodes, dtype=np.float64), np.asarray(grid.conc_nodes, dtype=np.float64)
+        temp = np.concatenate([
+            rng.uniform(self.temp_start, temp_end, samples),
+            np.repeat(temp_nodes, conc_line.size),
+            np.tile(temp_line, conc_nodes.size),
+        ])
+        conc = np.concatenate([
+            rng.uniform(self.conc_start, conc_end, samples),
+            np.tile(conc_line, temp_nodes.size),
+            np.repeat(conc_nodes, temp_line.size),
+        ])
+
+        ref, ref_status = props_all_many(temp, conc, self.interp)
+        lut, lut_status = self.props_all_many(temp, conc)
+
+        both = (ref_status == Status.OK) & (lut_status == Status.OK)
+        report = {}
+        for p, key in enumerate(PROP_KEYS):
+            err = np.abs(lut[both, p] - ref[both, p])
+            rel = err / np.abs(ref[both, p])
+            report[key] = {
+                'max_abs': float(err.max()) if err.size else 0.0,
+                'max_rel': float(rel.max()) if rel.size else 0.0,
+                'rms_rel': float(np.sqrt(np.mean(rel ** 2))) if rel.size else 0.0,
+            }
+
+        report['gap_mismatch'] = int(np.count_nonzero((ref_status == Status.OK) != (lut_status == Status.OK)))
+        report['samples'] = int(temp.size)
+        report['resolution'] = (self.temp_res, self.conc_res)
+        report['nbytes'] = self.nbytes
+        report['build_time'] = self.build_time
+
+        return report
+
+
+@lru_cache(maxsize=4)
+def get_lut(temp_res: float = 0.1, conc_res: float = 0.1, interp: Optional[Interpolator] = None) -> DenseLUT:
+    """按分辨率与插值方案构造查找表, 首次使用时才构造, 相同参数复用"""
+    return DenseLUT(temp_res, conc_res, interp)
@@ -0,0 +1,150 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-16 20:12:48 +0800
+LastEditTime : 2026-10-16 20:12:48 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/src/egasp/parallel.py
+Description  : 多进程并行批量计算, 物性表与输入输出均放在共享内存中
+ -----------------------------------------------------------------------
+'''
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from egasp import egasp_batch
+from egasp.interp import compile_interpolator
+
+# 输出数组的名称, 顺序与 get_egasp 返回值一致
+OUTPUT_NAMES = ('mass', 'volume', 'freezing', 'boiling', 'rho', 'cp', 'k', 'mu')
+
+# 每个任务默认处理的数据点数
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Python 3.13 起 SharedMemory 支持 track 参数
+_TRACK_ARG = 'track' in shared_memory.SharedMemory.__init__.__code__.co_varnames
+
+# 工作进程中挂载的共享内存及数组视图, 由 _init_worker 设置
+_WORKER = {}
+
+
+def _pack(arrays: Dict[str, Tuple[tuple, str]]) -> Tuple[shared_memory.SharedMemory, list]:
+    """
+    按 {名称: (形状, dtype)} 在一块共享内存中分配数组, 各数组按 8 字节对齐。
+
+    返回共享内存及布局 [(名称, 形状, dtype, 偏移), ...], 布局可传给其他进程重建数组视图。
+    """
+    layout, offset = [], 0
+    for name, (shape, dtype) in arrays.items():
+        layout.append((name, tuple(shape), np.dtype(dtype).str, offset))
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        offset += nbytes + (-nbytes % 8)
+    return shared_memory.SharedMemory(create=True, size=max(offset, 1)), layout
+
+
+def _views(shm: shared_memory.SharedMemory, layout: list) -> Dict[str, np.ndarray]:
+    """按布局在共享内存上建立数组视图"""
+    return {name: np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset) for name, shape, dtype, offset in layout}
+
+
+def _share(arrays: Dict[str, np.ndarray]) -> Tuple[shared_memory.SharedMemory, list]:
+    """将数组复制到新分配的共享内存中"""
+    shm, layout = _pack({name: (arr.shape, arr.dtype) for name, arr in arrays.items()})
+    for name, view in _views(shm, layout).items():
+        view[...] = arrays[name]
+    return shm, layout
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """挂载已有的共享内存, 由主进程统一释放, 工作进程不登记到资源跟踪器 (Python 3.13+)"""
+    if _TRACK_ARG:
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+def _init_worker(tables: Tuple[str, list], io: Tuple[str, list], query_type: str, schemes: Tuple[str, ...]) -> None:
+    """工作进程初始化: 挂载共享内存, 以共享的物性表替换本进程的数组表"""
+    interp = compile_interpolator(schemes)
+
+    table_shm, io_shm = _attach(tables[0]), _attach(io[0])
+    egasp_batch.install_tables(_views(table_shm, tables[1]), interp)
+
+    _WORKER.update(shm=(table_shm, io_shm), io=_views(io_shm, io[1]), query_type=query_type, interp=interp)
+
+
+def _run_chunk(start: int, stop: int) -> None:
+    """计算 [start, stop) 范围内的数据点, 结果直接写入共享的输出数组"""
+    io = _WORKER['io']
+    result, status = egasp_batch.egasp_many(io['temp'][start:stop], _WORKER['query_type'], io['value'][start:stop], _WORKER['interp'])
+    for name, values in zip(OUTPUT_NAMES, result):
+        io[name][start:stop] = values
+    io['status'][start:stop] = status
+
+
+def _chunks(n: int, chunk_size: int) -> List[Tuple[int, int]]:
+    return [(start, min(start + chunk_size, n)) for start in range(0, n, chunk_size)]
+
+
+def sweep_many(query_temp, query_type: str, query_value, schemes: Tuple[str, ...] = ('linear',) * 4, workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[tuple, np.ndarray]:
+    """
+    多进程并行计算乙二醇水溶液的全部属性, 结果与 egasp_batch.egasp_many 相同。
+
+    输入按 NumPy 规则广播后按 chunk_size 分块交给 workers 个工作进程 (默认 CPU 核数)。
+    编译后的物性表、输入与输出数组均放在 multiprocessing.shared_memory 中,
+    工作进程只接收共享内存名称与布局, 不复制表数据, 各自将结果写入共享输出数组的对应区段。
+    数据点不超过一个分块或 workers 为 1 时直接在当前进程计算。
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"分块大小必须为正整数 chunk_size={chunk_size}")
+    workers = workers or os.cpu_count() or 1
+    interp = compile_interpolator(schemes)
+
+    query_temp, query_value = np.broadcast_arrays(np.asarray(query_temp, dtype=np.float64), np.asarray(query_value, dtype=np.float64))
+    shape, n = query_temp.shape, query_temp.size
+
+    chunks = _chunks(n, chunk_size)
+    if workers == 1 or len(chunks) <= 1:
+        return egasp_batch.egasp_many(query_temp, query_type, query_value, interp)
+
+    table_shm, table_layout = _share(egasp_batch.export_tables(interp))
+    io_spec = {'temp': ((n,), np.float64), 'value': ((n,), np.float64), 'status': ((n,), np.int8)}
+    io_spec.update({name: ((n,), np.float64) for name in OUTPUT_NAMES})
+    io_shm, io_layout = _pack(io_spec)
+    try:
+        io = _views(io_shm, io_layout)
+        io['temp'][...] = query_temp.ravel()
+        io['value'][...] = query_value.ravel()
+
+        initargs = ((table_shm.name, table_layout), (io_shm.name, io_layout), query_type, schemes)
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), initializer=_init_worker, initargs=initargs) as pool:
+            # 逐个取结果以便工作进程中的异常在此处抛出
+            for future in [pool.submit(_run_chunk, start, stop) for start, stop in chunks]:
+                future.result()
+
+        # 复制出共享内存后即可释放
+        result = tuple(io[name].reshape(shape).copy() for name in OUTPUT_NAMES)
+        status = io['status'].reshape(shape).copy()
+        del io
+    finally:
+        for shm in (table_shm, io_shm):
+            shm.close()
+            shm.unlink()
+
+    return result, status
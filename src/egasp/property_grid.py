@@ -0,0 +1,203 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-16 10:05:12 +0800
+LastEditTime : 2026-10-16 10:05:12 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/src/egasp/property_grid.py
+Description  : 预编译的等间距物性网格, 通过下标运算直接定位插值单元
+ -----------------------------------------------------------------------
+'''
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+from egasp.data.egasp_data import STORE
+
+PROP_KEYS = ('rho', 'cp', 'k', 'mu')
+N_PROPS = len(PROP_KEYS)
+
+# 有效性掩码中全部物性均有效的取值
+ALL_VALID = (1 << N_PROPS) - 1
+
+
+def default_axes() -> Tuple[Tuple[int, int], Tuple[float, float], int, float]:
+    """数据文件说明信息中记录的节点参数 (temp_range, conc_range, temp_step, conc_step)"""
+    axes = STORE.meta(PROP_KEYS[0])['axes']
+    temp, conc = axes['temp'], axes['conc']
+    return (temp['start'], temp['stop']), (float(conc['start']), float(conc['stop'])), temp['step'], float(conc['step'])
+
+
+class PropertyGrid:
+    """
+    温度 × 体积浓度的等间距物性网格。
+
+    tables 为 {物性: 形状 (温度行, 浓度列) 的二维 float64 memoryview} (见 TableStore.table), 缺失数据为 NaN。
+    values 按 PROP_KEYS 顺序存放各物性的一维 float64 memoryview, 直接指向数据表 (内存映射) 的内存, 不复制数据;
+    第 i 个温度节点、第 j 个浓度节点的物性 p 为 values[p][i * stride + j], stride 为数据表的列数。
+    查询时通过 (value - start) / step 直接计算所在单元, 不再生成节点列表或二分查找,
+    一次定位与一组双线性权重即可同时得到四个物性。
+
+    缺失数据的判断预先计算为有效性掩码 valid: 每个插值单元 (含恰好落在节点上的退化单元)
+    对应一个字节, 第 p 位表示第 p 个物性的角点全部有效, 查询时只需一次下标访问。
+    标量与批量 (egasp_batch) 接口共用 values 与 valid。
+    """
+
+    def __init__(self, tables: dict, temp_range: Tuple[int, int], conc_range: Tuple[float, float], temp_step: int, conc_step: float):
+        if temp_step <= 0 or conc_step <= 0:
+            raise ValueError(f"节点步长必须为正数 temp_step={temp_step}, conc_step={conc_step}")
+
+        self.spec = (tuple(temp_range), tuple(conc_range), temp_step, conc_step)
+
+        # 节点按位置对应数据表的行列, 超出数据表行数、列数的节点没有数据, 截去后查询时按超出范围处理
+        n_rows, n_cols = tables[PROP_KEYS[0]].shape
+        self.temp_nodes = tuple(range(temp_range[0], temp_range[1] + 1, temp_step))[:n_rows]
+        self.conc_nodes = tuple(round(conc_range[0] + i * conc_step, 1) for i in range(int((conc_range[1] - conc_range[0]) / conc_step) + 1))[:n_cols]
+        if not self.temp_nodes or not self.conc_nodes:
+            raise ValueError(f"节点范围为空 temp_range={temp_range}, conc_range={conc_range}")
+
+        self.temp_start, self.temp_step = self.temp_nodes[0], temp_step
+        self.conc_start, self.conc_step = self.conc_nodes[0], conc_step
+        self.n_temp, self.n_conc = len(self.temp_nodes), len(self.conc_nodes)
+
+        # 与原 get_props 一致, 第 i 个温度节点、第 j 个浓度节点按位置取数据表第 i 行第 j 列;
+        # 自定义网格可能只用到数据表的前几行、前几列, 因此行跨度取数据表的列数而不是 n_conc
+        self.stride = n_cols
+        self.values = tuple(tables[key].cast('B').cast('d') for key in PROP_KEYS)
+
+        self.valid_stride = 2 * self.n_conc - 1
+        self.valid = self._valid_mask(self.values)
+
+    def __reduce__(self):
+        # values 指向内存映射, 不能序列化; 按节点参数在目标进程中重新编译
+        return compile_grid, self.spec
+
+    def node_values(self, plane: Sequence[float]) -> List[float]:
+        """按 (温度节点, 浓度节点) 顺序展开的单个物性节点值, 下标为 i * n_conc + j"""
+        stride = self.stride
+        return [plane[i * stride + j] for i in range(self.n_temp) for j in range(self.n_conc)]
+
+    def _valid_mask(self, values: Tuple[Sequence[float], ...]) -> bytes:
+        """
+        计算每个插值单元的有效性掩码。
+
+        单元以 (下节点 + 上节点) 编号, 温度方向取值 0 .. 2 * n_temp - 2, 偶数为恰好落在节点上的退化单元,
+        浓度方向同理, 掩码下标为 (t_lower + t_upper) * valid_stride + (c_lower + c_upper)。
+        """
+        # 先求每个节点的有效位, 单元掩码为四个角点掩码按位与
+        stride = self.stride
+        node_mask = [
+            [sum(1 << p for p in range(N_PROPS) if values[p][i * stride + j] == values[p][i * stride + j]) for j in range(self.n_conc)]
+            for i in range(self.n_temp)
+        ]
+
+        masks = bytearray()
+        for ti in range(2 * self.n_temp - 1):
+            row_lower, row_upper = node_mask[ti // 2], node_mask[ti // 2 + ti % 2]
+            for ci in range(self.valid_stride):
+                c_lower, c_upper = ci // 2, ci // 2 + ci % 2
+                masks.append(row_lower[c_lower] & row_lower[c_upper] & row_upper[c_lower] & row_upper[c_upper])
+        return bytes(masks)
+
+    @staticmethod
+    def _locate(value: float, start: float, step: float, n: int) -> Optional[Tuple[int, int, float]]:
+        """返回 (下节点, 上节点, 权重), 超出节点范围时返回 None; 恰好位于节点上时上下节点相同"""
+        pos = (value - start) / step
+        if not (0 <= pos <= n - 1):
+            return None
+
+        lower = int(pos)
+        weight = pos - lower
+        upper = lower + 1 if weight > 0 else lower
+
+        return lower, upper, weight
+
+    def locate_temp(self, temp: float) -> Optional[Tuple[int, int, float]]:
+        """定位温度所在区间"""
+        return self._locate(temp, self.temp_start, self.temp_step, self.n_temp)
+
+    def locate_conc(self, conc: float) -> Optional[Tuple[int, int, float]]:
+        """定位浓度所在区间"""
+        return self._locate(conc, self.conc_start, self.conc_step, self.n_conc)
+
+    def cell_mask(self, t_cell: Tuple[int, int, float], c_cell: Tuple[int, int, float]) -> int:
+        """单元的有效性掩码, 第 p 位为 1 表示第 p 个物性可以插值"""
+        return self.valid[(t_cell[0] + t_cell[1]) * self.valid_stride + c_cell[0] + c_cell[1]]
+
+    def bilinear(self, values: Tuple[Sequence[float], ...], p: int, t_cell: Tuple[int, int, float], c_cell: Tuple[int, int, float]) -> Optional[float]:
+        """在已定位的单元内对 values (布局同 self.values) 中第 p 个物性做双线性插值, 角点存在缺失数据时返回 None"""
+        if not self.cell_mask(t_cell, c_cell) >> p & 1:
+            return None
+
+        plane, stride = values[p], self.stride
+        row_lower, row_upper = t_cell[0] * stride, t_cell[1] * stride
+        c_lower, c_upper = c_cell[0], c_cell[1]
+        wt, wc = t_cell[2], c_cell[2]
+
+        v11, v12 = plane[row_lower + c_lower], plane[row_lower + c_upper]
+        v21, v22 = plane[row_upper + c_lower], plane[row_upper + c_upper]
+        v1 = v11 + (v12 - v11) * wc
+        v2 = v21 + (v22 - v21) * wc
+
+        return v1 + (v2 - v1) * wt
+
+    def bilinear_all(self, values: Tuple[Sequence[float], ...], t_cell: Tuple[int, int, float], c_cell: Tuple[int, int, float]) -> List[Optional[float]]:
+        """在已定位的单元内对 values (布局同 self.values) 中全部物性做双线性插值, 角点缺失的物性为 None"""
+        stride = self.stride
+        t_lower, t_upper, wt = t_cell
+        c_lower, c_upper, wc = c_cell
+        i11, i12 = t_lower * stride + c_lower, t_lower * stride + c_upper
+        i21, i22 = t_upper * stride + c_lower, t_upper * stride + c_upper
+
+        result = []
+        for plane in values:
+            v11, v12, v21, v22 = plane[i11], plane[i12], plane[i21], plane[i22]
+            v1 = v11 + (v12 - v11) * wc
+            v2 = v21 + (v22 - v21) * wc
+            result.append(v1 + (v2 - v1) * wt)
+
+        # 缺失数据由预先计算的掩码判断, 全部有效时无需逐个检查
+        mask = self.valid[(t_lower + t_upper) * self.valid_stride + c_lower + c_upper]
+        if mask != ALL_VALID:
+            for p in range(N_PROPS):
+                if not mask >> p & 1:
+                    result[p] = None
+
+        return result
+
+    def interpolate(self, egp_key: str, t_cell: Tuple[int, int, float], c_cell: Tuple[int, int, float]) -> Optional[float]:
+        """在已定位的单元内对单个物性做双线性插值, 角点存在缺失数据时返回 None"""
+        return self.bilinear(self.values, PROP_KEYS.index(egp_key), t_cell, c_cell)
+
+    def interpolate_all(self, t_cell: Tuple[int, int, float], c_cell: Tuple[int, int, float]) -> Tuple[Optional[float], ...]:
+        """在已定位的单元内一次性插值 (rho, cp, k, mu), 角点缺失的物性为 None"""
+        return tuple(self.bilinear_all(self.values, t_cell, c_cell))
+
+
+def compile_grid(temp_range: Optional[Tuple[int, int]] = None, conc_range: Optional[Tuple[float, float]] = None, temp_step: Optional[int] = None, conc_step: Optional[float] = None) -> PropertyGrid:
+    """按节点参数编译物性网格, 未给出的参数取数据文件中记录的坐标轴, 相同参数只编译一次"""
+    defaults = default_axes()
+    spec = tuple(default if value is None else value for value, default in zip((temp_range, conc_range, temp_step, conc_step), defaults))
+    return _compile_grid(tuple(spec[0]), tuple(spec[1]), spec[2], spec[3])
+
+
+@lru_cache(maxsize=None)
+def _compile_grid(temp_range: Tuple[int, int], conc_range: Tuple[float, float], temp_step: int, conc_step: float) -> PropertyGrid:
+    return PropertyGrid({key: STORE.table(key) for key in PROP_KEYS}, temp_range, conc_range, temp_step, conc_step)
+
+
+# 默认网格在导入时编译
+PROPERTY_GRID = compile_grid()
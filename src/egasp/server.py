@@ -0,0 +1,374 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-16 23:05:44 +0800
+LastEditTime : 2026-10-16 23:05:44 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/src/egasp/server.py
+Description  : 本地 asyncio HTTP/JSON 物性查询服务, 并发的单点请求合并为一次向量化计算
+ -----------------------------------------------------------------------
+'''
+import asyncio
+import json
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import numpy as np
+
+from egasp.egasp_core import EG_ASP_Core
+from egasp.errors import EgaspError, Status
+from egasp.stdio import DEFAULT_MAX_BATCH, evaluate_lines, request_props, request_type
+from egasp.version import __version__
+
+# 默认合并窗口, 单位: 秒; 首个请求最多多等待 2 ms, 并发请求在窗口内合并为一批。
+# 设为 0 时只合并同一轮事件循环中已到达的请求, 适合以单个客户端串行调用为主、更看重单次延迟的场景
+DEFAULT_WINDOW = 0.002
+
+# 请求体大小上限, 单位: 字节
+MAX_BODY = 16 * 1024 * 1024
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 413: 'Payload Too Large', 422: 'Unprocessable Entity', 500: 'Internal Server Error'}
+
+
+class HTTPError(Exception):
+    """以指定状态码应答的请求错误"""
+
+    def __init__(self, code: int, msg: str):
+        super().__init__(msg)
+        self.code = code
+
+
+def _content_length(headers: dict) -> int:
+    """解析 Content-Length, 非法或为负时以 400、超过 MAX_BODY 时以 413 应答"""
+    value = headers.get('content-length', '').strip()
+    if not value:
+        return 0
+    # 按 latin-1 解码的首部中 str.isdigit() 也接受 '²' 等非 ASCII 数字
+    if not (value.isascii() and value.isdigit()):
+        raise HTTPError(400, f"无效的 Content-Length: {value}")
+    length = int(value)
+    if length > MAX_BODY:
+        raise HTTPError(413, f"请求体超过 {MAX_BODY} 字节")
+    return length
+
+
+class Coalescer:
+    """
+    单点请求合并器。
+
+    第一个请求到达后等待 window 秒 (或凑满 max_batch 个) 再统一计算, 期间到达的请求合并为同一批,
+    window 为 0 时只合并同一轮事件循环中已到达的请求。
+    由 stdio.evaluate_lines 按浓度类型向量化计算后分别返回各自的应答。
+    """
+
+    def __init__(self, eg: EG_ASP_Core, window: float = DEFAULT_WINDOW, max_batch: int = DEFAULT_MAX_BATCH):
+        self.eg = eg
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.Handle] = None
+
+        self.batches = 0
+        self.points = 0
+        self.max_size = 0
+
+    def submit(self, body: str) -> asyncio.Future:
+        """提交一个 JSON 请求, 返回应答字典的 Future"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((body, future))
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            # window 为 0 时只合并同一轮事件循环中到达的请求
+            self._timer = loop.call_later(self.window, self.flush) if self.window > 0 else loop.call_soon(self.flush)
+        return future
+
+    def flush(self) -> None:
+        """计算当前批次并设置各请求的结果"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        self.batches += 1
+        self.points += len(pending)
+        self.max_size = max(self.max_size, len(pending))
+
+        bodies = [body for body, _future in pending]
+        try:
+            replies = evaluate_lines(self.eg, bodies)
+        except Exception:  # 整批计算意外出错时逐个请求重新计算, 错误只影响出错的请求
+            replies = [self._evaluate_one(body) for body in bodies]
+        for (_body, future), reply in zip(pending, replies):
+            if not future.done():
+                future.set_result(reply)
+
+
+    def _evaluate_one(self, body: str) -> dict:
+        try:
+            return evaluate_lines(self.eg, [body])[0]
+        except Exception as e:
+            return {'error': str(e), 'status': 'INTERNAL_ERROR'}
+
+
+class Metrics:
+    """请求计数与最近请求的延迟分布"""
+
+    def __init__(self, window: int = 10000):
+        self.started = time.time()
+        self.requests = {}
+        self.responses = {}
+        self.latencies = deque(maxlen=window)
+
+    def record(self, path: str, code: int, latency: float) -> None:
+        self.requests[path] = self.requests.get(path, 0) + 1
+        self.responses[code] = self.responses.get(code, 0) + 1
+        self.latencies.append(latency)
+
+    def snapshot(self, coalescer: Coalescer) -> dict:
+        latencies = sorted(self.latencies)
+
+        def percentile(q):
+            return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000 if latencies else None
+
+        return {
+            'uptime': time.time() - self.started,
+            'requests': dict(self.requests),
+            'responses': {str(code): n for code, n in self.responses.items()},
+            'latency_ms': {'p50': percentile(0.50), 'p99': percentile(0.99), 'samples': len(latencies)},
+            'coalescing': {
+                'batches': coalescer.batches,
+                'points': coalescer.points,
+                'mean_batch': coalescer.points / coalescer.batches if coalescer.batches else 0.0,
+                'max_batch': coalescer.max_size,
+            },
+        }
+
+
+def _json_array(values: np.ndarray) -> list:
+    """numpy 数组转换为 JSON 列表, NaN 转换为 null"""
+    return [None if v != v else v for v in values.ravel().tolist()]
+
+
+def _status_array(status: np.ndarray) -> list:
+    names = {code.value: code.name for code in Status}
+    return [names[code] for code in status.ravel().tolist()]
+
+
+class PropertyService:
+    """
+    HTTP 路由与各接口的实现。
+
+    /batch 与 /solve 的请求体解析与计算在单独的工作线程中执行, 大批量请求计算期间事件循环仍可应答
+    /health、/metrics 并合并 /egasp 单点请求。工作线程只有一个, 大批量请求依次计算, 内存占用不随并发请求数增长;
+    计算只读取预编译的数据表, 与事件循环线程上的合并计算互不影响。
+    """
+
+    def __init__(self, eg: EG_ASP_Core, window: float = DEFAULT_WINDOW, max_batch: int = DEFAULT_MAX_BATCH):
+        self.eg = eg
+        self.coalescer = Coalescer(eg, window, max_batch)
+        self.metrics = Metrics()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='egasp-batch')
+
+    def close(self) -> None:
+        """停止工作线程"""
+        self.executor.shutdown(wait=False)
+
+    async def dispatch(self, method: str, target: str, body: bytes) -> Tuple[int, dict]:
+        url = urlsplit(target)
+        path = url.path.rstrip('/') or '/'
+
+        if path == '/health':
+            return 200, {'status': 'ok', 'version': __version__}
+        if path == '/metrics':
+            return 200, self.metrics.snapshot(self.coalescer)
+        if path == '/egasp':
+            if method == 'GET':
+                # 查询字符串形式 /egasp?temp=25&type=volume&value=50&props=rho,mu
+                query = dict(parse_qsl(url.query))
+                try:
+                    request = {key: float(query[key]) for key in ('temp', 'value') if key in query}
+                except ValueError:
+                    raise HTTPError(400, "temp、value 必须为数字") from None
+                request.update({key: query[key] for key in ('type', 'id') if key in query})
+                if 'props' in query:
+                    request['props'] = query['props'].split(',')
+                body = json.dumps(request).encode()
+            elif method != 'POST':
+                raise HTTPError(405, f"{path} 仅支持 GET/POST")
+            reply = await self.coalescer.submit(body.decode('utf-8', 'replace'))
+            return (422 if 'error' in reply else 200), reply
+        if path in ('/batch', '/solve'):
+            if method != 'POST':
+                raise HTTPError(405, f"{path} 仅支持 POST")
+            return 200, await asyncio.get_running_loop().run_in_executor(self.executor, self._compute, path, body)
+        raise HTTPError(404, f"未知路径 {path}")
+
+    def _compute(self, path: str, body: bytes) -> dict:
+        """在工作线程中解析并计算 /batch 或 /solve 请求"""
+        try:
+            request = json.loads(body)
+        except (ValueError, RecursionError):
+            raise HTTPError(400, "无效的 JSON") from None
+        if not isinstance(request, dict):
+            raise HTTPError(400, "请求必须为 JSON 对象")
+        try:
+            return self.batch(request) if path == '/batch' else self.solve(request)
+        except (EgaspError, ValueError, TypeError) as e:
+            raise HTTPError(400, str(e)) from None
+
+    @staticmethod
+    def _array(request: dict, key: str, default=None) -> np.ndarray:
+        if key not in request and default is None:
+            raise HTTPError(400, f"缺少参数 {key}")
+        try:
+            return np.asarray(request.get(key, default), dtype=np.float64)
+        except (ValueError, TypeError, OverflowError):  # 超出 float 范围的 JSON 整数引发 OverflowError
+            raise HTTPError(400, f"{key} 必须为数字或数字数组") from None
+
+    def batch(self, request: dict) -> dict:
+        """批量查询: {"temp": [...], "type": "volume", "value": [...] 或标量, "props": [...]}, 按 NumPy 规则广播"""
+        temp, value = self._array(request, 'temp'), self._array(request, 'value', 50)
+        result, status = self.eg.get_egasp_props_many(temp, request_type(request), value, request_props(request), with_status=True)
+        reply = {p: _json_array(v) for p, v in result.items()}
+        reply['status'] = _status_array(status)
+        return reply
+
+    def solve(self, request: dict) -> dict:
+        """
+        反查: {"kind": "conc", "temp": ..., "prop": "rho", "target": ...}
+              {"kind": "temp", "value": ..., "prop": "mu", "target": ...}
+              {"kind": "freezing", "freezing": ...}
+        可选 "type" 指定浓度类型, 数组按 NumPy 规则广播。
+        """
+        kind = request.get('kind')
+        query_type = request_type(request)
+        if kind == 'conc':
+            result, status = self.eg.solve_conc(self._array(request, 'temp'), request.get('prop'), self._array(request, 'target'), query_type, with_status=True)
+        elif kind == 'temp':
+            result, status = self.eg.solve_temp(self._array(request, 'value'), request.get('prop'), self._array(request, 'target'), query_type, with_status=True)
+        elif kind == 'freezing':
+            result, status = self.eg.solve_freezing(self._array(request, 'freezing'), query_type, with_status=True)
+        else:
+            raise HTTPError(400, f"无效反查类型 {kind}，可选值: conc/temp/freezing")
+        return {'result': _json_array(np.asarray(result)), 'status': _status_array(np.asarray(status))}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """处理一个连接上的请求, 支持 HTTP/1.1 持久连接"""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                started = time.perf_counter()
+
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ', 2)
+                except ValueError:
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, sep, value = line.partition(':')
+                    if sep:
+                        headers[name.strip().lower()] = value.strip()
+                keep_alive = headers.get('connection', '').lower() != 'close' and version != 'HTTP/1.0'
+
+                try:
+                    length = _content_length(headers)
+                except HTTPError as e:
+                    # 无法确定请求体边界, 应答后关闭连接
+                    code, payload, keep_alive = e.code, {'error': str(e)}, False
+                else:
+                    body = await reader.readexactly(length) if length else b''
+                    try:
+                        code, payload = await self.dispatch(method.upper(), target, body)
+                    except HTTPError as e:
+                        code, payload = e.code, {'error': str(e)}
+                    except Exception as e:  # 未预料的错误也要应答, 不直接断开连接
+                        code, payload = 500, {'error': str(e)}
+
+                data = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+                writer.write(
+                    f"HTTP/1.1 {code} {REASONS.get(code, '')}\r\nContent-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(data)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + data
+                )
+                await writer.drain()
+                self.metrics.record(urlsplit(target).path, code, time.perf_counter() - started)
+
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host: str = '127.0.0.1', port: int = 8765, window: float = DEFAULT_WINDOW, max_batch: int = DEFAULT_MAX_BATCH, ready=None) -> None:
+    """启动服务并一直运行; ready(port) 在开始监听后调用, port 为 0 时可由此得到实际端口"""
+    service = PropertyService(EG_ASP_Core(on_error='raise'), window, max_batch)
+    server = await asyncio.start_server(service.handle, host, port)
+    if ready is not None:
+        ready(server.sockets[0].getsockname()[1])
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def serve_main(argv=None) -> None:
+    """
+    本地 HTTP/JSON 物性查询服务入口
+    使用方式：
+        egasp serve --port 8765
+    接口:
+        GET  /health                       运行状态
+        GET  /metrics                      请求计数、延迟 p50/p99 与合并批次统计
+        GET  /egasp?temp=25&type=volume&value=50&props=rho,mu
+        POST /egasp   {"temp": 25, "type": "volume", "value": 50, "props": ["rho", "mu"]}
+        POST /batch   {"temp": [...], "type": "volume", "value": [...], "props": [...]}
+        POST /solve   {"kind": "conc", "temp": 25, "prop": "rho", "target": 1071.11}
+    /egasp 的并发请求在 --window 秒内合并为一次向量化计算。默认只监听本机地址。
+    """
+    import argparse
+    import logging
+    import sys
+
+    parser = argparse.ArgumentParser(prog='egasp serve')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='监听地址, 默认 127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765, help='监听端口, 默认 8765, 0 表示随机端口')
+    parser.add_argument('--window', type=float, default=DEFAULT_WINDOW, help=f'请求合并窗口 (秒), 默认 {DEFAULT_WINDOW}')
+    parser.add_argument('--max-batch', type=int, default=DEFAULT_MAX_BATCH, help=f'每批最多合并的请求数, 默认 {DEFAULT_MAX_BATCH}')
+    args = parser.parse_args(argv)
+
+    logging.getLogger('egasp').setLevel(logging.ERROR)
+
+    def ready(port):
+        print(f"egasp {__version__} serving on http://{args.host}:{port}", flush=True)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.window, args.max_batch, ready))
+    except KeyboardInterrupt:
+        sys.exit(0)
@@ -0,0 +1,107 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-17 00:40:26 +0800
+LastEditTime : 2026-10-17 00:40:26 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/src/egasp/stats.py
+Description  : 运行统计: 各阶段调用次数与累计耗时、出错分类计数
+ -----------------------------------------------------------------------
+'''
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+
+from egasp.errors import Status
+
+
+class Stats:
+    """
+    线程安全的运行统计。
+
+    stages 记录每个阶段的 [调用次数, 累计耗时 (s), 数据点数], errors 按状态码名称记录出错次数。
+    标量接口每次调用计一个数据点, 批量接口按数组大小计数。
+    计算核心与校验器的各方法在 stats 不为 None 时自行计时, 阶段之间存在嵌套,
+    get_egasp 的耗时包含 validate / fb_lookup / props。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stages = {}
+        self.errors = {}
+
+    def __getstate__(self) -> dict:
+        # 锁不能序列化, 反序列化时重新创建
+        with self._lock:
+            return {'stages': {name: list(entry) for name, entry in self.stages.items()}, 'errors': dict(self.errors)}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__()
+        self.stages, self.errors = state['stages'], state['errors']
+
+    def record(self, name: str, seconds: float, points: int = 1) -> None:
+        """累加一次阶段耗时"""
+        with self._lock:
+            entry = self.stages.get(name)
+            if entry is None:
+                self.stages[name] = [1, seconds, points]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                entry[2] += points
+
+    def count_error(self, name: str, n: int = 1) -> None:
+        """累加出错次数"""
+        with self._lock:
+            self.errors[name] = self.errors.get(name, 0) + n
+
+    def count_status(self, status) -> None:
+        """按批量计算的逐点状态码数组累加出错次数"""
+        import numpy as np
+
+        counts = np.bincount(status.ravel().astype(np.intp), minlength=len(Status))
+        for code in Status:
+            if code != Status.OK and counts[code]:
+                self.count_error(code.name, int(counts[code]))
+
+    @contextmanager
+    def stage(self, name: str):
+        """计时上下文, 用于命令行渲染、更新检查等不在计算核心内的阶段"""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, perf_counter() - start)
+
+    def reset(self) -> None:
+        """清空统计数据"""
+        with self._lock:
+            self.stages.clear()
+            self.errors.clear()
+
+    def info(self) -> dict:
+        """
+        统计信息:
+        {'stages': {阶段: {'calls', 'points', 'total', 'mean'}}, 'errors': {状态码名称: 次数}}
+        total 为累计耗时 (s), mean 为平均每次调用耗时 (s)。
+        """
+        with self._lock:
+            stages = {
+                name: {'calls': calls, 'points': points, 'total': total, 'mean': total / calls}
+                for name, (calls, total, points) in self.stages.items()
+            }
+            return {'stages': stages, 'errors': dict(self.errors)}
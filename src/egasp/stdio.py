@@ -0,0 +1,207 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-16 22:40:19 +0800
+LastEditTime : 2026-10-16 22:40:19 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/src/egasp/stdio.py
+Description  : JSON Lines 标准输入输出流模式, 内部按微批次向量化计算
+ -----------------------------------------------------------------------
+'''
+import json
+import queue
+from typing import List, Optional, TextIO
+
+import numpy as np
+
+from egasp._io import start_reader
+from egasp.egasp_core import EG_ASP_Core
+from egasp.errors import Status
+from egasp.derived import BASE_KEYS, normalize_props
+
+# 请求中浓度类型的可选值
+QUERY_TYPES = {'volume': 'volume', 'v': 'volume', 'mass': 'mass', 'm': 'mass'}
+
+# 默认每批最多合并的请求数
+DEFAULT_MAX_BATCH = 4096
+
+# 逐点状态码对应的错误说明
+STATUS_MESSAGES = {
+    Status.TEMP_OUT_OF_RANGE: "温度超出有效范围",
+    Status.CONC_OUT_OF_RANGE: "浓度超出有效范围",
+    Status.FB_DATA_GAP: "冰点沸点表在该浓度附近存在数据缺失 (数据库本身缺失)",
+    Status.DATA_GAP: "物性表在该温度、浓度附近存在数据缺失 (数据库本身缺失)",
+    Status.INVALID_INPUT: "查询温度或浓度不是有效数字",
+}
+
+
+class RequestError(ValueError):
+    """单行请求格式错误, request_id 为能够解析出的请求 id"""
+
+    def __init__(self, msg: str, request_id=None):
+        super().__init__(msg)
+        self.request_id = request_id
+
+
+def _number(request: dict, key: str, default=None) -> float:
+    value = request.get(key, default)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise RequestError(f"{key} 必须为数字", request.get('id'))
+    try:
+        return float(value)
+    except OverflowError:  # 超出 float 范围的 JSON 整数
+        raise RequestError(f"{key} 超出数值范围", request.get('id')) from None
+
+
+def request_type(request: dict) -> str:
+    """请求中的浓度类型, 默认为 volume, 不是可选值之一 (含非字符串) 时抛出 RequestError"""
+    query_type = request.get('type', 'volume')
+    if not isinstance(query_type, str) or query_type not in QUERY_TYPES:
+        raise RequestError(f"无效查询类型 {query_type}，可选值: volume/mass", request.get('id'))
+    return QUERY_TYPES[query_type]
+
+
+def request_props(request: dict) -> tuple:
+    """请求中的输出名称, 默认为 get_egasp 的 8 个输出, 不是名称或名称列表时抛出 RequestError"""
+    props = request.get('props', BASE_KEYS)
+    if isinstance(props, str):
+        props = (props,)
+    if not isinstance(props, (list, tuple)) or not all(isinstance(p, str) for p in props):
+        raise RequestError("props 必须为名称或名称列表", request.get('id'))
+    return tuple(props)
+
+
+def parse_request(line: str) -> dict:
+    """
+    解析一行请求 {"temp": 25, "type": "volume", "value": 50, "props": ["rho", "mu"], "id": ...}。
+
+    type 默认为 volume, value 默认为 50, props 默认为 get_egasp 的 8 个输出, id 原样返回。
+    返回 {'id', 'temp', 'type', 'value', 'props'}, 格式错误时抛出 RequestError。
+    """
+    try:
+        request = json.loads(line)
+    except (ValueError, RecursionError):
+        raise RequestError("无效的 JSON") from None
+    if not isinstance(request, dict):
+        raise RequestError("请求必须为 JSON 对象")
+
+    query_type = request_type(request)
+    props, unknown = normalize_props(request_props(request))
+    if unknown:
+        raise RequestError(f"无效输出参数 {', '.join(unknown)}", request.get('id'))
+
+    return {'id': request.get('id'), 'temp': _number(request, 'temp'), 'type': query_type, 'value': _number(request, 'value', 50), 'props': props}
+
+
+def evaluate_lines(eg: EG_ASP_Core, lines: List[str]) -> List[dict]:
+    """
+    计算一批请求行, 返回逐行对应的应答字典。
+
+    同一浓度类型的请求合并为一次 get_egasp_props_many 计算; 出错的行返回 {"error": 说明, "status": 状态名},
+    不影响同批其他行。请求带 id 时应答中原样返回。
+    """
+    replies: List[Optional[dict]] = [None] * len(lines)
+    requests = {}
+    for i, line in enumerate(lines):
+        try:
+            requests[i] = parse_request(line)
+        except RequestError as e:
+            replies[i] = {'error': str(e), 'status': Status.INVALID_INPUT.name}
+            if e.request_id is not None:
+                replies[i] = {'id': e.request_id, **replies[i]}
+
+    for query_type in ('volume', 'mass'):
+        rows = [i for i, r in requests.items() if r['type'] == query_type]
+        if not rows:
+            continue
+        wanted = tuple(sorted({p for i in rows for p in requests[i]['props']}))
+        temp = np.array([requests[i]['temp'] for i in rows])
+        value = np.array([requests[i]['value'] for i in rows])
+        result, status = eg.get_egasp_props_many(temp, query_type, value, wanted, with_status=True)
+        columns = {p: result[p].tolist() for p in wanted}
+
+        for j, (i, code) in enumerate(zip(rows, status.tolist())):
+            if code == Status.OK:
+                replies[i] = {p: columns[p][j] for p in requests[i]['props']}
+            else:
+                replies[i] = {'error': STATUS_MESSAGES.get(code, Status(code).name), 'status': Status(code).name}
+
+    for i, r in requests.items():
+        if r['id'] is not None:
+            replies[i] = {'id': r['id'], **replies[i]}
+    return replies
+
+
+def serve(eg: EG_ASP_Core, instream: TextIO, outstream: TextIO, max_batch: int = DEFAULT_MAX_BATCH, batch_wait: float = 0.0) -> int:
+    """
+    JSON Lines 流的请求循环, 按输入顺序逐行输出应答, 返回处理的请求数。
+
+    读取在后台线程中进行; 取到一行后合并队列中已到达的请求 (最多 max_batch 行),
+    batch_wait 秒内继续等待后续请求, 然后一次向量化计算并刷新输出。batch_wait 为 0 时不等待,
+    交互式逐行输入时每行立即应答, 管道批量输入时自然形成较大的批次。空行忽略。
+    """
+    lines = start_reader(instream)
+
+    count, done = 0, False
+    while not done:
+        line = lines.get()
+        if line is None:
+            break
+
+        batch = [line]
+        while len(batch) < max_batch:
+            try:
+                line = lines.get(timeout=batch_wait) if batch_wait > 0 else lines.get_nowait()
+            except queue.Empty:
+                break
+            if line is None:
+                done = True
+                break
+            batch.append(line)
+
+        batch = [line for line in batch if line.strip()]
+        if not batch:
+            continue
+        replies = evaluate_lines(eg, batch)
+        outstream.write(''.join(json.dumps(reply, ensure_ascii=False, separators=(',', ':')) + '\n' for reply in replies))
+        outstream.flush()
+        count += len(batch)
+
+    return count
+
+
+def stdio_main(argv=None) -> None:
+    """
+    JSON Lines 流模式入口, 整个流复用一个 EG_ASP_Core 实例
+    使用方式：
+        cat requests.jsonl | egasp --stdio > replies.jsonl
+    每行一个请求 {"temp": 25, "type": "volume", "value": 50, "props": ["rho", "pr"], "id": 1},
+    按顺序每行输出一个应答, 出错行输出 {"error": ..., "status": ...} 而不退出。
+    """
+    import argparse
+    import sys
+    from egasp._io import reply_stdout
+
+    parser = argparse.ArgumentParser(prog='egasp --stdio')
+    parser.add_argument('--max-batch', type=int, default=DEFAULT_MAX_BATCH, help=f'每批最多合并的请求数, 默认 {DEFAULT_MAX_BATCH}')
+    parser.add_argument('--batch-wait', type=float, default=0.0, help='凑批等待时间 (秒), 默认 0 (不等待)')
+    args = parser.parse_args(argv)
+    if args.max_batch <= 0:
+        parser.error(f"--max-batch 必须为正整数: {args.max_batch}")
+
+    with reply_stdout() as out:
+        serve(EG_ASP_Core(on_error='raise'), sys.stdin, out, args.max_batch, args.batch_wait)
@@ -22,31 +22,51 @@ FilePath     : /egasp/src/egasp/validate.py
 Description  : 
  -----------------------------------------------------------------------
 '''
-import logging
+from time import perf_counter
+
 
 class Validate:
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
+    stats = None  # 运行统计, 由 EG_ASP_Core.enable_stats() 设置, 计入 validate 阶段
+
+    @property
+    def logger(self):
+        # logging 仅在首次记录日志时导入
+        import logging
+
+        return logging.getLogger(__name__)
+
     def type_value(self, query_type:str, default_value:str='volume')->str:
-        if query_type in ['volume', 'v', 'mass', 'm', '']:
-            if query_type == '':
-                self.logger.info(f"未输入查询类型，将使用默认类型 {default_value}")
+        stats = self.stats
+        start = perf_counter() if stats is not None else 0.0
+        try:
+            if query_type in ['volume', 'v', 'mass', 'm', '']:
+                if query_type == '':
+                    self.logger.info(f"未输入查询类型，将使用默认类型 {default_value}")
+                    return default_value
+                if query_type == 'v':
+                    return 'volume'
+                if query_type == 'm':
+                    return 'mass'
+                return query_type
+            else:
+                self.logger.warning(f"无效查询类型，将使用默认值 {default_value}")
                 return default_value
-            if query_type == 'v':
-                return 'volume'
-            if query_type == 'm':
-                return 'mass'
-            return query_type
-        else:
-            self.logger.warning(f"无效查询类型，将使用默认值 {default_value}")
-            return default_value
+        finally:
+            if stats is not None:
+                stats.record('validate', perf_counter() - start)
+
     def input_value(self, value, min_val=None, max_val=None):
+        stats = self.stats
+        start = perf_counter() if stats is not None else 0.0
         try:
-            if min_val is not None and value < min_val:
-                self.logger.warning(f"输入值不能小于 {min_val}，请重新输入。")
-            if max_val is not None and value > max_val:
-                self.logger.warning(f"输入值不能大于 {max_val}，请重新输入。")
-            return value
-        except ValueError:
-            self.logger.warning("请输入有效的数字，请重新输入。")
-
+            try:
+                if min_val is not None and value < min_val:
+                    self.logger.warning(f"输入值不能小于 {min_val}，请重新输入。")
+                if max_val is not None and value > max_val:
+                    self.logger.warning(f"输入值不能大于 {max_val}，请重新输入。")
+                return value
+            except ValueError:
+                self.logger.warning("请输入有效的数字，请重新输入。")
+        finally:
+            if stats is not None:
+                stats.record('validate', perf_counter() - start)
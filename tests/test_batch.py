@@ -0,0 +1,115 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-18 11:02:37 +0800
+LastEditTime : 2026-10-18 11:02:37 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/tests/test_batch.py
+Description  : 批量接口与逐点 get_egasp 的一致性测试
+ -----------------------------------------------------------------------
+'''
+import math
+
+import numpy as np
+import pytest
+
+from egasp.egasp_batch import props_all_many
+from egasp.egasp_core import EG_ASP_Core
+from egasp.errors import EgaspError, Status
+
+# 节点、单元内部、缺失单元附近、超出范围与 NaN
+TEMPS = [-40, -35, -34, -32.5, -30, -12.3, 0, 25, 27.5, 99.9, 120, 125, 130, math.nan]
+VALUES = [5, 10, 12.5, 20, 33.3, 50, 65, 70, 77.7, 85, 90, 95, math.nan]
+
+
+def scalar(call, *args):
+    """逐点调用, 返回 (结果, 状态码)"""
+    try:
+        return call(*args), Status.OK
+    except EgaspError as e:
+        return None, e.status
+
+
+@pytest.fixture(scope='module')
+def eg():
+    return EG_ASP_Core(on_error='raise')
+
+
+@pytest.mark.parametrize('query_type', ['volume', 'mass'])
+def test_egasp_many_matches_scalar(eg, query_type):
+    temp, value = np.meshgrid(TEMPS, VALUES, indexing='ij')
+    result, status = eg.get_egasp_many(temp, query_type, value, with_status=True)
+    assert status.shape == temp.shape
+
+    for (i, j), t in np.ndenumerate(temp):
+        expected, code = scalar(eg.get_egasp, float(t), query_type, float(value[i, j]))
+        assert status[i, j] == code, (t, value[i, j])
+        got = [float(arr[i, j]) for arr in result]
+        if expected is None:
+            assert all(math.isnan(v) for v in got)
+        else:
+            assert got == pytest.approx(expected, rel=1e-12)
+
+
+def test_props_all_many_matches_scalar(eg):
+    temp, conc = np.meshgrid(TEMPS, VALUES, indexing='ij')
+    values, status = props_all_many(temp, conc)
+
+    for (i, j), t in np.ndenumerate(temp):
+        expected, code = scalar(eg.get_props_all, float(t), float(conc[i, j]))
+        if math.isnan(t) or math.isnan(conc[i, j]):
+            # 标量接口不单独区分 NaN, 两者都不能给出结果
+            assert status[i, j] != Status.OK and expected is None
+            continue
+        assert status[i, j] == code, (t, conc[i, j])
+        if expected is None:
+            # 缺失单元只有缺失的物性为 NaN, 其余物性保留供只用到部分物性的调用方 (如 inverse) 使用
+            assert np.isnan(values[i, j]).any()
+        else:
+            assert values[i, j].tolist() == pytest.approx(expected, rel=1e-12)
+
+
+def test_many_raises_on_first_error(eg):
+    with pytest.raises(EgaspError):
+        eg.get_egasp_many([25, 200], 'volume', 50)
+    rho = eg.get_egasp_many([20, 25], 'volume', [40, 50])[4]
+    assert rho.tolist() == pytest.approx([eg.get_egasp(20, 'volume', 40)[4], eg.get_egasp(25, 'volume', 50)[4]], rel=1e-12)
+
+
+@pytest.mark.parametrize('query_type', ['volume', 'mass'])
+def test_fb_props_many_matches_scalar(eg, query_type):
+    # 0~95% 的节点、区间内部、冰点沸点表缺失区间、超出范围与 NaN
+    query = np.append(np.arange(-5, 100.1, 0.7), [0, 95, 60, math.nan])
+    result, status = eg.get_fb_props_many(query, query_type, with_status=True)
+
+    for i, q in enumerate(query.tolist()):
+        expected, code = scalar(eg.get_fb_props, q, query_type)
+        got = [float(arr[i]) for arr in result]
+        if math.isnan(q):
+            assert status[i] == Status.INVALID_INPUT and expected is None
+        else:
+            assert status[i] == code, q
+        if expected is None:
+            assert all(math.isnan(v) for v in got)
+        else:
+            assert got == pytest.approx(expected, rel=1e-12)
+
+    assert (status == Status.FB_DATA_GAP).any()
+    with pytest.raises(EgaspError):
+        eg.get_fb_props_many(query, query_type)
+    with pytest.raises(EgaspError):
+        eg.get_fb_props_many([40], 'v')
@@ -0,0 +1,63 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-17 10:01:15 +0800
+LastEditTime : 2026-10-17 10:01:15 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/tests/test_binary_store.py
+Description  : 二进制物性数据文件与文本源 (tools/egasp_data_source.py) 的往返一致性测试
+ -----------------------------------------------------------------------
+'''
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'tools'))
+
+import build_store  # noqa: E402
+from egasp_data_source import EGP as SOURCE_EGP, META  # noqa: E402
+from egasp.data.binary_store import DATA_FILE, TableStore  # noqa: E402
+from egasp.data import egasp_data  # noqa: E402
+from egasp.data.egasp_data import EGP, STORE  # noqa: E402
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / 'egasp_data.bin'
+    build_store.build(path)
+    store = TableStore(path)
+
+    assert store.names == list(SOURCE_EGP)
+    for name, rows in SOURCE_EGP.items():
+        assert store.rows(name) == rows
+        assert store.meta(name) == META[name]
+
+
+def test_shipped_file_matches_source():
+    # 修改文本源后需运行 python tools/build_store.py 重新生成数据文件
+    assert build_store.check(DATA_FILE)
+    for name, rows in SOURCE_EGP.items():
+        assert STORE.rows(name) == rows
+
+
+def test_legacy_module_names():
+    # 原模块级列表名称仍可导入, 与 EGP 中的表一致
+    from egasp.data.egasp_data import eg_rho
+
+    for name in ('rho', 'cp', 'k', 'mu', 'fb'):
+        assert getattr(egasp_data, f'eg_{name}') is EGP[name]
+        assert getattr(egasp_data, f'eg_{name}') == SOURCE_EGP[name]
+    assert eg_rho is EGP['rho']
+    assert 'eg_cp' in dir(egasp_data)
@@ -0,0 +1,104 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-18 12:10:52 +0800
+LastEditTime : 2026-10-18 12:10:52 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/tests/test_cache.py
+Description  : 查询缓存的键量化、LRU 淘汰与失效测试
+ -----------------------------------------------------------------------
+'''
+import pytest
+
+from egasp.cache import QueryCache
+from egasp.egasp_core import EG_ASP_Core
+
+
+def cached(**kwargs):
+    eg = EG_ASP_Core(on_error='raise')
+    eg.enable_cache(**kwargs)
+    return eg
+
+
+def test_quantized_keys_collide_on_quantized_value():
+    eg, ref = cached(), EG_ASP_Core(on_error='raise')
+    # 24.96 与 25.04 取整后同为 25.0, 结果按取整后的值计算, 与调用顺序无关
+    first = eg.get_egasp(25.04, 'volume', 40.03)
+    assert eg.get_egasp(24.96, 'volume', 39.97) == first == ref.get_egasp(25.0, 'volume', 40.0)
+    assert eg.cache_info()['hits'] == 1
+
+    # 取整后不同的值、不同的浓度类型不共用条目
+    assert eg.get_egasp(25.06, 'volume', 40.0) == ref.get_egasp(25.1, 'volume', 40.0)
+    assert eg.get_egasp(25.0, 'mass', 40.0) == ref.get_egasp(25.0, 'mass', 40.0)
+    assert eg.get_props(25.0, 40.0, 'rho') == ref.get_props(25.0, 40.0, 'rho')
+    assert eg.cache_info()['hits'] == 1
+
+
+def test_unquantized_keys():
+    eg, ref = cached(temp_decimals=None, value_decimals=None), EG_ASP_Core(on_error='raise')
+    assert eg.get_egasp(25.04, 'volume', 40) == ref.get_egasp(25.04, 'volume', 40)
+    assert eg.get_egasp(24.96, 'volume', 40) == ref.get_egasp(24.96, 'volume', 40)
+    assert eg.cache_info()['hits'] == 0
+
+
+def test_lru_eviction():
+    cache = QueryCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == (True, 1)
+    cache.put('c', 3)
+    # b 最久未使用, 被淘汰
+    assert cache.get('b') == (False, None)
+    assert cache.get('a') == (True, 1) and cache.get('c') == (True, 3)
+    assert cache.info()['evictions'] == 1 and cache.info()['size'] == 2
+
+    eg = cached(maxsize=2)
+    for temp in (20, 21, 22, 20):
+        eg.get_egasp(temp)
+    info = eg.cache_info()
+    assert (info['hits'], info['misses'], info['evictions'], info['size']) == (0, 4, 2, 2)
+
+    with pytest.raises(ValueError):
+        QueryCache(maxsize=0)
+
+
+def test_scheme_change_invalidates():
+    eg = cached()
+    linear = eg.get_egasp(27.3, 'volume', 44.4)
+
+    eg.set_interp({'mu': 'logcubic', 'rho': 'cubic'})
+    assert eg.cache_info()['size'] == 0
+    result = eg.get_egasp(27.3, 'volume', 44.4)
+    assert result == EG_ASP_Core(on_error='raise', interp={'mu': 'logcubic', 'rho': 'cubic'}).get_egasp(27.3, 'volume', 44.4)
+    assert result != linear
+
+    eg.set_interp()
+    assert eg.get_egasp(27.3, 'volume', 44.4) == linear
+
+
+def test_lut_change_invalidates():
+    eg, ref = cached(), EG_ASP_Core(on_error='raise')
+    ref.enable_lut(0.3, 0.7)
+    direct = eg.get_egasp(27.3, 'volume', 44.4)
+
+    eg.enable_lut(0.3, 0.7)
+    assert eg.cache_info()['size'] == 0
+    assert eg.get_egasp(27.3, 'volume', 44.4) == ref.get_egasp(27.3, 'volume', 44.4)
+
+    eg.disable_lut()
+    assert eg.cache_info()['size'] == 0
+    assert eg.get_egasp(27.3, 'volume', 44.4) == direct
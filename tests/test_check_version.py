@@ -0,0 +1,141 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-17 14:30:08 +0800
+LastEditTime : 2026-10-17 14:30:08 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/tests/test_check_version.py
+Description  : 更新检查的锁文件、ETag 条件请求与失败回退测试, 使用本地 http.server 代替 GitHub API
+ -----------------------------------------------------------------------
+'''
+import http.server
+import importlib
+import json
+import sys
+import threading
+import time
+
+import pytest
+import toml
+
+
+class ReleaseServer(http.server.ThreadingHTTPServer):
+    """模拟 releases/latest 接口, 记录每个请求的 If-None-Match"""
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), ReleaseHandler)
+        self.tag, self.etag = 'v9.9.9', '"r1"'
+        self.delay = 0.0
+        self.fail = False
+        self.requests = []
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}/releases/latest"
+
+
+class ReleaseHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        server.requests.append(self.headers.get('If-None-Match'))
+        time.sleep(server.delay)
+        if server.fail:
+            self.send_response(500)
+            self.end_headers()
+            return
+        if self.headers.get('If-None-Match') == server.etag:
+            self.send_response(304)
+            self.send_header('ETag', server.etag)
+            self.end_headers()
+            return
+        body = json.dumps({'tag_name': server.tag}).encode()
+        self.send_response(200)
+        self.send_header('ETag', server.etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ReleaseServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def checker(monkeypatch, tmp_path):
+    """返回 checker(server, cache_time) 创建使用临时缓存目录的 UpdateChecker"""
+    # 源码树中不含编译后的翻译文件, 以中文界面导入
+    monkeypatch.setenv('LC_ALL', 'zh_CN.UTF-8')
+    monkeypatch.delitem(sys.modules, 'egasp.check_version', raising=False)
+    module = importlib.import_module('egasp.check_version')
+
+    def make(server, cache_time=6):
+        return module.UpdateChecker(2, cache_time, api_url=server.url, cache_dir=tmp_path)
+
+    return make
+
+
+def read_cache(uc) -> dict:
+    return toml.load(uc.cache_file)
+
+
+def test_concurrent_checkers_share_one_request(server, checker):
+    server.delay = 0.3
+    checkers = [checker(server) for _ in range(8)]
+    for uc in checkers:
+        uc.start()
+    for uc in checkers:
+        uc._thread.join(5)
+
+    assert len(server.requests) == 1
+    assert sum(uc.requested for uc in checkers) == 1
+    assert read_cache(checkers[0]) == {'latest_version': '9.9.9', 'etag': '"r1"'}
+    assert not checkers[0].lock_file.exists()
+
+    # 缓存有效期内不再请求
+    checker(server).start()._thread.join(5)
+    assert len(server.requests) == 1
+
+
+def test_etag_reused_when_not_modified(server, checker):
+    checker(server, cache_time=0).start()._thread.join(5)
+    uc = checker(server, cache_time=0).start()
+    uc._thread.join(5)
+
+    assert server.requests == [None, '"r1"']
+    assert read_cache(uc) == {'latest_version': '9.9.9', 'etag': '"r1"'}
+
+
+def test_failed_request_keeps_cached_version(server, checker):
+    checker(server, cache_time=0).start()._thread.join(5)
+    server.fail = True
+    uc = checker(server, cache_time=0)
+    before = uc.cache_file.stat().st_mtime_ns
+    time.sleep(0.01)
+    uc.start()._thread.join(5)
+
+    assert len(server.requests) == 2 and uc.requested
+    assert read_cache(uc) == {'latest_version': '9.9.9', 'etag': '"r1"'}
+    assert uc.cache_file.stat().st_mtime_ns > before
@@ -0,0 +1,97 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-17 10:20:44 +0800
+LastEditTime : 2026-10-17 10:20:44 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/tests/test_csv_stream.py
+Description  : 流式 CSV 批量计算的列对齐测试
+ -----------------------------------------------------------------------
+'''
+import io
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from egasp.csv_stream import stream_csv
+from egasp.egasp_core import EG_ASP_Core
+
+
+def run(text: str, eg=None, **kwargs):
+    dst = io.StringIO()
+    stats = stream_csv(eg or EG_ASP_Core(on_error='raise'), io.StringIO(text), dst, ('rho',), **kwargs)
+    return [line.split(',') for line in dst.getvalue().splitlines()], stats
+
+
+def test_short_rows_are_padded():
+    lines, stats = run("temp,value,note,x\n10,30\n25,40,a,b\n")
+    assert lines[0] == ['temp', 'value', 'note', 'x', 'rho', 'status']
+    assert lines[1] == ['10', '30', '', '', '1048.76', 'OK']
+    assert lines[2] == ['25', '40', 'a', 'b', '1057.6', 'OK']
+    assert stats.errors == 0
+
+
+def test_long_rows_are_rejected():
+    lines, stats = run("temp,value\n25,40,extra\n")
+    assert lines[1] == ['25', '40', '', 'INVALID_INPUT']
+    assert stats.status_counts == {'INVALID_INPUT': 1}
+
+
+def test_stats_match_summary():
+    # --stats 的出错计数与汇总行一致: 多于表头的行、无效类型的行都计入 eg 的统计
+    eg = EG_ASP_Core(on_error='raise')
+    eg.enable_stats()
+    lines, stats = run("temp,value,type\n25,40,v\nx,40,v\n25,40,v,extra\n25,40,bogus\n200,40,m\n", eg, type_col='type')
+    assert [line[-1] for line in lines[1:]] == ['OK', 'INVALID_INPUT', 'INVALID_INPUT', 'INVALID_INPUT', 'TEMP_OUT_OF_RANGE']
+    assert stats.status_counts == {'OK': 1, 'INVALID_INPUT': 3, 'TEMP_OUT_OF_RANGE': 1}
+    assert eg.stats_info()['errors'] == {'INVALID_INPUT': 3, 'TEMP_OUT_OF_RANGE': 1}
+
+
+def test_no_header_uses_first_row_width():
+    lines, _stats = run("10,30,z\n10,30\n", temp_col=0, value_col=1, header=False)
+    assert lines == [['10', '30', 'z', '1048.76', 'OK'], ['10', '30', '', '1048.76', 'OK']]
+
+
+
+def run_cli(*args):
+    # 中文环境下不需要 locale 目录中的翻译文件
+    env = {**os.environ, 'LC_ALL': 'zh_CN.UTF-8', 'PYTHONPATH': str(Path(__file__).resolve().parents[1] / 'src')}
+    return subprocess.run([sys.executable, '-m', 'egasp', 'batch', *map(str, args)], env=env, capture_output=True, text=True, timeout=60)
+
+
+def test_cli_rejects_unknown_props(tmp_path):
+    src, dst = tmp_path / 'in.csv', tmp_path / 'out.csv'
+    src.write_text("temp,value\n25,40\n")
+    proc = run_cli(src, '-o', dst, '--props', 'rho,bogus')
+    assert proc.returncode != 0
+    assert 'bogus' in proc.stderr
+    assert not dst.exists()
+
+
+@pytest.mark.parametrize('case', ['missing_input', 'bad_output'])
+def test_cli_open_error(tmp_path, case):
+    src, dst = tmp_path / 'in.csv', tmp_path / 'missing_dir' / 'out.csv'
+    if case == 'bad_output':
+        src.write_text("temp,value\n25,40\n")
+    proc = run_cli(src, '-o', dst)
+    assert proc.returncode == 1
+    assert 'Traceback' not in proc.stderr
+    assert str(src if case == 'missing_input' else dst) in proc.stderr.replace('\n', '')
+    assert not dst.exists()
@@ -0,0 +1,70 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-18 12:31:44 +0800
+LastEditTime : 2026-10-18 12:31:44 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/tests/test_cursor.py
+Description  : 固定浓度游标与 get_egasp 沿温度路径的一致性测试
+ -----------------------------------------------------------------------
+'''
+import math
+
+import numpy as np
+import pytest
+
+from egasp.egasp_core import EG_ASP_Core
+from egasp.errors import EgaspError
+
+# 升温穿过 -35°C 附近的缺失单元与各温度节点, 再降温返回, 中间夹带超出范围与 NaN 的温度
+PATH = np.concatenate([
+    np.arange(-35, 125.01, 0.5),
+    [125.0, 126.0, 124.9, -40.0, math.nan, 60.0],
+    np.arange(125, -35.01, -1.3),
+    np.arange(-35, -14.9, 0.1),
+])
+
+# 35%、85% 体积浓度在低温段有缺失单元, 冰点沸点表在 58%~78% 体积浓度缺失
+CASES = [(35, 'volume'), (50, 'volume'), (85, 'volume'), (40, 'mass'), (88.8, 'mass')]
+
+
+def outcome(call, temp):
+    try:
+        return call(temp)
+    except EgaspError as e:
+        return type(e)
+
+
+@pytest.mark.parametrize('interp', [None, {'mu': 'logcubic', 'rho': 'cubic'}, 'log'])
+@pytest.mark.parametrize('value, query_type', CASES)
+def test_cursor_matches_get_egasp(interp, value, query_type):
+    eg = EG_ASP_Core(on_error='raise', interp=interp)
+    cur = eg.cursor(value, query_type)
+
+    errors = 0
+    for temp in PATH.tolist():
+        expected = outcome(lambda t: eg.get_egasp(t, query_type, value), temp)
+        got = outcome(cur.get_egasp, temp)
+        if isinstance(expected, type):
+            assert got is expected, temp
+            errors += 1
+        else:
+            assert got == pytest.approx(expected, rel=1e-12), temp
+
+    # 路径确实经过出错的温度, 且游标在单元内复用系数
+    assert errors > 0
+    assert cur.moves < len(PATH)
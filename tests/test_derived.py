@@ -0,0 +1,97 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-19 09:40:12 +0800
+LastEditTime : 2026-10-19 09:40:12 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/tests/test_derived.py
+Description  : 派生参数 nu/alpha/pr/rho_cp 的计算、名称选择与批量状态测试
+ -----------------------------------------------------------------------
+'''
+import math
+
+import numpy as np
+import pytest
+
+from egasp.derived import OUTPUT_KEYS, normalize_props, select
+from egasp.egasp_core import EG_ASP_Core
+from egasp.errors import EgaspError, InvalidParameterError, Status
+
+
+@pytest.fixture(scope='module')
+def eg():
+    return EG_ASP_Core(on_error='raise')
+
+
+def by_hand(result: tuple) -> dict:
+    _mass, _volume, _freezing, _boiling, rho, cp, k, mu = result
+    return {'nu': mu / rho, 'alpha': k / (rho * cp), 'pr': cp * mu / k, 'rho_cp': rho * cp}
+
+
+@pytest.mark.parametrize('query', [(25, 'volume', 40), (-20, 'volume', 43.7), (87.5, 'mass', 52.1), (120, 'volume', 90)])
+def test_derived_match_hand_computation(eg, query):
+    result = eg.get_egasp(*query)
+    props = eg.get_egasp_props(*query, props=('nu', 'alpha', 'pr', 'rho_cp', 'rho', 'mu'))
+
+    assert list(props) == ['nu', 'alpha', 'pr', 'rho_cp', 'rho', 'mu']
+    expected = by_hand(result)
+    for key in ('nu', 'alpha', 'pr', 'rho_cp'):
+        assert props[key] == pytest.approx(expected[key], rel=1e-15)
+    assert (props['rho'], props['mu']) == (result[4], result[7])
+
+    # 25°C、40% 时水溶液的普朗特数约为 20~40, 运动粘度约 3e-6 m²/s
+    if query == (25, 'volume', 40):
+        assert 20 < props['pr'] < 40 and 1e-6 < props['nu'] < 1e-5
+
+
+def test_default_props_returns_all(eg):
+    assert tuple(eg.get_egasp_props(25, 'volume', 40)) == OUTPUT_KEYS
+
+
+def test_names_case_insensitive(eg):
+    assert normalize_props('Pr') == (('pr',), ())
+    assert normalize_props(['RHO_CP', 'Nu', 'bogus']) == (('rho_cp', 'nu', 'bogus'), ('bogus',))
+    assert eg.get_egasp_props(25, 'volume', 40, 'PR') == eg.get_egasp_props(25, 'volume', 40, ('pr',))
+    assert select(eg.get_egasp(25, 'volume', 40), ('alpha',)) == eg.get_egasp_props(25, 'volume', 40, ['Alpha'])
+
+
+@pytest.mark.parametrize('props', ['bogus', ('rho', 'prandtl'), ['nu', '']])
+def test_unknown_name_rejected(eg, props):
+    with pytest.raises(InvalidParameterError):
+        eg.get_egasp_props(25, 'volume', 40, props)
+    with pytest.raises(InvalidParameterError):
+        eg.get_egasp_props_many([25], 'volume', [40], props)
+
+
+def test_batch_propagates_nan_and_status(eg):
+    temp = np.array([25, 200, math.nan, -35, 87.5])
+    value = np.array([40, 40, 40, 20, 52.1])
+    props, status = eg.get_egasp_props_many(temp, 'volume', value, ('Pr', 'nu', 'alpha', 'rho_cp', 'k'), with_status=True)
+
+    assert list(props) == ['pr', 'nu', 'alpha', 'rho_cp', 'k']
+    assert status.tolist() == [Status.OK, Status.TEMP_OUT_OF_RANGE, Status.INVALID_INPUT, Status.DATA_GAP, Status.OK]
+    ok = status == Status.OK
+    for values in props.values():
+        assert np.isnan(values[~ok]).all() and not np.isnan(values[ok]).any()
+
+    for i in np.flatnonzero(ok):
+        expected = by_hand(eg.get_egasp(float(temp[i]), 'volume', float(value[i])))
+        for key in ('pr', 'nu', 'alpha', 'rho_cp'):
+            assert props[key][i] == pytest.approx(expected[key], rel=1e-12)
+
+    with pytest.raises(EgaspError):
+        eg.get_egasp_props_many(temp, 'volume', value, 'pr')
@@ -0,0 +1,172 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-17 14:52:40 +0800
+LastEditTime : 2026-10-17 14:52:40 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/tests/test_excel.py
+Description  : Excel 批量请求与逐行计算的一致性测试
+ -----------------------------------------------------------------------
+'''
+import io
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from egasp.egasp_core import EG_ASP_Core
+from egasp.excel import LEGACY_OUTPUT, NO_OUTPUT, entry_main, evaluate, evaluate_batch, serve, write_atomic
+from egasp.excel import batch_main as excel_batch_main
+from egasp.validate import Validate
+
+
+class CaseInsensitiveValidate(Validate):
+    """浓度类型不区分大小写的校验器, 用于确认批量路径没有另行映射浓度类型"""
+
+    def type_value(self, query_type, default_value='volume'):
+        return super().type_value(query_type.lower(), default_value)
+
+
+def test_batch_matches_single_rows():
+    requests = [
+        (query_type, '40', temp, prop)
+        for query_type in ('volume', 'v', 'mass', 'm', '', 'x', 'M', 'Mass')
+        for temp, prop in (('25', 'rho'), ('200', 'mu'), ('abc', 'cp'), ('20', 'bogus'))
+    ]
+    requests.append(('volume', '40'))
+
+    for validate in (Validate(), CaseInsensitiveValidate()):
+        eg = EG_ASP_Core(on_error='raise')
+        eg.validate = validate
+        expected = [evaluate(eg, *fields) if len(fields) == 4 else '#NO_OUTPUT' for fields in requests]
+        assert evaluate_batch(eg, requests) == expected
+
+
+def test_write_atomic_renames_temp_file(tmp_path, monkeypatch):
+    target = tmp_path / 'egasp_output_1.tmp'
+    target.write_text('old')
+    replace = os.replace
+    seen = []
+
+    def checking_replace(src, dst):
+        # 重命名前目标仍是完整的旧文件, 新内容已完整写入同目录的临时文件
+        seen.append((os.path.dirname(src), open(src).read(), open(dst).read()))
+        replace(src, dst)
+
+    monkeypatch.setattr(os, 'replace', checking_replace)
+    write_atomic(str(target), '1057.6')
+
+    assert seen == [(str(tmp_path), '1057.6', 'old')]
+    assert target.read_text() == '1057.6'
+    assert os.listdir(tmp_path) == [target.name]
+
+
+def test_write_atomic_failure_keeps_old_file(tmp_path, monkeypatch):
+    target = tmp_path / 'egasp_output_1.tmp'
+    target.write_text('old')
+
+    def locked(src, dst):
+        raise PermissionError(dst)
+
+    monkeypatch.setattr(os, 'replace', locked)
+    with pytest.raises(PermissionError):
+        write_atomic(str(target), '1057.6', retries=2)
+
+    assert target.read_text() == 'old'
+    assert os.listdir(tmp_path) == [target.name]
+
+
+@pytest.mark.parametrize('request_id', ['../evil', '..', 'a/b', 'a\\b', 'C:x', '', 'x.tmp', 'é', '١٢', 'ａ', 'a b', 'a' * 65])
+def test_entry_rejects_unsafe_ids(tmp_path, monkeypatch, request_id):
+    # 编号中的路径分隔符或 .. 不能把结果文件写到程序目录之外
+    (tmp_path / 'bin').mkdir()
+    monkeypatch.setattr(sys, 'argv', [str(tmp_path / 'bin' / 'egasp.exe')])
+    with pytest.raises(SystemExit) as exc:
+        entry_main(['--type=volume', '--value=40', '--temp=25', '--prop=rho', f'--id={request_id}'])
+    assert exc.value.code != 0
+    assert os.listdir(tmp_path) == ['bin'] and os.listdir(tmp_path / 'bin') == []
+
+
+def test_entry_writes_per_request_file(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(sys, 'argv', [str(tmp_path / 'egasp.exe')])
+    entry_main(['--type=volume', '--value=40', '--temp=25', '--prop=rho', '--id=req-1_a'])
+    assert (tmp_path / 'egasp_output_req-1_a.tmp').read_text() == '1057.6'
+
+    entry_main(['--type=volume', '--value=40', '--temp=25', '--prop=rho', f"--id={'Z' * 64}"])
+    assert (tmp_path / f"egasp_output_{'Z' * 64}.tmp").read_text() == '1057.6'
+
+    entry_main(['--type=volume', '--value=40', '--temp=25', '--prop=rho', '--id=auto'])
+    request_id, path = capsys.readouterr().out.splitlines()[-1].split(' ', 1)
+    assert os.path.dirname(path) == str(tmp_path) and os.path.basename(path) == f'egasp_output_{request_id}.tmp'
+    assert open(path).read() == '1057.6'
+
+
+def test_worker_protocol():
+    eg = EG_ASP_Core(on_error='raise')
+    lines = ['PING', '', 'volume,40,25,rho', '   ', 'volume\t40\t25\tcp', 'garbage', 'volume,40,25', 'mass,abc,25,rho', 'ping', 'volume,40,25,rho']
+    out = io.StringIO()
+
+    # 空行忽略, 出错行返回 #NO_OUTPUT 后继续应答, 输入结束时退出
+    assert serve(eg, io.StringIO('\n'.join(lines) + '\n'), out, idle_timeout=None) == 6
+    rho, cp = evaluate(eg, 'volume', '40', '25', 'rho'), evaluate(eg, 'volume', '40', '25', 'cp')
+    assert out.getvalue().splitlines() == ['PONG', rho, cp, NO_OUTPUT, NO_OUTPUT, NO_OUTPUT, 'PONG', rho]
+
+
+def test_worker_quit_stops_reading():
+    out = io.StringIO()
+    assert serve(EG_ASP_Core(on_error='raise'), io.StringIO('volume,40,25,rho\nquit\nPING\n'), out, idle_timeout=None) == 1
+    assert out.getvalue().splitlines() == ['1057.6']
+
+
+def test_worker_idle_timeout():
+    # 输入端保持打开但没有新请求, 空闲超时后退出
+    read_fd, write_fd = os.pipe()
+    instream = os.fdopen(read_fd, encoding='utf-8')
+    try:
+        os.write(write_fd, b'PING\n')
+        out = io.StringIO()
+        started = time.perf_counter()
+        assert serve(EG_ASP_Core(on_error='raise'), instream, out, idle_timeout=0.2) == 0
+        assert 0.2 <= time.perf_counter() - started < 5
+        assert out.getvalue() == 'PONG\n'
+    finally:
+        os.close(write_fd)  # 后台读取线程读到输入结束后再关闭读端
+        time.sleep(0.05)
+        instream.close()
+
+
+def test_worker_process_quit_exit_code():
+    env = {**os.environ, 'PYTHONPATH': str(Path(__file__).resolve().parents[1] / 'src')}
+    proc = subprocess.run([sys.executable, '-m', 'egasp', '--excel-worker', '--idle-timeout=30'], input='PING\nvolume,40,25,rho\nbad line\nQUIT\n',
+                          env=env, capture_output=True, text=True, timeout=60)
+    assert proc.returncode == 0
+    ready, *replies = proc.stdout.splitlines()
+    assert ready.startswith('READY egasp ')
+    assert replies == ['PONG', '1057.6', NO_OUTPUT]
+
+
+def test_batch_default_output_follows_request_file(tmp_path, capsys):
+    for name in ('a.txt', 'b.txt'):
+        (tmp_path / name).write_text('volume,40,25,rho\nbad\n')
+        excel_batch_main([f'--input={tmp_path / name}'])
+        path = capsys.readouterr().out.strip()
+        assert path == str(tmp_path / f'{name[0]}_output.tmp')
+        assert open(path).read() == f'1057.6\n{NO_OUTPUT}\n'
+    assert not (tmp_path / LEGACY_OUTPUT).exists()
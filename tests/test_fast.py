@@ -0,0 +1,71 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-18 13:15:26 +0800
+LastEditTime : 2026-10-18 13:15:26 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/tests/test_fast.py
+Description  : egasp-fast 快速入口的退出码与输出一致性测试
+ -----------------------------------------------------------------------
+'''
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = str(Path(__file__).resolve().parents[1] / 'src')
+
+
+def run(*args) -> subprocess.CompletedProcess:
+    env = {**os.environ, 'PYTHONPATH': SRC}
+    return subprocess.run([sys.executable, '-m', *args], env=env, capture_output=True, text=True, timeout=60)
+
+
+QUERIES = [
+    ('volume', '40', '25', 'rho'),
+    ('mass', '52.4', '-10', 'mu'),
+    ('v', '50', '80', 'pr'),
+    ('volume', '40', '200', 'rho'),
+    ('volume', '70', '25', 'k'),
+    ('volume', 'abc', '25', 'rho'),
+    ('volume', '40', '25', 'bogus'),
+]
+
+
+@pytest.mark.parametrize('query', QUERIES, ids=['-'.join(q) for q in QUERIES])
+def test_fast_matches_excel_mode(tmp_path, query):
+    options = [f'--{name}={value}' for name, value in zip(('type', 'value', 'temp', 'prop'), query)]
+    fast = run('egasp.fast', *options)
+    full = run('egasp', '--excel', *options, f'--output={tmp_path / "out.tmp"}')
+
+    assert full.returncode == 0
+    assert fast.stdout == full.stdout
+    assert fast.returncode == (1 if fast.stdout.strip() == '#NO_OUTPUT' else 0)
+
+
+def test_fast_exit_codes():
+    ok = run('egasp.fast', '--type=volume', '--value=40', '--temp=25', '--prop=rho')
+    assert (ok.returncode, ok.stdout) == (0, '1057.6\n')
+
+    out_of_range = run('egasp.fast', '--type=volume', '--value=40', '--temp=200', '--prop=rho')
+    assert (out_of_range.returncode, out_of_range.stdout) == (1, '#NO_OUTPUT\n')
+
+    for args in (('--type=volume', '--value=40', '--temp=25'), ('--type=volume', '--value=40', '--temp=25', '--prop=rho', '--bogus=1'), ('rho',)):
+        usage = run('egasp.fast', *args)
+        assert usage.returncode == 2 and usage.stdout == '' and 'egasp-fast' in usage.stderr
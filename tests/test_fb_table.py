@@ -0,0 +1,81 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-18 16:20:41 +0800
+LastEditTime : 2026-10-18 16:20:41 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/tests/test_fb_table.py
+Description  : 冰点沸点表的单列查询测试, 含冰点数据缺失区间
+ -----------------------------------------------------------------------
+'''
+import pytest
+
+from egasp.egasp_core import EG_ASP_Core
+from egasp.errors import ConcOutOfRangeError, FBDataGapError, InvalidParameterError
+from egasp.fb_table import FB_COLUMNS
+
+
+@pytest.fixture(scope='module')
+def eg():
+    return EG_ASP_Core(on_error='raise')
+
+
+@pytest.mark.parametrize('query_type, query', [
+    ('volume', 37.5), ('volume', 40.5), ('volume', 41.3), ('volume', 57.8), ('volume', 79.0), ('volume', 95.0),
+    ('mass', 40.0), ('mass', 44.4), ('mass', 60.0), ('mass', 80.5), ('mass', 95.0),
+])
+def test_value_matches_fb_props(eg, query_type, query):
+    expected = eg.get_fb_props(query, query_type)
+    for column, value in zip(FB_COLUMNS, expected):
+        assert eg.get_fb_value(query, column, query_type) == pytest.approx(value, rel=1e-12)
+
+
+@pytest.mark.parametrize('query_type, query', [('volume', 57.9), ('volume', 65.0), ('volume', 78.9), ('mass', 60.1), ('mass', 80.0)])
+def test_freezing_gap(eg, query_type, query):
+    # 冰点缺失区间 (体积浓度 57.8% ~ 78.9%): 整行查询与冰点失败, 浓度换算与沸点仍可求值
+    with pytest.raises(FBDataGapError):
+        eg.get_fb_props(query, query_type)
+    with pytest.raises(FBDataGapError):
+        eg.get_fb_value(query, 'freezing', query_type)
+
+    other = 'mass' if query_type == 'volume' else 'volume'
+    assert eg.get_fb_value(query, query_type, query_type) == pytest.approx(query)
+    assert 57.8 <= eg.get_fb_value(query, 'volume', query_type) <= 78.9
+    assert 60.0 <= eg.get_fb_value(query, 'mass', query_type) <= 80.0
+    assert 110.0 <= eg.get_fb_value(query, 'boiling', query_type) <= 123.9
+
+    # 浓度换算往返一致
+    converted = eg.get_fb_value(query, other, query_type)
+    assert eg.get_fb_value(converted, query_type, other) == pytest.approx(query, rel=1e-12)
+
+
+def test_gap_values(eg):
+    # 体积浓度 65% 位于 62.8% 与 68.3% 两个数据点之间
+    weight = (65.0 - 62.8) / (68.3 - 62.8)
+    assert eg.get_fb_value(65.0, 'mass') == pytest.approx(65.0 + 5.0 * weight)
+    assert eg.get_fb_value(65.0, 'boiling') == pytest.approx(112.8 + (116.7 - 112.8) * weight)
+
+
+def test_value_errors(eg):
+    with pytest.raises(ConcOutOfRangeError):
+        eg.get_fb_value(-1.0, 'boiling')
+    with pytest.raises(ConcOutOfRangeError):
+        eg.get_fb_value(96.0, 'mass', 'mass')
+    with pytest.raises(InvalidParameterError):
+        eg.get_fb_value(40.0, 'rho')
+    with pytest.raises(InvalidParameterError):
+        eg.get_fb_value(40.0, 'boiling', 'v')
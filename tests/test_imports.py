@@ -0,0 +1,43 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-18 17:05:13 +0800
+LastEditTime : 2026-10-18 17:05:13 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/tests/test_imports.py
+Description  : import egasp 不加载命令行、机器调用模式与可选依赖
+ -----------------------------------------------------------------------
+'''
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# import egasp 只应加载计算核心与数据, 以下模块仅在对应入口调用时导入
+LAZY_MODULES = (
+    'rich', 'rich_argparse', 'toml', 'packaging', 'numpy', 'asyncio',
+    'egasp.cli', 'egasp.server', 'egasp.excel', 'egasp.stdio', 'egasp.check_version', 'egasp.egasp_batch',
+)
+
+
+def test_import_egasp_stays_lean():
+    # 在新进程中检查, 不受本进程中其他测试已导入模块的影响
+    code = f"import sys, egasp; print(' '.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    env = {**os.environ, 'PYTHONPATH': str(Path(__file__).resolve().parents[1] / 'src')}
+    proc = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, timeout=60)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.split() == []
@@ -0,0 +1,74 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-18 11:26:05 +0800
+LastEditTime : 2026-10-18 11:26:05 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/tests/test_interp.py
+Description  : 各插值方案的节点值、粘度正值与无效方案测试
+ -----------------------------------------------------------------------
+'''
+import numpy as np
+import pytest
+
+from egasp.data.egasp_data import EGP
+from egasp.egasp_batch import props_all_many
+from egasp.egasp_core import EG_ASP_Core
+from egasp.errors import DataGapError
+from egasp.interp import SCHEMES
+from egasp.property_grid import PROP_KEYS
+
+TEMP_NODES = range(-35, 126, 5)
+CONC_NODES = [10.0 + 10 * j for j in range(9)]
+
+
+@pytest.mark.parametrize('scheme', SCHEMES)
+def test_schemes_reproduce_nodes(scheme):
+    eg = EG_ASP_Core(on_error='raise', interp=scheme)
+    for i, temp in enumerate(TEMP_NODES):
+        for j, conc in enumerate(CONC_NODES):
+            expected = [EGP[key][i][j] for key in PROP_KEYS]
+            if None in expected:
+                continue
+            assert eg.get_props_all(temp, conc) == pytest.approx(expected, rel=1e-12)
+            values, _status = props_all_many(temp, conc, eg.interp)
+            assert values.tolist() == pytest.approx(expected, rel=1e-12)
+
+
+def test_logcubic_mu_positive():
+    eg = EG_ASP_Core(on_error='raise', interp={'mu': 'logcubic'})
+    temp, conc = np.meshgrid(np.arange(-35, 125.01, 0.25), np.arange(10, 90.01, 0.25), indexing='ij')
+    values, status = props_all_many(temp, conc, eg.interp)
+    mu = values[..., PROP_KEYS.index('mu')]
+    assert (mu[~np.isnan(mu)] > 0).all()
+
+    for temp in np.arange(-35, 125.01, 2.5):
+        for conc in np.arange(10, 90.01, 2.5):
+            try:
+                assert eg.get_props(float(temp), float(conc), 'mu') > 0
+            except DataGapError:
+                pass
+
+
+@pytest.mark.parametrize('interp', ['spline', {'mu': 'quadratic'}, {'viscosity': 'log'}])
+def test_unknown_scheme_rejected(interp):
+    with pytest.raises(ValueError):
+        EG_ASP_Core(on_error='raise', interp=interp)
+    eg = EG_ASP_Core(on_error='raise')
+    with pytest.raises(ValueError):
+        eg.set_interp(interp)
+    assert eg.schemes == ('linear',) * len(PROP_KEYS)
@@ -0,0 +1,97 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-18 11:48:19 +0800
+LastEditTime : 2026-10-18 11:48:19 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/tests/test_inverse.py
+Description  : 反查浓度、温度与冰点的往返与无解测试
+ -----------------------------------------------------------------------
+'''
+import numpy as np
+import pytest
+
+from egasp.egasp_core import EG_ASP_Core
+from egasp.errors import NoSolutionError, Status
+from egasp.interp import SCHEMES
+
+PROPS = {'rho': 4, 'cp': 5, 'k': 6, 'mu': 7}
+
+# 各物性表与冰点沸点表均完整的单元内部及节点上的点 (冰点沸点表在 58%~78% 体积浓度之间缺失)
+POINTS = [(-20, 43.7), (0, 15.2), (25, 50.0), (41.3, 33.3), (87.5, 52.1), (110, 81.9)]
+
+
+@pytest.mark.parametrize('scheme', SCHEMES)
+@pytest.mark.parametrize('query_type', ['volume', 'mass'])
+def test_solve_conc_round_trip(scheme, query_type):
+    # 定温下 rho、mu 随浓度单调上升, cp、k 单调下降
+    eg = EG_ASP_Core(on_error='raise', interp=scheme)
+    for temp, conc in POINTS:
+        result = eg.get_egasp(temp, query_type, conc)
+        for key, idx in PROPS.items():
+            assert eg.solve_conc(temp, key, result[idx], query_type) == pytest.approx(conc, abs=1e-9)
+
+
+@pytest.mark.parametrize('scheme', SCHEMES)
+def test_solve_temp_round_trip(scheme):
+    # 定浓度下 mu 随温度单调下降, cp 单调上升
+    eg = EG_ASP_Core(on_error='raise', interp=scheme)
+    temp = np.array([t for t, _c in POINTS])
+    conc = np.array([c for _t, c in POINTS])
+    _m, _v, _f, _b, _rho, cp, _k, mu = eg.get_egasp_many(temp, 'volume', conc)
+    np.testing.assert_allclose(eg.solve_temp(conc, 'mu', mu), temp, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(eg.solve_temp(conc, 'cp', cp), temp, rtol=0, atol=1e-9)
+
+
+def test_solve_freezing_round_trip():
+    eg = EG_ASP_Core(on_error='raise')
+    for conc in (12.5, 30.0, 47.3):
+        freezing = eg.get_fb_props(conc, 'volume')[2]
+        assert eg.solve_freezing(freezing) == pytest.approx(conc, abs=1e-9)
+
+
+def test_non_monotone_returns_lowest_root():
+    # 90% 浓度下 k 随温度先升后降, 0.2715 在 80~85°C 与 120~125°C 各有一解
+    eg = EG_ASP_Core(on_error='raise')
+    temp = eg.solve_temp(90, 'k', 0.2715)
+    assert temp == pytest.approx(82.5, abs=1e-9)
+    assert eg.get_props(122.5, 90, 'k') == pytest.approx(0.2715)
+
+    # 冰点随浓度先降后升, 返回较低的浓度
+    conc = eg.solve_freezing(-20.0)
+    assert eg.get_fb_props(float(conc), 'volume')[2] == pytest.approx(-20.0)
+    assert conc < 50
+
+
+def test_no_solution():
+    eg = EG_ASP_Core(on_error='raise')
+    conc, status = eg.solve_conc([25, 25, 200, np.nan], 'rho', [500, 2000, 1050, 1050], with_status=True)
+    assert status.tolist() == [Status.NO_SOLUTION, Status.NO_SOLUTION, Status.TEMP_OUT_OF_RANGE, Status.INVALID_INPUT]
+    assert np.isnan(conc).all()
+    with pytest.raises(NoSolutionError):
+        eg.solve_conc(25, 'rho', 500)
+    with pytest.raises(NoSolutionError):
+        eg.solve_freezing(10.0)
+
+
+def test_gap_bracket_skipped():
+    # -35°C 时 90% 浓度缺失, 1140 kg/m³ 只能落在含缺失节点的区间内, 视为无解; -25°C 时该区间完整
+    eg = EG_ASP_Core(on_error='raise')
+    conc, status = eg.solve_conc([-35, -25], 'rho', 1140, with_status=True)
+    assert status.tolist() == [Status.NO_SOLUTION, Status.OK]
+    assert np.isnan(conc[0])
+    assert eg.get_props(-25, float(conc[1]), 'rho') == pytest.approx(1140)
@@ -0,0 +1,75 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-18 10:20:41 +0800
+LastEditTime : 2026-10-18 10:20:41 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/tests/test_lut.py
+Description  : 稠密查找表模式与直接插值的缺失判断一致性测试
+ -----------------------------------------------------------------------
+'''
+import numpy as np
+import pytest
+
+from egasp.egasp_core import EG_ASP_Core
+from egasp.errors import DataGapError, InvalidParameterError, Status
+
+RESOLUTIONS = [(0.1, 0.1), (0.3, 0.7)]
+
+# 0.5 步长遍历全部节点线及单元内部
+TEMPS = np.arange(-35, 125.01, 0.5)
+CONCS = np.arange(10, 90.01, 0.5)
+
+
+def direct(eg, temp, conc):
+    try:
+        return eg.get_props_all(temp, conc)
+    except DataGapError:
+        return None
+
+
+@pytest.mark.parametrize('res', RESOLUTIONS)
+def test_lut_keeps_gap_decisions(res):
+    eg, lut_eg = EG_ASP_Core(on_error='raise'), EG_ASP_Core(on_error='raise')
+    lut_eg.enable_lut(*res)
+
+    # 缺失单元旁的节点线: 直接插值有值, 查表模式不能报缺失
+    assert lut_eg.get_props_all(-35, 70.0) == pytest.approx(eg.get_props_all(-35, 70.0))
+    assert lut_eg.get_props_all(-34, 70.0) == pytest.approx(eg.get_props_all(-34, 70.0))
+
+    temp, conc = np.meshgrid(TEMPS, CONCS, indexing='ij')
+    _values, status = lut_eg._lut().props_all_many(temp, conc)
+    for (i, j), t in np.ndenumerate(temp):
+        expected = direct(eg, float(t), float(conc[i, j]))
+        assert (status[i, j] == Status.OK) == (expected is not None)
+        assert (direct(lut_eg, float(t), float(conc[i, j])) is None) == (expected is None)
+
+
+def test_report_samples_node_lines():
+    eg = EG_ASP_Core(on_error='raise')
+    eg.enable_lut(0.3, 0.7)
+    report = eg.lut_report(samples=1000)
+    assert report['samples'] > 1000
+    assert report['gap_mismatch'] == 0
+
+
+@pytest.mark.parametrize('res', [(0, 0.1), (0.1, -1), (float('nan'), 0.1), (1e-4, 1e-4)])
+def test_invalid_resolution(res):
+    eg = EG_ASP_Core(on_error='raise')
+    with pytest.raises(InvalidParameterError):
+        eg.enable_lut(*res)
+    assert eg.lut_spec is None
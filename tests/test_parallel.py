@@ -0,0 +1,67 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-18 12:52:09 +0800
+LastEditTime : 2026-10-18 12:52:09 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/tests/test_parallel.py
+Description  : 共享内存并行扫描与串行批量计算的一致性及出错释放测试
+ -----------------------------------------------------------------------
+'''
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from egasp import parallel
+from egasp.egasp_core import EG_ASP_Core
+
+# 覆盖缺失单元、冰点沸点表缺失、超出范围与 NaN 的扫描网格
+TEMP, VALUE = np.meshgrid(np.append(np.arange(-40, 130.1, 2.7), np.nan), np.append(np.arange(5, 95.1, 3.1), np.nan), indexing='ij')
+
+
+@pytest.mark.parametrize('interp', [None, {'mu': 'logcubic', 'rho': 'cubic'}])
+@pytest.mark.parametrize('query_type', ['volume', 'mass'])
+def test_sweep_matches_serial(interp, query_type):
+    eg = EG_ASP_Core(on_error='raise', interp=interp)
+    expected, expected_status = eg.get_egasp_many(TEMP, query_type, VALUE, with_status=True)
+    result, status = eg.get_egasp_sweep(TEMP, query_type, VALUE, workers=2, chunk_size=500, with_status=True)
+
+    assert status.shape == TEMP.shape
+    np.testing.assert_array_equal(status, expected_status)
+    for got, want in zip(result, expected):
+        np.testing.assert_array_equal(got, want)
+
+
+def test_segments_unlinked_after_error(monkeypatch):
+    created = []
+    pack = parallel._pack
+
+    def recording_pack(arrays):
+        shm, layout = pack(arrays)
+        created.append(shm.name)
+        return shm, layout
+
+    monkeypatch.setattr(parallel, '_pack', recording_pack)
+    # 无效的浓度类型在工作进程中出错
+    with pytest.raises(KeyError):
+        parallel.sweep_many(TEMP, 'bogus', VALUE, workers=2, chunk_size=500)
+
+    assert len(created) == 2
+    for name in created:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
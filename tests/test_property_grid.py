@@ -0,0 +1,131 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-17 09:12:40 +0800
+LastEditTime : 2026-10-17 09:12:40 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/tests/test_property_grid.py
+Description  : get_props 与原实现 (逐次生成节点、二分查找) 的一致性回归测试, 含自定义网格参数
+ -----------------------------------------------------------------------
+'''
+import bisect
+import pickle
+
+import pytest
+
+from egasp.data.egasp_data import EGP, STORE
+from egasp.egasp_core import EG_ASP_Core
+from egasp.errors import DataGapError, InvalidParameterError, OutOfRangeError, TempOutOfRangeError
+from egasp.interp import compile_interpolator
+from egasp.property_grid import PROP_KEYS, PROPERTY_GRID, compile_grid
+
+
+def baseline_get_props(temp, conc, egp_key, temp_range=(-35, 125), conc_range=(10.0, 90.0), temp_step=5, conc_step=10.0):
+    """原 get_props 的实现: 节点按位置对应数据表的行列, 超出节点范围或角点缺失时返回 None"""
+    temp_nodes = list(range(temp_range[0], temp_range[1] + 1, temp_step))
+    conc_nodes = [round(conc_range[0] + i * conc_step, 1) for i in range(int((conc_range[1] - conc_range[0]) / conc_step) + 1)]
+
+    def nearest(nodes, value):
+        lower = max(bisect.bisect_right(nodes, value) - 1, 0)
+        upper = min(bisect.bisect_left(nodes, value), len(nodes) - 1)
+        return (lower, upper) if nodes[lower] <= value <= nodes[upper] else None
+
+    t_idx, c_idx = nearest(temp_nodes, temp), nearest(conc_nodes, conc)
+    if t_idx is None or c_idx is None:
+        return None
+    (ti1, ti2), (ci1, ci2) = t_idx, c_idx
+
+    data = EGP[egp_key]
+    v11, v12, v21, v22 = data[ti1][ci1], data[ti1][ci2], data[ti2][ci1], data[ti2][ci2]
+    if None in (v11, v12, v21, v22):
+        return None
+
+    def lerp(x1, y1, x2, y2, x):
+        return y1 if x1 == x2 else y1 + (y2 - y1) * (x - x1) / (x2 - x1)
+
+    t1, t2, c1, c2 = temp_nodes[ti1], temp_nodes[ti2], conc_nodes[ci1], conc_nodes[ci2]
+    v1, v2 = lerp(c1, v11, c2, v12, conc), lerp(c1, v21, c2, v22, conc)
+    return lerp(t1, v1, t2, v2, temp)
+
+
+@pytest.fixture(scope='module')
+def eg():
+    return EG_ASP_Core(on_error='raise')
+
+
+GRIDS = [
+    {},
+    {'conc_range': (10.0, 50.0)},
+    {'conc_step': 20.0},
+    {'temp_range': (-35, 60)},
+    {'temp_step': 10},
+]
+
+
+@pytest.mark.parametrize('grid', GRIDS)
+@pytest.mark.parametrize('egp_key', ['rho', 'cp', 'k', 'mu'])
+def test_matches_baseline(eg, grid, egp_key):
+    for temp in range(-35, 126, 7):
+        for conc in (10, 15.5, 20, 33.3, 50, 61.2, 80, 90):
+            expected = baseline_get_props(temp, conc, egp_key, **grid)
+            if expected is None:
+                with pytest.raises((OutOfRangeError, DataGapError)):
+                    eg.get_props(temp, conc, egp_key, **grid)
+            else:
+                assert eg.get_props(temp, conc, egp_key, **grid) == pytest.approx(expected, rel=1e-12)
+
+
+def test_custom_grid_values(eg):
+    # 自定义网格的节点按位置对应数据表的行列, 与原实现的返回值一致
+    assert eg.get_props(25, 30, 'rho', conc_range=(10.0, 50.0)) == pytest.approx(1043.32)
+    assert eg.get_props(25, 30, 'rho', conc_step=20.0) == pytest.approx(1027.93)
+
+
+def test_range_beyond_table(eg):
+    # 超出数据表行数的节点被截去, 表内查询结果不变, 表外查询按超出范围报错
+    assert eg.get_props(25, 30, 'rho', temp_range=(-35, 200)) == pytest.approx(1043.32)
+    assert eg.get_props(25, 30, 'rho', conc_range=(10.0, 150.0)) == pytest.approx(1043.32)
+    with pytest.raises(TempOutOfRangeError):
+        eg.get_props(150, 30, 'rho', temp_range=(-35, 200))
+    with pytest.raises(InvalidParameterError):
+        eg.get_props(25, 30, 'rho', temp_range=(125, -35))
+
+
+def test_grid_reads_store_buffer():
+    # 各物性直接按下标访问内存映射的数据表, 不复制为 array('d'), 也不再另存一份按节点分组的元组
+    grid = PROPERTY_GRID
+    for key, plane in zip(PROP_KEYS, grid.values):
+        table = STORE.table(key)
+        assert isinstance(plane, memoryview) and plane.format == 'd' and plane.obj is table.obj
+        assert len(plane) == table.shape[0] * table.shape[1] == grid.n_temp * grid.stride
+    assert not hasattr(grid, 'nodes')
+    assert not hasattr(compile_interpolator(('linear', 'linear', 'linear', 'log')), 'nodes')
+
+    # 序列化时按节点参数重新编译, 不复制数据
+    assert pickle.loads(pickle.dumps(grid)) is grid
+
+
+def test_default_grid_axes_from_store():
+    axes = STORE.meta('rho')['axes']
+    grid = PROPERTY_GRID
+    assert (grid.temp_nodes[0], grid.temp_nodes[-1], grid.temp_step) == (axes['temp']['start'], axes['temp']['stop'], axes['temp']['step'])
+    assert (grid.conc_nodes[0], grid.conc_nodes[-1], grid.conc_step) == (axes['conc']['start'], axes['conc']['stop'], axes['conc']['step'])
+    assert (grid.n_temp, grid.n_conc) == STORE.table('rho').shape
+
+    # 与默认坐标轴相同的显式参数复用同一网格
+    assert compile_grid((-35, 125), (10.0, 90.0), 5, 10.0) is grid
+    assert EG_ASP_Core(on_error='raise').get_props(25, 30, 'rho', temp_range=(-35, 125)) == pytest.approx(1043.32)
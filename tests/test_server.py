@@ -0,0 +1,155 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-17 13:40:27 +0800
+LastEditTime : 2026-10-17 13:40:27 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/tests/test_server.py
+Description  : HTTP 服务的出错请求隔离与请求头校验测试
+ -----------------------------------------------------------------------
+'''
+import asyncio
+import json
+import threading
+
+import egasp.server
+from egasp.egasp_core import EG_ASP_Core
+from egasp.server import PropertyService
+
+GOOD = b'{"temp": 25, "value": 40, "props": "rho", "id": 1}'
+
+
+def exchange(service: PropertyService, raw: bytes) -> tuple:
+    """在随机端口上启动服务, 发送原始请求, 返回 (状态码, 应答 JSON)"""
+    async def run():
+        server = await asyncio.start_server(service.handle, '127.0.0.1', 0)
+        async with server:
+            reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+            writer.write(raw)
+            head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), 5)
+            length = int(head.split(b'Content-Length: ')[1].split(b'\r\n')[0])
+            body = await reader.readexactly(length)
+            writer.close()
+            return int(head.split(b' ')[1]), json.loads(body)
+
+    return asyncio.run(run())
+
+
+def post(path: str, body: bytes) -> bytes:
+    return f"POST {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+
+
+def test_bad_request_isolated_in_batch():
+    service = PropertyService(EG_ASP_Core(on_error='raise'), window=0.05)
+
+    async def run():
+        return await asyncio.gather(
+            service.dispatch('POST', '/egasp', GOOD),
+            service.dispatch('POST', '/egasp', b'{"temp": 25, "type": [1]}'),
+            service.dispatch('POST', '/egasp', b'{"temp": 25, "props": {"rho": 1}}'),
+        )
+
+    good, bad_type, bad_props = asyncio.run(run())
+    assert service.coalescer.batches == 1
+    assert good == (200, {'id': 1, 'rho': service.eg.get_egasp(25, 'volume', 40)[4]})
+    assert bad_type[0] == bad_props[0] == 422
+    assert bad_type[1]['status'] == bad_props[1]['status'] == 'INVALID_INPUT'
+
+
+def test_batch_failure_reevaluated_per_request(monkeypatch):
+    evaluate_lines = egasp.server.evaluate_lines
+
+    def failing_batch(eg, lines):
+        if len(lines) > 1:
+            raise RuntimeError("batch failed")
+        return evaluate_lines(eg, lines)
+
+    monkeypatch.setattr(egasp.server, 'evaluate_lines', failing_batch)
+    service = PropertyService(EG_ASP_Core(on_error='raise'), window=0.05)
+
+    async def run():
+        return await asyncio.gather(*(service.dispatch('POST', '/egasp', GOOD) for _ in range(3)))
+
+    assert [code for code, _reply in asyncio.run(run())] == [200, 200, 200]
+
+
+def test_batch_bad_props():
+    service = PropertyService(EG_ASP_Core(on_error='raise'))
+    for props in ('[1]', '{"rho": 1}', '["rho", null]', '["bogus"]'):
+        code, reply = exchange(service, post('/batch', f'{{"temp": [20, 25], "props": {props}}}'.encode()))
+        assert code == 400 and 'error' in reply
+
+    code, reply = exchange(service, post('/batch', b'{"temp": [20, 25], "type": "m", "props": ["rho"]}'))
+    assert code == 200 and reply['status'] == ['OK', 'OK']
+
+
+def test_content_length_non_ascii_digit():
+    service = PropertyService(EG_ASP_Core(on_error='raise'))
+    for value in ('²', '-1', 'abc'):
+        raw = f"POST /egasp HTTP/1.1\r\nContent-Length: {value}\r\n\r\n".encode('latin-1')
+        code, reply = exchange(service, raw)
+        assert code == 400 and 'Content-Length' in reply['error']
+
+
+def test_huge_integer_is_bad_request():
+    service = PropertyService(EG_ASP_Core(on_error='raise'))
+    huge = '1' + '0' * 400
+    for path, body in (('/batch', f'{{"temp": [20, {huge}]}}'), ('/batch', f'{{"temp": 25, "value": {huge}}}'),
+                       ('/solve', f'{{"kind": "conc", "temp": 25, "prop": "rho", "target": {huge}}}')):
+        code, reply = exchange(service, post(path, body.encode()))
+        assert code == 400 and 'error' in reply
+
+    async def run():
+        return await asyncio.gather(
+            service.dispatch('POST', '/egasp', GOOD),
+            service.dispatch('POST', '/egasp', f'{{"temp": {huge}}}'.encode()),
+        )
+
+    good, bad = asyncio.run(run())
+    assert good[0] == 200
+    assert bad[0] == 422 and bad[1]['status'] == 'INVALID_INPUT'
+
+
+def test_batch_and_solve_run_off_event_loop():
+    service = PropertyService(EG_ASP_Core(on_error='raise'))
+    release = threading.Event()
+    batch, solve = service.batch, service.solve
+
+    def blocking(call):
+        def run(request):
+            # 事件循环被阻塞时 /health 无法应答, release 不会被设置
+            assert release.wait(5)
+            return call(request)
+        return run
+
+    service.batch, service.solve = blocking(batch), blocking(solve)
+
+    async def run():
+        pending = [
+            asyncio.ensure_future(service.dispatch('POST', '/batch', b'{"temp": [25], "value": 40, "props": ["rho"]}')),
+            asyncio.ensure_future(service.dispatch('POST', '/solve', b'{"kind": "conc", "temp": 25, "prop": "rho", "target": 1057.6}')),
+        ]
+        health = await asyncio.wait_for(service.dispatch('GET', '/health', b''), 2)
+        single = await asyncio.wait_for(service.dispatch('POST', '/egasp', GOOD), 2)
+        release.set()
+        return health, single, await asyncio.gather(*pending)
+
+    health, single, (batch_reply, solve_reply) = asyncio.run(run())
+    service.close()
+    assert health[0] == single[0] == 200
+    assert batch_reply == (200, {'rho': [single[1]['rho']], 'status': ['OK']})
+    assert solve_reply[0] == 200 and solve_reply[1]['status'] == ['OK'] and abs(solve_reply[1]['result'][0] - 40) < 1e-6
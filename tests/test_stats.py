@@ -0,0 +1,88 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-17 11:20:31 +0800
+LastEditTime : 2026-10-17 11:20:31 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/tests/test_stats.py
+Description  : 运行统计的开启、关闭与计数测试
+ -----------------------------------------------------------------------
+'''
+import pickle
+
+import pytest
+
+import egasp
+from egasp.egasp_core import EG_ASP_Core
+from egasp.errors import TempOutOfRangeError
+from egasp.validate import Validate
+
+
+class CustomValidate(Validate):
+    def __init__(self, tag):
+        self.tag = tag
+
+
+def test_enable_disable_keeps_class_and_validator():
+    eg = EG_ASP_Core(on_error='raise')
+    validate = eg.validate = CustomValidate('x')
+
+    eg.enable_stats()
+    eg.enable_stats()  # 重复开启清空已有统计
+    assert type(eg) is EG_ASP_Core and eg.validate is validate
+    eg.get_egasp(25, 'volume', 40)
+    assert eg.stats_info()['stages']['validate']['calls'] == 3
+    assert pickle.loads(pickle.dumps(eg)).stats_info()['stages']['get_egasp']['calls'] == 1
+
+    eg.disable_stats()
+    eg.disable_stats()
+    assert eg.validate is validate and validate.stats is None
+    assert eg.stats is None and eg.stats_info() == {}
+
+
+def test_module_level_functions():
+    egasp.eg.enable_stats()
+    try:
+        egasp.get_egasp(25, 'volume', 40)
+        egasp.get_egasp_many([20, 25], 'volume', 40)
+        egasp.get_egasp_props(25, 'mass', 40, 'rho')
+        stages = egasp.eg.stats_info()['stages']
+    finally:
+        egasp.eg.disable_stats()
+
+    assert set(stages) == {'validate', 'fb_lookup', 'props', 'get_egasp', 'get_egasp_many'}
+    assert stages['get_egasp']['calls'] == 2
+    assert stages['get_egasp_many']['points'] == 2
+
+
+def test_counts():
+    eg = EG_ASP_Core(on_error='raise')
+    eg.enable_stats()
+    eg.get_egasp(25, 'volume', 40)
+    with pytest.raises(TempOutOfRangeError):
+        eg.get_egasp(200, 'volume', 40)
+    eg.get_egasp_many([-30, 25, 200], 'volume', [20, 40, 40], with_status=True)
+
+    info = eg.stats_info()
+    assert info['stages']['get_egasp']['calls'] == 2
+    assert info['stages']['fb_lookup']['calls'] == 2
+    assert info['stages']['props']['calls'] == 2
+    assert info['stages']['get_egasp_many']['points'] == 3
+    assert info['errors'] == {'TEMP_OUT_OF_RANGE': 2, 'DATA_GAP': 1}
+
+    eg.stats_clear()
+    assert eg.stats_info()['stages'] == {}
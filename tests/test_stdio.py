@@ -0,0 +1,79 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-17 13:05:12 +0800
+LastEditTime : 2026-10-17 13:05:12 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/tests/test_stdio.py
+Description  : JSON Lines 流模式的出错行处理测试
+ -----------------------------------------------------------------------
+'''
+import io
+import json
+
+import pytest
+
+from egasp.egasp_core import EG_ASP_Core
+from egasp.stdio import serve
+
+MALFORMED = {
+    'type_list': '{"temp": 25, "type": [1], "id": "bad"}',
+    'type_dict': '{"temp": 25, "type": {"v": 1}}',
+    'props_int': '{"temp": 25, "props": [1]}',
+    'temp_str': '{"temp": "25"}',
+    'not_object': '[1, 2]',
+    'truncated': '{"temp": 25',
+    'too_deep': '[' * 100000,
+    'huge_int': '{"temp": 1' + '0' * 400 + '}',
+}
+
+
+@pytest.mark.parametrize('bad', MALFORMED.values(), ids=MALFORMED.keys())
+def test_malformed_line_between_valid(bad):
+    eg = EG_ASP_Core(on_error='raise')
+    lines = ['{"temp": 25, "value": 40, "props": "rho", "id": 1}', bad, '{"temp": 30, "type": "m", "value": 40, "id": 3}']
+    out = io.StringIO()
+
+    assert serve(eg, io.StringIO('\n'.join(lines) + '\n'), out) == 3
+
+    first, middle, last = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert first == {'id': 1, 'rho': eg.get_egasp(25, 'volume', 40)[4]}
+    assert middle['status'] == 'INVALID_INPUT' and 'error' in middle
+    assert last['id'] == 3 and tuple(last.values())[1:] == eg.get_egasp(30, 'mass', 40)
+
+
+def test_undecodable_bytes_answered_as_bad_line():
+    eg = EG_ASP_Core(on_error='raise')
+    data = b'{"temp": 25, "props": "rho", "id": 1}\n\xff\xfe{"temp": 25}\n{"temp": 30, "props": "rho", "id": 3}\n'
+    out = io.StringIO()
+
+    assert serve(eg, io.TextIOWrapper(io.BytesIO(data), encoding='utf-8'), out) == 3
+
+    first, middle, last = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert first == {'id': 1, 'rho': eg.get_egasp(25, 'volume', 50)[4]}
+    assert middle['status'] == 'INVALID_INPUT'
+    assert last == {'id': 3, 'rho': eg.get_egasp(30, 'volume', 50)[4]}
+
+
+def test_reader_error_ends_stream():
+    def broken():
+        yield '{"temp": 25, "props": "rho", "id": 1}\n'
+        raise UnicodeDecodeError('utf-8', b'\xff', 0, 1, 'invalid start byte')
+
+    out = io.StringIO()
+    assert serve(EG_ASP_Core(on_error='raise'), broken(), out) == 1
+    assert json.loads(out.getvalue())['id'] == 1
@@ -0,0 +1,71 @@
+'''
+ =======================================================================
+ ····Y88b···d88P················888b·····d888·d8b·······················
+ ·····Y88b·d88P·················8888b···d8888·Y8P·······················
+ ······Y88o88P··················88888b·d88888···························
+ ·······Y888P··8888b···88888b···888Y88888P888·888·88888b·····d88b·······
+ ········888······"88b·888·"88b·888·Y888P·888·888·888·"88b·d88P"88b·····
+ ········888···d888888·888··888·888··Y8P··888·888·888··888·888··888·····
+ ········888··888··888·888··888·888···"···888·888·888··888·Y88b·888·····
+ ········888··"Y888888·888··888·888·······888·888·888··888··"Y88888·····
+ ·······························································888·····
+ ··························································Y8b·d88P·····
+ ···························································"Y88P"······
+ =======================================================================
+
+ -----------------------------------------------------------------------
+Author       : 焱铭
+Date         : 2026-10-17 09:52:37 +0800
+LastEditTime : 2026-10-17 09:52:37 +0800
+Github       : https://github.com/YanMing-lxb/
+FilePath     : /egasp/tools/build_store.py
+Description  : 由 tools/egasp_data_source.py 生成二进制物性数据文件 egasp_data.bin
+ -----------------------------------------------------------------------
+'''
+import sys
+import argparse
+import tempfile
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parent
+ROOT_DIR = TOOLS_DIR.parent
+sys.path.insert(0, str(TOOLS_DIR))
+sys.path.insert(0, str(ROOT_DIR / 'src'))
+
+from egasp_data_source import EGP, META, SOURCE  # noqa: E402
+from egasp.data.binary_store import DATA_FILE, write_store  # noqa: E402
+
+
+def build(path) -> None:
+    """按文本源写出数据文件"""
+    write_store(path, EGP, META, SOURCE)
+
+
+def check(path) -> bool:
+    """文本源生成的数据文件与 path 是否逐字节一致"""
+    with tempfile.TemporaryDirectory() as tmp:
+        built = Path(tmp) / 'egasp_data.bin'
+        build(built)
+        return built.read_bytes() == Path(path).read_bytes()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="由 tools/egasp_data_source.py 生成 egasp_data.bin")
+    parser.add_argument('-o', '--output', type=str, default=DATA_FILE, help="输出文件, 默认为包内的 egasp_data.bin")
+    parser.add_argument('--check', action='store_true', help="只检查现有数据文件是否与文本源一致, 不一致时以非零状态码退出")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        if check(args.output):
+            print(f"{args.output} 与文本源一致")
+            return 0
+        print(f"{args.output} 与文本源不一致, 请运行 python tools/build_store.py 重新生成")
+        return 1
+
+    build(args.output)
+    print(f"已生成 {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -31,6 +31,7 @@ PROJECT_NAME = "egasp"
 ENTRY_POINT = Path("src/egasp/__main__.py")
 DATA_DIR = Path("src/egasp/data")
 ICON_FILE = Path("src/egasp/data/egasp.ico")
+DATA_FILE = Path("src/egasp/data/egasp_data.bin")  # 物性数据, 运行时按包内路径加载
 REQUIREMENTS = "requirements.txt"
 VENV_NAME = "venv_egasp"
 
@@ -186,6 +187,7 @@ def run_pyinstaller(venv_name: str = VENV_NAME) -> bool:
         "--workpath=build",
         "--specpath=build",
         "--add-data", f"{DATA_DIR.resolve()}{os.sep}*:.{os.sep}data",
+        "--add-data", f"{DATA_FILE.resolve()}:egasp{os.sep}data",
         str(ENTRY_POINT.resolve())
     ]
 